@@ -0,0 +1,26 @@
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+from rest_framework.renderers import BaseRenderer
+
+
+def format_sse(event, data):
+    """Server-Sent Events 이벤트 하나를 문자열로 만듭니다."""
+    payload = json.dumps(data, ensure_ascii=False, cls=DjangoJSONEncoder)
+    return f"event: {event}\ndata: {payload}\n\n"
+
+
+class EventStreamRenderer(BaseRenderer):
+    """
+    Accept: text/event-stream (EventSource) 요청을 처리하는 렌더러입니다.
+    스트리밍 응답은 렌더러를 거치지 않으므로, 여기서는 검증 오류 같은 일반 Response 를 error 이벤트로 보냅니다.
+    """
+
+    media_type = 'text/event-stream'
+    format = 'event-stream'
+    charset = 'utf-8'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return format_sse('error', data).encode(self.charset)
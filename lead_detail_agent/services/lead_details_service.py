@@ -1,17 +1,33 @@
 import json
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-import requests
 from django.conf import settings
-from openai import OpenAI
+
+from scout_agent.services.client_registry import get_openai_client, get_tavily_session
+from scout_agent.services.llm_cache import cached_chat_completion
+from scout_agent.services.metrics import record_cache
+from scout_agent.services.rate_limiter import RateLimitRetriesExhausted, call_with_rate_limit, get_rate_limiter
+from scout_agent.services.tracing import span, submit_in_context
+from scout_agent.services.usage_service import BudgetExceeded, check_budget, record_tavily_call, usage_scope
+from .search_cache import get_search_cache
 
 logger = logging.getLogger('scout_agent')
 
 
 class LeadDetailsService:
-    def __init__(self):
-        self.client = OpenAI(api_key=settings.OPENAI_API_KEY)
+    def __init__(self, max_workers=None, use_cache=True, company_id=None):
+        """
+        use_cache=False 이면 같은 프롬프트의 저장된 LLM 응답을 재사용하지 않습니다.
+        company_id 는 외부 API 사용량(APIUsage)을 어느 소스 회사의 요청으로 기록할지 지정합니다.
+        """
+        self.client = get_openai_client()
+        self.use_cache = use_cache
+        self.tavily_session = get_tavily_session()
         self.tavily_api_key = settings.TAVILY_API_KEY
+        self.max_workers = max_workers or settings.LEAD_DETAILS_MAX_WORKERS
+        self.company_id = company_id
 
     def generate_queries(self, company_name):
         return {
@@ -30,44 +46,72 @@ class LeadDetailsService:
             "logo_url": f"{company_name} 로고 이미지 url"
         }
 
-    def search_tavily(self, query, num_results=3):
-        url = "https://api.tavily.com/search"
+    def _tavily_search(self, query, query_type=None, search_depth="basic"):
+        """
+        Tavily 검색 API를 호출하고 원본 결과 목록을 반환합니다.
+
+        결과는 검색 캐시(search_cache)를 거치며, 캐시가 켜져 있으면 같은 검색어는
+        query_type별 TTL 동안 API를 다시 호출하지 않습니다. 실패 시 예외를 그대로 전달합니다.
+        캐시에 없고 비용 한도에 도달했으면 BudgetExceeded 를 발생시킵니다.
+        """
+        cache = get_search_cache()
+        if cache is not None:
+            cached = cache.get(query, search_depth)
+            record_cache('tavily', hit=cached is not None)
+            if cached is not None:
+                return cached
+
+        check_budget()
+        url = settings.TAVILY_API_URL
         headers = {
             "Authorization": f"Bearer {self.tavily_api_key}",
             "Content-Type": "application/json"
         }
         payload = {
             "query": query,
-            "search_depth": "basic"
+            "search_depth": search_depth
         }
-        try:
-            response = requests.post(url, headers=headers, json=payload)
+        def post():
+            response = self.tavily_session.post(
+                url, headers=headers, json=payload, timeout=settings.TAVILY_TIMEOUT
+            )
             response.raise_for_status()
-            results = response.json().get("results", [])[:num_results]
+            return response
+
+        # Tavily 분당 요청 한도 안에서 호출하고, 429/5xx 는 백오프 후 재시도
+        started = time.perf_counter()
+        try:
+            with span('lead_details.tavily_search', query_type=query_type):
+                response = call_with_rate_limit(get_rate_limiter('tavily'), post)
+        except Exception:
+            record_tavily_call(search_depth, time.perf_counter() - started, success=False)
+            raise
+        record_tavily_call(search_depth, time.perf_counter() - started)
+        results = response.json().get("results", [])
+
+        if cache is not None and results:
+            cache.set(query, results, search_depth, query_type)
+        return results
+
+    def search_tavily(self, query, num_results=3, query_type=None):
+        try:
+            results = self._tavily_search(query, query_type)[:num_results]
             return [
                 {"url": r.get("url"), "title": r.get("title"), "content": r.get("content", "")}
                 for r in results if "content" in r and "url" in r
             ]
+        except (RateLimitRetriesExhausted, BudgetExceeded):
+            # 호출/비용 한도 초과는 항목을 조용히 빼지 않고 요청 전체를 실패시킴
+            raise
         except Exception as e:
             print(f"⚠️ Tavily 검색 실패: {e}")
             return []
 
     def get_latest_news_urls(self, company_name: str, count=3):
         query = f"{company_name} 최신 뉴스"
-        url = "https://api.tavily.com/search"
-        headers = {
-            "Authorization": f"Bearer {self.tavily_api_key}",
-            "Content-Type": "application/json"
-        }
-        payload = {
-            "query": query,
-            "search_depth": "basic"
-        }
 
         try:
-            response = requests.post(url, headers=headers, json=payload)
-            response.raise_for_status()
-            results = response.json().get("results", [])[:count]
+            results = self._tavily_search(query, "news")[:count]
             return [
                 {
                     "title": r.get("title", "제목 없음"),
@@ -75,32 +119,14 @@ class LeadDetailsService:
                 }
                 for r in results
             ]
+        except (RateLimitRetriesExhausted, BudgetExceeded):
+            raise
         except Exception as e:
             print(f"❌ 최신 뉴스 검색 실패: {e}")
             return []
 
-    def extract_info(self, company_name):
-        queries = self.generate_queries(company_name)
-        extracted_info = {}
-
-        for field, query in queries.items():
-            print(f"🔍 {field} → 검색 쿼리: {query}")
-            sources = self.search_tavily(query)
-            if not sources:
-                print(f"⚠️ {field} 관련된 content 없음 (패스)")
-                continue
-
-            contents = [s["content"] for s in sources]
-            urls = [
-                {
-                    "title": s.get("title", "제목 없음"),
-                    "url": s.get("url", "")
-                } for s in sources
-            ]
-
-            combined_content = "\n\n".join(contents)
-
-            prompt = f"""
+    def _build_field_prompt(self, company_name, field, combined_content):
+        return f"""
             당신은 회사 분석 전문가이며, '{company_name}'에 대한 내부 지식을 보유하고 있습니다.
             그러나 더 정확하고 최신 정보를 제공하기 위해 아래의 웹 검색 결과도 함께 참고해야 합니다.
 
@@ -123,8 +149,103 @@ class LeadDetailsService:
             }}
             """
 
-            try:
-                completion = self.client.chat.completions.create(
+    def _build_batch_prompt(self, company_name, fields, evidence):
+        response_format = ",\n            ".join(f'"{field}": ...' for field in fields)
+        return f"""
+            당신은 회사 분석 전문가이며, '{company_name}'에 대한 내부 지식을 보유하고 있습니다.
+            그러나 더 정확하고 최신 정보를 제공하기 위해 아래의 웹 검색 결과도 함께 참고해야 합니다.
+
+            작업 목표:
+            - 아래 요청 항목 각각에 대한 정확한 정보를 하나의 JSON 객체로 추출합니다.
+            - 내부 지식과 제공된 외부 웹 검색 내용을 통합하여 판단합니다.
+            - 최신 정보나 수치(예: 매출, 대표자 등)는 아래 텍스트를 우선적으로 신뢰합니다.
+            - 정보가 명확하지 않은 항목은 null로 처리합니다.
+            - 가능한 한 정확한 정보를 많이 제공하십시오.
+
+            회사명: "{company_name}"
+
+            ### 요청 항목 목록:
+            {json.dumps(fields, ensure_ascii=False)}
+
+            ### 참고용 외부 텍스트:
+            {evidence}
+
+            ### 응답 형식 (JSON만 반환, 각 값은 문자열 또는 null):
+            {{
+            {response_format}
+            }}
+            """
+
+    def _format_sources(self, sources):
+        return [
+            {
+                "title": s.get("title", "제목 없음"),
+                "url": s.get("url", "")
+            } for s in sources
+        ]
+
+    def _extract_from_sources(self, company_name, field, sources):
+        """
+        이미 검색된 출처를 근거로 단일 항목을 LLM으로 추출합니다.
+
+        Returns:
+            dict: {field: 값, f"{field}_sources": 출처 목록}, 실패 시 빈 딕셔너리
+        """
+        combined_content = "\n\n".join(s["content"] for s in sources)
+        prompt = self._build_field_prompt(company_name, field, combined_content)
+
+        try:
+            with span('lead_details.llm_extract', field=field):
+                completion = cached_chat_completion(
+                    self.client,
+                    use_cache=self.use_cache,
+                    model="gpt-4.1-mini",
+                    messages=[
+                        {"role": "system", "content": "You are a structured data extractor."},
+                        {"role": "user", "content": prompt}
+                    ],
+                    temperature=0.3,
+                    response_format={"type": "json_object"}
+                )
+            field_result = json.loads(completion.choices[0].message.content)
+            print(field_result)
+            return {
+                field: field_result[field],
+                f"{field}_sources": self._format_sources(sources),
+            }
+        except (RateLimitRetriesExhausted, BudgetExceeded):
+            raise
+        except Exception as e:
+            print(f"❌ LLM 추출 실패 [{field}]: {e}")
+            return {}
+
+    def _extract_batch(self, company_name, field_sources):
+        """
+        모든 항목을 한 번의 LLM 호출로 추출합니다.
+
+        여러 항목의 검색 결과에 같은 문서가 반복되는 경우가 많으므로 URL 기준으로
+        중복을 제거한 근거 텍스트만 한 번 전달합니다.
+
+        Returns:
+            dict: {field: 값}, 실패 시 빈 딕셔너리
+        """
+        evidence_blocks = []
+        seen_urls = set()
+        for sources in field_sources.values():
+            for source in sources:
+                if source["url"] in seen_urls:
+                    continue
+                seen_urls.add(source["url"])
+                evidence_blocks.append(f"[{len(evidence_blocks) + 1}] {source['content']}")
+
+        fields = list(field_sources.keys())
+        prompt = self._build_batch_prompt(company_name, fields, "\n\n".join(evidence_blocks))
+
+        try:
+            with span('lead_details.llm_extract', field='batch'):
+                completion = cached_chat_completion(
+                    self.client,
+                    use_cache=self.use_cache,
                     model="gpt-4.1-mini",
                     messages=[
                         {"role": "system", "content": "You are a structured data extractor."},
@@ -133,19 +254,167 @@ class LeadDetailsService:
                     temperature=0.3,
                     response_format={"type": "json_object"}
                 )
-                field_result = json.loads(completion.choices[0].message.content)
-                print(field_result)
-                extracted_info[field] = field_result[field]
-                extracted_info[f"{field}_sources"] = urls
-            except Exception as e:
-                print(f"❌ LLM 추출 실패 [{field}]: {e}")
+            batch_result = json.loads(completion.choices[0].message.content)
+            print(batch_result)
+            return {field: batch_result.get(field) for field in fields}
+        except (RateLimitRetriesExhausted, BudgetExceeded):
+            raise
+        except Exception as e:
+            print(f"❌ LLM 일괄 추출 실패: {e}")
+            return {}
+
+    def extract_field(self, company_name, field, query):
+        """
+        단일 항목에 대해 Tavily 검색과 LLM 추출을 수행합니다.
+
+        Returns:
+            dict: {field: 값, f"{field}_sources": 출처 목록}, 실패 시 빈 딕셔너리
+        """
+        print(f"🔍 {field} → 검색 쿼리: {query}")
+        sources = self.search_tavily(query, query_type=field)
+        if not sources:
+            print(f"⚠️ {field} 관련된 content 없음 (패스)")
+            return {}
+
+        return self._extract_from_sources(company_name, field, sources)
+
+    def _search_field(self, field, query):
+        return self.search_tavily(query, query_type=field)
+
+    def _iter_completed(self, executor, tasks):
+        """
+        tasks([(key, func, args)])를 실행하고 끝난 순서대로 (key, 결과)를 반환합니다.
+        executor가 None이면 입력 순서대로 순차 실행합니다.
+        """
+        if executor is None:
+            for key, func, args in tasks:
+                yield key, func(*args)
+            return
+
+        futures = {submit_in_context(executor, func, *args): key for key, func, args in tasks}
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+
+    def _field_event(self, field, value, sources):
+        return "field", {"field": field, "value": value, "sources": sources}
+
+    def _iter_per_field(self, executor, company_name, queries):
+        tasks = [
+            (field, self.extract_field, (company_name, field, query))
+            for field, query in queries.items()
+        ]
+        tasks.append(("news", self.get_latest_news_urls, (company_name,)))
+
+        for key, result in self._iter_completed(executor, tasks):
+            if key == "news":
+                yield "news", result
+            elif result:
+                yield self._field_event(key, result[key], result[f"{key}_sources"])
+
+    def _iter_batched(self, executor, company_name, queries):
+        tasks = []
+        for field, query in queries.items():
+            print(f"🔍 {field} → 검색 쿼리: {query}")
+            tasks.append((field, self._search_field, (field, query)))
+        tasks.append(("news", self.get_latest_news_urls, (company_name,)))
+
+        field_sources = {}
+        for key, result in self._iter_completed(executor, tasks):
+            if key == "news":
+                yield "news", result
+            elif not result:
+                print(f"⚠️ {key} 관련된 content 없음 (패스)")
+            else:
+                field_sources[key] = result
+
+        if not field_sources:
+            return
+
+        batch_result = self._extract_batch(company_name, field_sources)
+
+        missing_fields = []
+        for field, sources in field_sources.items():
+            if batch_result.get(field) is None:
+                missing_fields.append(field)
                 continue
+            yield self._field_event(field, batch_result[field], self._format_sources(sources))
+
+        # 일괄 추출에서 값이 비어 있는 항목만 항목별 호출로 재시도 (검색 결과는 재사용)
+        if missing_fields:
+            print(f"↩️ 항목별 재추출: {missing_fields}")
+            tasks = [
+                (field, self._extract_from_sources, (company_name, field, field_sources[field]))
+                for field in missing_fields
+            ]
+            for field, result in self._iter_completed(executor, tasks):
+                if result:
+                    yield self._field_event(field, result[field], result[f"{field}_sources"])
+
+    def iter_extract_info(self, company_name, extraction_mode=None):
+        """
+        extract_info 와 같은 정보를 수집하면서, 완료되는 즉시 이벤트로 반환합니다.
+
+        Yields:
+            ("field", {"field": 항목명, "value": 값, "sources": 출처 목록}): 항목 추출 완료 시
+            ("news", 뉴스 목록): 최신 뉴스 검색 완료 시
+            ("complete", extract_info 와 같은 형식의 전체 결과): 마지막 이벤트
+
+        호출 한도 재시도가 모두 실패하면 RateLimitRetriesExhausted, 비용 한도에 도달하면 BudgetExceeded 를
+        발생시킵니다 (빈 항목이 섞인 결과를 반환하지 않음). usage 에는 이 요청의 외부 API 호출 수와 예상 비용이 담깁니다.
+        """
+        with usage_scope('lead_details', self.company_id) as usage:
+            yield from self._iter_extract_info(company_name, extraction_mode, usage)
+
+    def _iter_extract_info(self, company_name, extraction_mode, usage):
+        extraction_mode = extraction_mode or settings.LEAD_DETAILS_EXTRACTION_MODE
+        queries = self.generate_queries(company_name)
+        iter_events = self._iter_batched if extraction_mode == "batch" else self._iter_per_field
+
+        fields = {}
+        news = []
+        executor = ThreadPoolExecutor(max_workers=self.max_workers) if self.max_workers > 1 else None
+        try:
+            for event, data in iter_events(executor, company_name, queries):
+                if event == "news":
+                    news = data
+                else:
+                    fields[data["field"]] = data
+                yield event, data
+        finally:
+            # 클라이언트 연결이 끊겨 중단된 경우 대기 중인 작업은 취소
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+        # 결과 순서를 쿼리 순서와 동일하게 유지
+        extracted_info = {}
+        for field in queries:
+            if field in fields:
+                extracted_info[field] = fields[field]["value"]
+                extracted_info[f"{field}_sources"] = fields[field]["sources"]
 
         # 최신 뉴스 URL 리스트 추가
         # "url" 변수명 변경 가능
-        extracted_info["news"] = self.get_latest_news_urls(company_name)
+        extracted_info["news"] = news
         extracted_info["company_name"] = company_name
+        extracted_info["usage"] = usage.summary()
 
         print(json.dumps(extracted_info, indent=2, ensure_ascii=False))
 
-        return extracted_info
+        yield "complete", extracted_info
+
+    def extract_info(self, company_name, extraction_mode=None):
+        """
+        회사의 각 항목 정보와 최신 뉴스를 수집합니다.
+
+        항목별 검색/추출과 뉴스 검색은 서로 독립적이므로 스레드 풀에서 동시에 실행합니다.
+        동시 실행 수는 max_workers(기본값: settings.LEAD_DETAILS_MAX_WORKERS)로 제한하며,
+        1이면 기존과 같이 순차 실행합니다.
+
+        extraction_mode(기본값: settings.LEAD_DETAILS_EXTRACTION_MODE):
+            - "batch": 모든 항목의 검색 결과를 모아 한 번의 LLM 호출로 추출하고,
+              값이 null로 돌아온 항목만 항목별로 다시 추출합니다.
+            - "per_field": 항목마다 개별 LLM 호출로 추출합니다.
+        """
+        for event, data in self.iter_extract_info(company_name, extraction_mode):
+            if event == "complete":
+                return data
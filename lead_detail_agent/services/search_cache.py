@@ -0,0 +1,118 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import unicodedata
+
+from django.conf import settings
+
+from leadscout_sdk.utils.sqlite_cache import SQLiteLRUCache
+
+
+class SearchResultCache(SQLiteLRUCache):
+    """
+    Tavily 검색 결과를 SQLite 파일에 저장하는 TTL 캐시입니다.
+
+    - 키: 정규화한 검색어 + search_depth 의 SHA-256
+    - 만료: 검색 종류(query_type)별 TTL, 지정되지 않은 종류는 default_ttl
+    - 제거: max_entries를 넘으면 마지막 조회 시각이 가장 오래된 항목부터 삭제(LRU)
+    - 통계: 적중/미적중 횟수를 파일에 누적하므로 여러 워커 프로세스가 같은 통계를 공유합니다.
+    """
+
+    table = "search_cache"
+    columns = (
+        "query TEXT NOT NULL",
+        "search_depth TEXT NOT NULL",
+        "query_type TEXT",
+        "results TEXT NOT NULL",
+        "expires_at REAL NOT NULL",
+    )
+
+    def __init__(self, path, max_entries=5000, ttls=None, default_ttl=86400):
+        super().__init__(path, max_entries)
+        self.ttls = ttls or {}
+        self.default_ttl = default_ttl
+
+    @staticmethod
+    def normalize_query(query):
+        """전각/반각, 대소문자, 공백 차이를 무시하도록 검색어를 정규화합니다."""
+        query = unicodedata.normalize("NFKC", query or "")
+        return " ".join(query.lower().split())
+
+    def make_key(self, query, search_depth):
+        raw = f"{search_depth}\n{self.normalize_query(query)}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def ttl_for(self, query_type):
+        return self.ttls.get(query_type, self.default_ttl)
+
+    def get(self, query, search_depth="basic"):
+        """캐시된 검색 결과를 반환합니다. 없거나 만료되었으면 None을 반환합니다."""
+        key = self.make_key(query, search_depth)
+        now = time.time()
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT results, expires_at FROM search_cache WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None or row[1] <= now:
+                    if row is not None:
+                        conn.execute("DELETE FROM search_cache WHERE key = ?", (key,))
+                    self._count(conn, "misses")
+                    return None
+                self._touch(conn, key, now)
+                self._count(conn, "hits")
+                return json.loads(row[0])
+        except sqlite3.Error as e:
+            print(f"⚠️ 검색 캐시 조회 실패: {e}")
+            return None
+
+    def set(self, query, results, search_depth="basic", query_type=None):
+        """검색 결과를 저장하고 max_entries를 넘는 오래된 항목을 제거합니다."""
+        key = self.make_key(query, search_depth)
+        now = time.time()
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    """
+                    INSERT OR REPLACE INTO search_cache
+                        (key, query, search_depth, query_type, results, expires_at, last_accessed_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    (
+                        key,
+                        self.normalize_query(query),
+                        search_depth,
+                        query_type,
+                        json.dumps(results, ensure_ascii=False),
+                        now + self.ttl_for(query_type),
+                        now,
+                    )
+                )
+                self._evict(conn)
+        except sqlite3.Error as e:
+            print(f"⚠️ 검색 캐시 저장 실패: {e}")
+
+
+_search_cache = None
+_search_cache_lock = threading.Lock()
+
+
+def get_search_cache():
+    """
+    프로세스 공용 검색 캐시를 반환합니다. TAVILY_CACHE_ENABLED가 꺼져 있으면 None을 반환합니다.
+    """
+    global _search_cache
+    if not settings.TAVILY_CACHE_ENABLED:
+        return None
+    if _search_cache is None:
+        with _search_cache_lock:
+            if _search_cache is None:
+                _search_cache = SearchResultCache(
+                    path=settings.TAVILY_CACHE_PATH,
+                    max_entries=settings.TAVILY_CACHE_MAX_ENTRIES,
+                    ttls=settings.TAVILY_CACHE_TTLS,
+                    default_ttl=settings.TAVILY_CACHE_DEFAULT_TTL,
+                )
+    return _search_cache
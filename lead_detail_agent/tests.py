@@ -0,0 +1,122 @@
+import json
+from unittest import mock
+
+from django.test import override_settings
+
+from scout_agent.models import APIUsage
+from scout_agent.services import tracing
+from scout_agent.tests.base import FakeAPITestCase
+
+
+def parse_sse(body):
+    """SSE 응답 본문을 [(event, data)] 로 변환합니다."""
+    events = []
+    for block in body.strip().split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((fields["event"], json.loads(fields["data"])))
+    return events
+
+
+class LeadDataStreamViewTests(FakeAPITestCase):
+    url = '/api/lead/details/stream/'
+
+    def test_eventsource_accept_header_streams_events(self):
+        response = self.client.get(
+            self.url, {"search_company_name": "테스트 리드"}, HTTP_ACCEPT='text/event-stream'
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+        events = parse_sse(b"".join(response.streaming_content).decode())
+
+        names = [event for event, _ in events]
+        self.assertEqual(names[-1], "complete")
+        self.assertIn("news", names)
+        self.assertIn("field", names)
+        complete = events[-1][1]
+        self.assertEqual(complete["company_name"], "테스트 리드")
+        self.assertEqual(complete["homepage_url"], "https://lead.example.com")
+
+    def test_missing_company_name_is_sent_as_error_event(self):
+        response = self.client.get(self.url, HTTP_ACCEPT='text/event-stream')
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response['Content-Type'], 'text/event-stream; charset=utf-8')
+        self.assertEqual(parse_sse(response.content.decode()), [("error", {"error": "company_name is required"})])
+
+    def test_post_json_still_supported(self):
+        response = self.client.post(
+            self.url, {"search_company_name": "테스트 리드", "extraction_mode": "batch"},
+            content_type='application/json'
+        )
+
+        self.assertEqual(response.status_code, 200)
+        events = parse_sse(b"".join(response.streaming_content).decode())
+        self.assertEqual(events[-1][0], "complete")
+
+
+class LeadDataStreamRequestIdTests(FakeAPITestCase):
+
+    def test_usage_recorded_while_streaming_keeps_the_request_id(self):
+        response = self.client.get(
+            '/api/lead/details/stream/', {"search_company_name": "테스트 리드"},
+            HTTP_ACCEPT='text/event-stream', HTTP_X_REQUEST_ID='stream-abc',
+        )
+        b"".join(response.streaming_content)
+
+        self.assertEqual(response['X-Request-ID'], 'stream-abc')
+        self.assertTrue(APIUsage.objects.exists())
+        self.assertEqual(set(APIUsage.objects.values_list('request_id', flat=True)), {'stream-abc'})
+
+    def test_spans_finished_while_streaming_keep_the_request_id(self):
+        span_request_ids = []
+        with mock.patch.object(
+            tracing.STAGE_SECONDS, 'observe',
+            side_effect=lambda *args, **labels: span_request_ids.append(tracing.current_request_id()),
+        ):
+            response = self.client.get(
+                '/api/lead/details/stream/', {"search_company_name": "테스트 리드"},
+                HTTP_ACCEPT='text/event-stream', HTTP_X_REQUEST_ID='stream-abc',
+            )
+            b"".join(response.streaming_content)
+
+        self.assertTrue(span_request_ids)
+        self.assertEqual(set(span_request_ids), {'stream-abc'})
+
+
+@override_settings(LEAD_DETAILS_MAX_WORKERS=1, REQUEST_COST_BUDGET=0.001)
+class LeadDetailsBudgetTests(FakeAPITestCase):
+    """첫 Tavily 검색(0.008 USD)으로 요청 한도를 넘기므로 두 번째 외부 호출부터 거절됩니다."""
+
+    def test_request_budget_returns_429_instead_of_empty_report(self):
+        response = self.client.post(
+            '/api/lead/details/', {"search_company_name": "테스트 리드"}, format='json'
+        )
+
+        self.assertEqual(response.status_code, 429)
+        self.assertTrue(response.json()["budget_exceeded"])
+        self.assertEqual(self.upstream_calls("/search"), 1)
+        self.assertEqual(APIUsage.objects.filter(operation='lead_details').count(), 1)
+
+    def test_stream_sends_budget_error_event(self):
+        response = self.client.get(
+            '/api/lead/details/stream/', {"search_company_name": "테스트 리드"}, HTTP_ACCEPT='text/event-stream'
+        )
+
+        self.assertEqual(response.status_code, 200)
+        event, data = parse_sse(b"".join(response.streaming_content).decode())[-1]
+        self.assertEqual(event, "error")
+        self.assertTrue(data["budget_exceeded"])
+
+    @override_settings(DAILY_COST_BUDGET=0.5)
+    def test_stream_returns_429_when_daily_budget_is_spent(self):
+        APIUsage.objects.create(operation='lead_details', provider=APIUsage.PROVIDER_TAVILY, cost=1)
+
+        response = self.client.get(
+            '/api/lead/details/stream/', {"search_company_name": "테스트 리드"}, HTTP_ACCEPT='text/event-stream'
+        )
+
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(parse_sse(response.content.decode())[0][1]["budget_exceeded"], True)
+        self.assertEqual(self.upstream_calls("/search"), 0)
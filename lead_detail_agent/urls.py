@@ -1,6 +1,7 @@
 from django.urls import path
-from .views import LeadDataView
+from .views import LeadDataStreamView, LeadDataView
 
 urlpatterns = [
     path('details/', LeadDataView.as_view(), name='get_lead_detail_data'),
+    path('details/stream/', LeadDataStreamView.as_view(), name='stream_lead_detail_data'),
 ]
\ No newline at end of file
@@ -1,12 +1,35 @@
-from django.http import HttpResponse
+from django.http import HttpResponse, StreamingHttpResponse
 from django.template.loader import render_to_string
 from rest_framework import status
+from rest_framework.renderers import JSONRenderer
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from scout_agent.models import CompanyData
+from scout_agent.services.rate_limiter import RateLimitRetriesExhausted
+from scout_agent.services.tracing import current_request_id, request_context
+from scout_agent.services.usage_service import BudgetExceeded, check_budget
+from .renderers import EventStreamRenderer, format_sse
 from .services.lead_details_service import LeadDetailsService
 
 
+def _is_true(value):
+    """요청 값(bool, "true", "1" 등)을 bool 로 변환합니다."""
+    return str(value).lower() in ('true', '1', 'yes')
+
+
+def _source_company_id(value):
+    """
+    요청의 company_id(선택)를 외부 API 사용량 기록용 소스 회사 ID 로 변환합니다.
+    값이 없거나 존재하지 않는 회사면 None 을 반환합니다.
+    """
+    try:
+        company_id = int(value)
+    except (TypeError, ValueError):
+        return None
+    return company_id if CompanyData.objects.filter(id=company_id).exists() else None
+
+
 class LeadDataView(APIView):
     def post(self, request):
         """
@@ -22,10 +45,90 @@ class LeadDataView(APIView):
             )
 
         # 여기서 비즈니스 로직을 통해 회사 정보를 가져옵니다
-        result = LeadDetailsService().extract_info(search_company_name)
+        try:
+            result = LeadDetailsService(
+                use_cache=not _is_true(request.data.get('refresh')),
+                company_id=_source_company_id(company_id),
+            ).extract_info(search_company_name)
+        except RateLimitRetriesExhausted as e:
+            return Response(
+                {"error": str(e)},
+                status=status.HTTP_503_SERVICE_UNAVAILABLE
+            )
+        except BudgetExceeded as e:
+            return Response(
+                {"error": str(e), "budget_exceeded": True},
+                status=status.HTTP_429_TOO_MANY_REQUESTS
+            )
 
         # HTML 템플릿 렌더링
         html_content = render_to_string('lead_data_template.html', result)
 
         # HTML 콘텐츠 직접 반환
         return HttpResponse(html_content, content_type='text/html')
+
+
+class LeadDataStreamView(APIView):
+    """
+    LeadDataView 와 같은 정보를 Server-Sent Events 로 스트리밍합니다.
+
+    항목별 추출이 끝날 때마다 `field` 이벤트를, 최신 뉴스 검색이 끝나면 `news` 이벤트를 보내고,
+    마지막 `complete` 이벤트에 lead_data_template.html 렌더링에 쓰는 전체 결과를 담습니다.
+    EventSource 사용을 위해 GET(쿼리 파라미터)과 POST(JSON 본문)를 모두 지원합니다.
+    EventSource 는 Accept: text/event-stream 을 보내므로 EventStreamRenderer 로 협상합니다.
+    오늘 비용 한도에 이미 도달했으면 429 를 반환하고, 스트리밍 중 한도에 도달하면 error 이벤트를 보냅니다.
+    """
+
+    renderer_classes = [JSONRenderer, EventStreamRenderer]
+
+    def get(self, request):
+        return self._stream(request.query_params)
+
+    def post(self, request):
+        return self._stream(request.data)
+
+    def _stream(self, params):
+        search_company_name = params.get('search_company_name')
+        if not search_company_name:
+            return Response(
+                {"error": "company_name is required"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        # 응답 헤더를 보낸 뒤에는 상태 코드를 바꿀 수 없으므로 오늘 한도는 시작 전에 확인
+        try:
+            check_budget()
+        except BudgetExceeded as e:
+            return Response(
+                {"error": str(e), "budget_exceeded": True},
+                status=status.HTTP_429_TOO_MANY_REQUESTS
+            )
+
+        # 항목별 결과를 바로 보내기 위해 기본값은 항목별 추출
+        extraction_mode = params.get('extraction_mode') or 'per_field'
+        service = LeadDetailsService(
+            use_cache=not _is_true(params.get('refresh')),
+            company_id=_source_company_id(params.get('company_id')),
+        )
+        events = service.iter_extract_info(search_company_name, extraction_mode)
+
+        # 본문은 미들웨어의 request_context 가 끝난 뒤 생성되므로 request_id 를 넘겨 다시 적용
+        response = StreamingHttpResponse(
+            self._format_events(events, current_request_id()), content_type='text/event-stream'
+        )
+        response['Cache-Control'] = 'no-cache'
+        # nginx 프록시 버퍼링 비활성화
+        response['X-Accel-Buffering'] = 'no'
+        return response
+
+    def _format_events(self, events, request_id):
+        # 스트리밍 중 기록하는 span, 로그, APIUsage 에도 요청의 request_id 를 붙임
+        with request_context(request_id):
+            try:
+                for event, data in events:
+                    yield format_sse(event, data)
+            except BudgetExceeded as e:
+                yield format_sse("error", {"error": str(e), "budget_exceeded": True})
+            except Exception as e:
+                print(f"❌ 리드 상세 정보 스트리밍 실패: {e}")
+                yield format_sse("error", {"error": str(e)})
@@ -48,6 +48,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    # request_id/Server-Timing 헤더와 요청 처리 시간 지표 (가장 바깥에서 측정)
+    'scout_agent.middleware.RequestTracingMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'corsheaders.middleware.CorsMiddleware',
@@ -134,13 +136,137 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 OPENAI_API_KEY = os.getenv('OPENAI_API_KEY')
 TAVILY_API_KEY = os.getenv('TAVILY_API_KEY')
 
+# 외부 API 주소 (벤치마크 시 로컬 가짜 서버로 바꿔서 사용, 비우면 OpenAI 기본 주소)
+OPENAI_BASE_URL = os.getenv('OPENAI_BASE_URL') or None
+TAVILY_API_URL = os.getenv('TAVILY_API_URL', 'https://api.tavily.com/search')
+
+# 외부 API 클라이언트 연결 풀/타임아웃 (services/client_registry.py 에서 프로세스 단위로 공유)
+OPENAI_TIMEOUT = float(os.getenv('OPENAI_TIMEOUT', 180))
+# 429/5xx 재시도는 services/rate_limiter.py 가 담당하므로 SDK 자체 재시도는 기본적으로 끔
+OPENAI_MAX_RETRIES = int(os.getenv('OPENAI_MAX_RETRIES', 0))
+OPENAI_MAX_CONNECTIONS = int(os.getenv('OPENAI_MAX_CONNECTIONS', 50))
+OPENAI_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv('OPENAI_MAX_KEEPALIVE_CONNECTIONS', 20))
+TAVILY_TIMEOUT = float(os.getenv('TAVILY_TIMEOUT', 20))
+TAVILY_POOL_MAXSIZE = int(os.getenv('TAVILY_POOL_MAXSIZE', 20))
+
+# 외부 API 분당 요청/토큰 한도 (provider -> model -> rpm/tpm, 모델별 값이 없으면 default)
+RATE_LIMITS = {
+    'openai': {
+        'default': {
+            'rpm': int(os.getenv('OPENAI_RPM', 500)),
+            'tpm': int(os.getenv('OPENAI_TPM', 200000)),
+        },
+        'gpt-4o': {
+            'rpm': int(os.getenv('OPENAI_GPT4O_RPM', 500)),
+            'tpm': int(os.getenv('OPENAI_GPT4O_TPM', 30000)),
+        },
+    },
+    'tavily': {
+        'default': {'rpm': int(os.getenv('TAVILY_RPM', 100))},
+    },
+}
+# 429/5xx/연결 오류 재시도: 지터를 준 지수 백오프(초), Retry-After 헤더가 있으면 그 값을 따름
+RATE_LIMIT_MAX_RETRIES = int(os.getenv('RATE_LIMIT_MAX_RETRIES', 4))
+RATE_LIMIT_BACKOFF_BASE = float(os.getenv('RATE_LIMIT_BACKOFF_BASE', 1.0))
+RATE_LIMIT_BACKOFF_MAX = float(os.getenv('RATE_LIMIT_BACKOFF_MAX', 60.0))
+
+# 외부 API 예상 비용 (USD). OpenAI 는 모델별 1M 토큰당 단가, 목록에 없는 모델은 default 단가 사용
+LLM_PRICING = {
+    'gpt-4o': {'input': 2.50, 'cached_input': 1.25, 'output': 10.00},
+    'gpt-4.1-mini': {'input': 0.40, 'cached_input': 0.10, 'output': 1.60},
+    'default': {'input': 2.50, 'cached_input': 1.25, 'output': 10.00},
+}
+# Responses API 웹 검색 도구 호출 1회 비용
+OPENAI_WEB_SEARCH_CALL_COST = float(os.getenv('OPENAI_WEB_SEARCH_CALL_COST', 0.035))
+# Tavily 크레딧 1개 비용 (basic 검색 1크레딧, advanced 2크레딧)
+TAVILY_CREDIT_COST = float(os.getenv('TAVILY_CREDIT_COST', 0.008))
+# 비용 한도 (USD, 0이면 제한 없음). 넘으면 외부 API 를 더 호출하지 않고 캐시/저장된 결과로 응답
+REQUEST_COST_BUDGET = float(os.getenv('REQUEST_COST_BUDGET', 0.5))
+DAILY_COST_BUDGET = float(os.getenv('DAILY_COST_BUDGET', 50))
+# 일 비용 합계를 DB 에서 다시 읽는 주기(초) - 다른 프로세스의 사용량 반영
+COST_LEDGER_REFRESH_SECONDS = int(os.getenv('COST_LEDGER_REFRESH_SECONDS', 60))
+
+# PDF 다운로드: 메모리 한도까지는 메모리에 받고 초과분은 임시 파일로, 최대 크기 초과 시 중단
+PDF_DOWNLOAD_TIMEOUT = float(os.getenv('PDF_DOWNLOAD_TIMEOUT', 60))
+PDF_DOWNLOAD_MEMORY_LIMIT = int(os.getenv('PDF_DOWNLOAD_MEMORY_LIMIT', 20 * 1024 * 1024))
+PDF_DOWNLOAD_MAX_BYTES = int(os.getenv('PDF_DOWNLOAD_MAX_BYTES', 200 * 1024 * 1024))
+PDF_DOWNLOAD_POOL_MAXSIZE = int(os.getenv('PDF_DOWNLOAD_POOL_MAXSIZE', 10))
+
+# PDF 텍스트 추출: LLM 에 전달할 최대 글자 수(채우면 나머지 페이지는 읽지 않음)와
+# 첫 구간으로 글자 수를 채우지 못한 긴 문서(섹션 선택 등)의 나머지 페이지 구간 병렬 처리 설정
+PDF_TEXT_MAX_CHARS = int(os.getenv('PDF_TEXT_MAX_CHARS', 15000))
+PDF_EXTRACTION_WORKERS = int(os.getenv('PDF_EXTRACTION_WORKERS', 2))
+PDF_EXTRACTION_PARALLEL_MIN_PAGES = int(os.getenv('PDF_EXTRACTION_PARALLEL_MIN_PAGES', 60))
+PDF_EXTRACTION_PAGES_PER_TASK = int(os.getenv('PDF_EXTRACTION_PAGES_PER_TASK', 30))
+
+# 긴 PDF 는 앞부분만 자르지 않고, 항목(매출, 경영진, 주소 등) 관련도가 높은 섹션을 토큰 예산 안에서 선택
+# 앞에서부터 PDF_SECTION_SOURCE_MAX_CHARS 까지만 읽어 그 안에서 선택. false 이면 PDF_TEXT_MAX_CHARS 까지만 읽어 그대로 사용
+PDF_SECTION_SELECTION_ENABLED = os.getenv('PDF_SECTION_SELECTION_ENABLED', 'true').lower() == 'true'
+PDF_SECTION_SOURCE_MAX_CHARS = int(os.getenv('PDF_SECTION_SOURCE_MAX_CHARS', 200000))
+PDF_PROMPT_TOKEN_BUDGET = int(os.getenv('PDF_PROMPT_TOKEN_BUDGET', 8000))
+PDF_SECTION_CHARS = int(os.getenv('PDF_SECTION_CHARS', 1200))
+
+# PDF 일괄 분석(analyze-pdf/batch/, manage.py analyze_pdfs)의 단계별 동시 실행 한도
+PDF_BATCH_DOWNLOAD_CONCURRENCY = int(os.getenv('PDF_BATCH_DOWNLOAD_CONCURRENCY', 8))
+PDF_BATCH_EXTRACTION_CONCURRENCY = int(os.getenv('PDF_BATCH_EXTRACTION_CONCURRENCY', 2))
+PDF_BATCH_LLM_CONCURRENCY = int(os.getenv('PDF_BATCH_LLM_CONCURRENCY', 4))
+PDF_BATCH_MAX_ITEMS = int(os.getenv('PDF_BATCH_MAX_ITEMS', 50))
+
+# find-leads 비동기 작업(async=true)을 실행하는 프로세스당 백그라운드 스레드 수
+LEAD_SCOUT_JOB_WORKERS = int(os.getenv('LEAD_SCOUT_JOB_WORKERS', 4))
+# 이 시간(초)이 지나도록 pending/running 인 작업은 실행하던 프로세스가 사라진 것으로 보고 error 로 기록 (0이면 사용 안 함)
+LEAD_SCOUT_JOB_TIMEOUT = int(os.getenv('LEAD_SCOUT_JOB_TIMEOUT', 1800))
+
+# OpenAI 응답 캐시 (SQLite 파일). 모델/메시지/도구/파라미터가 같은 요청은 API 를 다시 호출하지 않음
+LLM_CACHE_ENABLED = os.getenv('LLM_CACHE_ENABLED', 'true').lower() == 'true'
+LLM_CACHE_PATH = os.getenv('LLM_CACHE_PATH', str(BASE_DIR / 'cache' / 'llm_responses.sqlite3'))
+LLM_CACHE_MAX_ENTRIES = int(os.getenv('LLM_CACHE_MAX_ENTRIES', 10000))
+
+# find-leads 결과 재사용 기간(초). 회사 정보와 PDF 분석본이 바뀌지 않았으면 이 기간 동안 LLM 을 다시 호출하지 않음 (0이면 사용 안 함)
+LEAD_SCOUT_CACHE_TTL = int(os.getenv('LEAD_SCOUT_CACHE_TTL', 60 * 60 * 24))
+
+# 회사명 유사도 매칭: 정규화한 이름의 문자 bigram Dice 계수가 임계값 이상이면 같은 회사로 판단
+COMPANY_MATCH_THRESHOLD = float(os.getenv('COMPANY_MATCH_THRESHOLD', 0.85))
+# 프로세스별 회사명 인덱스를 DB 에서 다시 읽어오는 주기(초) - 다른 워커가 추가한 회사 반영용
+COMPANY_INDEX_REFRESH_SECONDS = int(os.getenv('COMPANY_INDEX_REFRESH_SECONDS', 300))
+
+# 리드 상세 정보 수집 시 항목별 검색/추출 동시 실행 수 (1이면 순차 실행)
+LEAD_DETAILS_MAX_WORKERS = int(os.getenv('LEAD_DETAILS_MAX_WORKERS', 8))
+
+# 리드 상세 정보 LLM 추출 방식: "batch"(전 항목 일괄 추출) 또는 "per_field"(항목별 추출)
+LEAD_DETAILS_EXTRACTION_MODE = os.getenv('LEAD_DETAILS_EXTRACTION_MODE', 'batch')
+
+# Tavily 검색 결과 캐시 (SQLite 파일)
+TAVILY_CACHE_ENABLED = os.getenv('TAVILY_CACHE_ENABLED', 'true').lower() == 'true'
+TAVILY_CACHE_PATH = os.getenv('TAVILY_CACHE_PATH', str(BASE_DIR / 'cache' / 'tavily_search.sqlite3'))
+TAVILY_CACHE_MAX_ENTRIES = int(os.getenv('TAVILY_CACHE_MAX_ENTRIES', 5000))
+TAVILY_CACHE_DEFAULT_TTL = int(os.getenv('TAVILY_CACHE_DEFAULT_TTL', 60 * 60 * 24))
+# 검색 종류(query_type)별 TTL(초). 자주 바뀌는 정보는 짧게, 거의 바뀌지 않는 정보는 길게 유지합니다.
+TAVILY_CACHE_TTLS = {
+    'news': 60 * 60,
+    'recent_trends': 60 * 60 * 6,
+    'financial_info': 60 * 60 * 24 * 7,
+    'key_executives': 60 * 60 * 24 * 7,
+    'homepage_url': 60 * 60 * 24 * 30,
+    'company_address': 60 * 60 * 24 * 30,
+    'logo_url': 60 * 60 * 24 * 30,
+    'founded_date': 60 * 60 * 24 * 90,
+}
+
+# /metrics 접근 허용: 요청 IP(REMOTE_ADDR)가 목록(IP 또는 CIDR, 쉼표 구분)에 있거나
+# METRICS_TOKEN 이 설정되어 있고 Authorization: Bearer <토큰> 이 일치하면 허용, 아니면 403
+METRICS_ALLOWED_IPS = [
+    value.strip() for value in os.getenv('METRICS_ALLOWED_IPS', '127.0.0.1,::1').split(',') if value.strip()
+]
+METRICS_TOKEN = os.getenv('METRICS_TOKEN', '')
+
 # 로깅 설정
 LOGGING = {
     'version': 1,
     'disable_existing_loggers': False,
     'formatters': {
         'verbose': {
-            'format': '[{levelname}] {asctime} {pathname} {funcName} {lineno:d} - {message}',
+            'format': '[{levelname}] {asctime} [{request_id}] {pathname} {funcName} {lineno:d} - {message}',
             'style': '{',
         },
         'simple': {
@@ -148,15 +274,22 @@ LOGGING = {
             'style': '{',
         },
     },
+    'filters': {
+        'request_id': {
+            '()': 'scout_agent.services.tracing.RequestIdLogFilter',
+        },
+    },
     'handlers': {
         'console': {
             'class': 'logging.StreamHandler',
             'formatter': 'verbose',
+            'filters': ['request_id'],
         },
         'file': {
             'class': 'logging.FileHandler',
             'filename': 'lead_scout.log',
             'formatter': 'verbose',
+            'filters': ['request_id'],
         },
     },
     'loggers': {
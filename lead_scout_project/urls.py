@@ -17,8 +17,11 @@ Including another URLconf
 from django.contrib import admin
 from django.urls import path, include
 
+from scout_agent.views import metrics_view
+
 urlpatterns = [
     path('admin/', admin.site.urls),
+    path('metrics', metrics_view, name='metrics'),
     path('api/scout/', include('scout_agent.urls')),
     path('api/lead/', include('lead_detail_agent.urls')),
 ]
\ No newline at end of file
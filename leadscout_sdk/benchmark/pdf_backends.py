@@ -0,0 +1,120 @@
+"""
+analyze_pdf 의 PDF 백엔드(pymupdf, pdfminer)별 처리 속도(페이지/초)와 최대 메모리(RSS)를 비교합니다.
+
+    python -m leadscout_sdk.benchmark.pdf_backends brochure.pdf other.pdf --repeat 3
+    python -m leadscout_sdk.benchmark.pdf_backends --generate 200
+
+최대 RSS 는 프로세스 수명 전체의 최댓값이므로 백엔드마다 새 프로세스(spawn)에서 측정합니다.
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import resource
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from leadscout_sdk.scout_agent.pdf_analysis import PDF_BACKENDS, iter_pdf_pages
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux 는 KB, macOS 는 바이트 단위
+    return peak / 1024 / 1024 if sys.platform == "darwin" else peak / 1024
+
+
+def _run_backend(backend: str, files: list, repeat: int) -> dict:
+    """새 프로세스에서 files 를 repeat 번 추출하고 처리량과 최대 RSS 를 반환합니다."""
+    # 첫 호출의 import 비용은 측정에서 제외
+    for _ in iter_pdf_pages(files[0], backend, end_page=1):
+        pass
+    baseline_rss = _peak_rss_mb()
+
+    pages = 0
+    chars = 0
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for file_path in files:
+            for text in iter_pdf_pages(file_path, backend):
+                pages += 1
+                chars += len(text)
+    elapsed = time.perf_counter() - started
+
+    return {
+        "backend": backend,
+        "pages": pages,
+        "chars": chars,
+        "elapsed_seconds": round(elapsed, 3),
+        "pages_per_second": round(pages / elapsed, 1) if elapsed > 0 else None,
+        "baseline_rss_mb": round(baseline_rss, 1),
+        "peak_rss_mb": round(_peak_rss_mb(), 1),
+    }
+
+
+def generate_sample_pdf(path: str, pages: int) -> str:
+    """텍스트가 들어 있는 pages 쪽짜리 PDF 를 path 에 만듭니다."""
+    import fitz  # PyMuPDF
+
+    with fitz.open() as doc:
+        for page_number in range(1, pages + 1):
+            page = doc.new_page()
+            page.insert_text(
+                (72, 72),
+                "\n".join(
+                    f"Sample company profile page {page_number}, line {line}: revenue, customers, products."
+                    for line in range(1, 40)
+                ),
+                fontsize=9,
+            )
+        doc.save(path)
+    return path
+
+
+def compare_backends(files: list, backends=None, repeat: int = 1) -> list:
+    """backends(기본값: 전체)별 측정 결과 목록을 반환합니다."""
+    context = multiprocessing.get_context("spawn")
+    results = []
+    for backend in backends or list(PDF_BACKENDS):
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+            results.append(executor.submit(_run_backend, backend, files, repeat).result())
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="PDF 백엔드별 페이지/초와 최대 RSS 비교")
+    parser.add_argument("files", nargs="*", help="측정할 PDF 파일")
+    parser.add_argument("--generate", type=int, metavar="PAGES", help="파일 대신 PAGES 쪽짜리 샘플 PDF 를 만들어 측정")
+    parser.add_argument("--backends", default=",".join(PDF_BACKENDS), help="측정할 백엔드 (쉼표 구분)")
+    parser.add_argument("--repeat", type=int, default=1, help="파일 목록을 반복해서 추출할 횟수")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON 으로 출력")
+    args = parser.parse_args(argv)
+
+    backends = [backend.strip() for backend in args.backends.split(",") if backend.strip()]
+    unknown = set(backends) - set(PDF_BACKENDS)
+    if unknown:
+        parser.error(f"지원하지 않는 백엔드: {', '.join(sorted(unknown))}")
+
+    with tempfile.TemporaryDirectory(prefix="leadscout-pdf-benchmark-") as tmpdir:
+        files = list(args.files)
+        if args.generate:
+            files.append(generate_sample_pdf(os.path.join(tmpdir, "sample.pdf"), args.generate))
+        if not files:
+            parser.error("PDF 파일 또는 --generate 를 지정하세요.")
+
+        results = compare_backends(files, backends, args.repeat)
+
+    if args.json:
+        print(json.dumps(results, ensure_ascii=False, indent=2))
+        return
+    for result in results:
+        print(
+            f"{result['backend']:<9} {result['pages']}쪽 {result['elapsed_seconds']}s "
+            f"{result['pages_per_second']} 페이지/s, 최대 RSS {result['peak_rss_mb']}MB "
+            f"(추출 전 {result['baseline_rss_mb']}MB)"
+        )
+
+
+if __name__ == "__main__":
+    main()
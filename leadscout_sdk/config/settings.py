@@ -14,13 +14,41 @@ DB_SETTINGS = {
     "charset": "utf8mb4",
 }
 
+# 데이터베이스 연결 풀 (스레드마다 공유, 최대 연결 수/대기 시간(초)/재연결 주기(초))
+DB_POOL_SETTINGS = {
+    "max_size": int(os.getenv("DB_POOL_SIZE", 5)),
+    "timeout": float(os.getenv("DB_POOL_TIMEOUT", 30)),
+    "recycle": int(os.getenv("DB_POOL_RECYCLE", 3600)),
+}
+
 # AWS S3 설정
 AWS_SETTINGS = {
     "access_key": os.getenv("AWS_ACCESS_KEY_ID"),
     "secret_key": os.getenv("AWS_SECRET_ACCESS_KEY"),
     "region": os.getenv("AWS_REGION"),
     "bucket_name": os.getenv("AWS_S3_BUCKET"),
+    # S3 호환 로컬 서버(moto, MinIO 등)를 쓸 때만 지정
+    "endpoint_url": os.getenv("AWS_S3_ENDPOINT_URL") or None,
+}
+
+# S3 업로드: multipart_threshold(바이트) 이상인 파일은 multipart_chunksize 단위로 나눠
+# 파일당 max_concurrency 개씩 동시에 올리고, upload_pdfs 는 upload_workers 개 파일을 동시에 올림
+S3_UPLOAD_SETTINGS = {
+    "multipart_threshold": int(os.getenv("S3_MULTIPART_THRESHOLD", 8 * 1024 * 1024)),
+    "multipart_chunksize": int(os.getenv("S3_MULTIPART_CHUNKSIZE", 8 * 1024 * 1024)),
+    "max_concurrency": int(os.getenv("S3_MAX_CONCURRENCY", 4)),
+    "upload_workers": int(os.getenv("S3_UPLOAD_WORKERS", 8)),
 }
 
+# PDF 텍스트 추출 엔진: pymupdf(기본, 빠름) 또는 pdfminer
+PDF_BACKEND = os.getenv("PDF_BACKEND", "pymupdf")
+
 # OpenAI 설정
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+
+# OpenAI 응답 캐시 (SQLite 파일, Django 서비스와 같은 파일을 쓰면 캐시/통계를 공유)
+LLM_CACHE_SETTINGS = {
+    "enabled": os.getenv("LLM_CACHE_ENABLED", "true").lower() == "true",
+    "path": os.getenv("LLM_CACHE_PATH", os.path.join("cache", "llm_responses.sqlite3")),
+    "max_entries": int(os.getenv("LLM_CACHE_MAX_ENTRIES", 10000)),
+}
@@ -2,17 +2,30 @@ import os
 from openai import OpenAI
 from dotenv import load_dotenv
 
+from leadscout_sdk.config.settings import LLM_CACHE_SETTINGS
+from leadscout_sdk.utils.llm_cache import LLMResponseCache, create_chat_completion
+
 # .env 파일 로드
 load_dotenv()
 
 # OpenAI 클라이언트 초기화
 client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
 
-def a2a_chat(messages: list, model: str = "gpt-3.5-turbo") -> str:
+# OpenAI 응답 캐시 (Django 서비스와 같은 파일을 쓰면 캐시를 공유)
+llm_cache = LLMResponseCache(
+    path=LLM_CACHE_SETTINGS["path"],
+    max_entries=LLM_CACHE_SETTINGS["max_entries"],
+) if LLM_CACHE_SETTINGS["enabled"] else None
+
+def a2a_chat(messages: list, model: str = "gpt-3.5-turbo", use_cache: bool = False) -> str:
     """
     두 AI 간 대화 시뮬레이션 함수
+    기본 temperature 의 자유 대화이므로 캐시하지 않습니다. use_cache=True 이면 같은 model/messages 의
+    응답이 캐시에 있을 때 재사용합니다 (같은 대화 이력이면 예전 답변이 그대로 반환됨).
     """
-    response = client.chat.completions.create(
+    response = create_chat_completion(
+        client,
+        llm_cache if use_cache else None,
         model=model,
         messages=messages
     )
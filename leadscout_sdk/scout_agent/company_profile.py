@@ -1,47 +1,145 @@
-from leadscout_sdk.utils.db_connection import get_db_connection
+from itertools import islice
+
+import pymysql
+
+from leadscout_sdk.utils.db_connection import db_connection, db_transaction
+
+INSERT_COMPANY_PROFILE_SQL = """
+    INSERT INTO scout_agent_companyprofile (company_name, industry, homepage)
+    VALUES (%s, %s, %s)
+    """
+PROFILE_FIELDS = ("company_name", "industry", "homepage")
+PROFILE_COLUMNS = ("id",) + PROFILE_FIELDS
+
 
 def create_company_profile(company_name: str, industry: str, homepage: str) -> dict:
     """
     기업 프로필을 생성하는 함수
     """
-    conn = get_db_connection()
-    cursor = conn.cursor()
+    with db_transaction() as conn, conn.cursor() as cursor:
+        cursor.execute(INSERT_COMPANY_PROFILE_SQL, (company_name, industry, homepage))
 
-    sql = """
-    INSERT INTO scout_agent_companyprofile (company_name, industry, homepage)
-    VALUES (%s, %s, %s)
+    return {"message": "Company profile created successfully."}
+
+
+def _profile_values(row) -> tuple:
+    if isinstance(row, dict):
+        return tuple(row.get(field) for field in PROFILE_FIELDS)
+    return tuple(row)
+
+
+def create_company_profiles(rows, chunk_size: int = 1000) -> dict:
     """
-    cursor.execute(sql, (company_name, industry, homepage))
-    conn.commit()
+    여러 기업 프로필을 한 번에 생성하는 함수
 
-    cursor.close()
-    conn.close()
+    rows 는 {"company_name", "industry", "homepage"} 딕셔너리 또는 같은 순서의 튜플을 담은 iterable 입니다.
+    chunk_size 행마다 executemany(여러 행을 한 INSERT 문으로 전송) 후 커밋하므로,
+    중간 청크에서 오류가 나면 그 청크만 롤백되고 이전 청크는 저장된 상태로 예외가 전달됩니다.
+    """
+    rows = iter(rows)
+    created = 0
+    with db_connection() as conn, conn.cursor() as cursor:
+        while True:
+            chunk = [_profile_values(row) for row in islice(rows, chunk_size)]
+            if not chunk:
+                break
+            cursor.executemany(INSERT_COMPANY_PROFILE_SQL, chunk)
+            conn.commit()
+            created += len(chunk)
 
-    return {"message": "Company profile created successfully."}
+    return {"message": f"{created} company profiles created successfully.", "created": created}
 
 
-def get_all_company_profiles() -> list:
+def _profile_to_dict(row) -> dict:
+    return dict(zip(PROFILE_COLUMNS, row))
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _build_profiles_query(industry=None, company_name_contains=None, after_id=None, limit=None):
+    """필터와 키셋(after_id) 조건으로 id 순 조회 SQL 과 파라미터를 만듭니다."""
+    conditions = []
+    params = []
+    if after_id is not None:
+        conditions.append("id > %s")
+        params.append(after_id)
+    if industry is not None:
+        conditions.append("industry = %s")
+        params.append(industry)
+    if company_name_contains:
+        conditions.append("company_name LIKE %s")
+        params.append(f"%{_escape_like(company_name_contains)}%")
+
+    sql = f"SELECT {', '.join(PROFILE_COLUMNS)} FROM scout_agent_companyprofile"
+    if conditions:
+        sql += " WHERE " + " AND ".join(conditions)
+    sql += " ORDER BY id"
+    if limit is not None:
+        sql += " LIMIT %s"
+        params.append(limit)
+    return sql, params
+
+
+def iter_company_profile_batches(batch_size: int = 1000, industry=None, company_name_contains=None,
+                                 after_id=None, limit=None):
     """
-    모든 기업 프로필을 조회하는 함수
+    기업 프로필을 id 순으로 batch_size 개씩 리스트로 반환하는 제너레이터
+
+    서버 측 커서(SSCursor)로 결과를 받으므로 전체 행을 메모리에 올리지 않고 첫 배치부터 바로 반환합니다.
+    - industry: 업종 일치, company_name_contains: 회사명 부분 일치
+    - after_id: 이 id 다음부터 조회 (중단된 내보내기를 마지막으로 받은 id 부터 이어서 실행)
+    - limit: 최대 행 수
+
+    스트리밍하는 동안 DB 연결 하나를 계속 사용합니다. 배치 처리가 느려 MySQL net_write_timeout 을
+    넘길 수 있으면 get_company_profiles_page 로 페이지마다 새로 조회하세요.
+    """
+    sql, params = _build_profiles_query(industry, company_name_contains, after_id, limit)
+    with db_connection() as conn:
+        cursor = conn.cursor(pymysql.cursors.SSCursor)
+        try:
+            cursor.execute(sql, params)
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield [_profile_to_dict(row) for row in rows]
+            cursor.close()
+        except GeneratorExit:
+            # 중간에 그만 읽으면 남은 행을 모두 받아 버리는 대신 연결을 닫음 (풀에서 버려짐)
+            conn.close()
+            raise
+
+
+def iter_company_profiles(batch_size: int = 1000, **filters):
+    """
+    기업 프로필을 한 행(딕셔너리)씩 반환하는 제너레이터
+    필터와 키셋 인자는 iter_company_profile_batches 와 같고, batch_size 는 한 번에 받아오는 행 수입니다.
     """
-    conn = get_db_connection()
-    cursor = conn.cursor()
+    for batch in iter_company_profile_batches(batch_size, **filters):
+        yield from batch
 
-    sql = "SELECT id, company_name, industry, homepage FROM scout_agent_companyprofile"
-    cursor.execute(sql)
 
-    rows = cursor.fetchall()
+def get_company_profiles_page(after_id=None, page_size: int = 100, industry=None, company_name_contains=None) -> dict:
+    """
+    키셋 페이지네이션으로 기업 프로필 한 페이지를 조회하는 함수
+    다음 페이지는 반환된 next_after_id 를 after_id 로 넘겨 조회합니다 (마지막 페이지면 None).
+    """
+    sql, params = _build_profiles_query(industry, company_name_contains, after_id, page_size)
+    with db_connection() as conn, conn.cursor() as cursor:
+        cursor.execute(sql, params)
+        profiles = [_profile_to_dict(row) for row in cursor.fetchall()]
 
-    cursor.close()
-    conn.close()
+    return {
+        "profiles": profiles,
+        "next_after_id": profiles[-1]["id"] if len(profiles) == page_size else None,
+    }
 
-    profiles = []
-    for row in rows:
-        profiles.append({
-            "id": row[0],
-            "company_name": row[1],
-            "industry": row[2],
-            "homepage": row[3]
-        })
 
-    return profiles
+def get_all_company_profiles() -> list:
+    """
+    모든 기업 프로필을 조회하는 함수
+    행이 많으면 전체를 메모리에 올리지 않는 iter_company_profiles 를 사용하세요.
+    """
+    return list(iter_company_profiles())
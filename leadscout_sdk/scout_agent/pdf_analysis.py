@@ -1,34 +1,237 @@
+import hashlib
 import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import boto3
-from dotenv import load_dotenv
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
+from botocore.exceptions import ClientError
+
+from leadscout_sdk.config.settings import AWS_SETTINGS, PDF_BACKEND, S3_UPLOAD_SETTINGS
+
+_s3_client = None
+_s3_client_lock = threading.Lock()
+
+
+def get_s3_client():
+    """
+    프로세스 공용 S3 클라이언트를 반환하는 함수
+    boto3 클라이언트는 스레드 간에 공유할 수 있으므로 한 번만 만들고, 동시 업로드 수만큼 연결 풀을 잡아 둡니다.
+    """
+    global _s3_client
+    if _s3_client is None:
+        with _s3_client_lock:
+            if _s3_client is None:
+                _s3_client = boto3.client(
+                    's3',
+                    aws_access_key_id=AWS_SETTINGS["access_key"],
+                    aws_secret_access_key=AWS_SETTINGS["secret_key"],
+                    region_name=AWS_SETTINGS["region"],
+                    endpoint_url=AWS_SETTINGS["endpoint_url"],
+                    config=Config(max_pool_connections=max(
+                        10, S3_UPLOAD_SETTINGS["upload_workers"] * S3_UPLOAD_SETTINGS["max_concurrency"]
+                    )),
+                )
+    return _s3_client
+
+
+def _transfer_config() -> TransferConfig:
+    return TransferConfig(
+        multipart_threshold=S3_UPLOAD_SETTINGS["multipart_threshold"],
+        multipart_chunksize=S3_UPLOAD_SETTINGS["multipart_chunksize"],
+        max_concurrency=S3_UPLOAD_SETTINGS["max_concurrency"],
+    )
+
+
+def _s3_url(s3_key: str) -> str:
+    return f"https://{AWS_SETTINGS['bucket_name']}.s3.{AWS_SETTINGS['region']}.amazonaws.com/{s3_key}"
 
-# .env 파일 로드
-load_dotenv()
 
 def upload_pdf_to_s3(file_path: str, s3_key: str) -> str:
     """
     로컬 PDF 파일을 S3 버킷에 업로드하는 함수
+    S3_UPLOAD_SETTINGS 의 multipart_threshold 이상인 파일은 멀티파트로 나눠 동시에 올립니다.
     """
-    s3 = boto3.client(
-        's3',
-        aws_access_key_id=os.getenv("AWS_ACCESS_KEY_ID"),
-        aws_secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY"),
-        region_name=os.getenv("AWS_REGION")
-    )
+    get_s3_client().upload_file(file_path, AWS_SETTINGS["bucket_name"], s3_key, Config=_transfer_config())
+    return _s3_url(s3_key)
+
+
+def local_etag(file_path: str) -> str:
+    """
+    upload_pdf_to_s3 로 올렸을 때 S3 가 돌려줄 ETag 를 계산하는 함수
+    단일 업로드는 파일 MD5, 멀티파트 업로드는 파트별 MD5 를 이어 붙인 값의 MD5 에 "-파트 수"를 붙인 값입니다.
+    """
+    threshold = S3_UPLOAD_SETTINGS["multipart_threshold"]
+    chunksize = S3_UPLOAD_SETTINGS["multipart_chunksize"]
+    if os.path.getsize(file_path) < threshold:
+        digest = hashlib.md5()
+        with open(file_path, "rb") as f:
+            for block in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    part_digests = []
+    with open(file_path, "rb") as f:
+        for part in iter(lambda: f.read(chunksize), b""):
+            part_digests.append(hashlib.md5(part).digest())
+    return f"{hashlib.md5(b''.join(part_digests)).hexdigest()}-{len(part_digests)}"
+
+
+def _remote_etag(s3_key: str):
+    try:
+        response = get_s3_client().head_object(Bucket=AWS_SETTINGS["bucket_name"], Key=s3_key)
+    except ClientError as e:
+        if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+            return None
+        raise
+    return response["ETag"].strip('"')
+
+
+def _collect_pdfs(paths_or_dir, prefix: str) -> list:
+    """업로드할 (로컬 경로, S3 키) 목록. 디렉터리는 하위 폴더까지 *.pdf 를 찾아 상대 경로를 키로 씁니다."""
+    if isinstance(paths_or_dir, (str, os.PathLike)) and os.path.isdir(paths_or_dir):
+        root = os.fspath(paths_or_dir)
+        files = []
+        for dirpath, _, filenames in os.walk(root):
+            for filename in filenames:
+                if filename.lower().endswith(".pdf"):
+                    path = os.path.join(dirpath, filename)
+                    files.append((path, prefix + os.path.relpath(path, root).replace(os.sep, "/")))
+        return sorted(files)
+
+    if isinstance(paths_or_dir, (str, os.PathLike)):
+        paths_or_dir = [paths_or_dir]
+    return [(os.fspath(path), prefix + os.path.basename(path)) for path in paths_or_dir]
 
-    bucket_name = os.getenv("AWS_S3_BUCKET")
 
-    s3.upload_file(file_path, bucket_name, s3_key)
+def _upload_one(file_path: str, s3_key: str, skip_existing: bool) -> dict:
+    item = {"path": file_path, "key": s3_key, "url": _s3_url(s3_key), "bytes": 0, "error": None}
+    try:
+        if skip_existing and _remote_etag(s3_key) == local_etag(file_path):
+            item["status"] = "skipped"
+            return item
+        upload_pdf_to_s3(file_path, s3_key)
+        item["status"] = "uploaded"
+        item["bytes"] = os.path.getsize(file_path)
+    except Exception as e:
+        item["status"] = "error"
+        item["error"] = str(e)
+    return item
 
-    s3_url = f"https://{bucket_name}.s3.{os.getenv('AWS_REGION')}.amazonaws.com/{s3_key}"
-    return s3_url
+
+def upload_pdfs(paths_or_dir, prefix: str = "", max_workers: int = None, skip_existing: bool = True,
+                on_item=None) -> dict:
+    """
+    여러 PDF 파일을 S3 에 동시에 업로드하는 함수
+
+    - paths_or_dir: 파일 경로 목록 또는 디렉터리 (디렉터리면 하위 폴더의 *.pdf 까지 상대 경로 그대로 업로드)
+    - prefix: S3 키 앞에 붙일 경로 (예: "brochures/")
+    - max_workers: 동시에 올릴 파일 수 (기본값 S3_UPLOAD_SETTINGS["upload_workers"])
+    - skip_existing: 같은 키의 객체 ETag 가 로컬 파일과 같으면 올리지 않음
+    - on_item: 파일 하나가 끝날 때마다 항목 결과 dict 로 호출되는 콜백
+
+    Returns:
+        dict: 항목별 결과(items, 입력 순서)와 업로드/건너뜀/실패 수, 처리량 요약
+    """
+    files = _collect_pdfs(paths_or_dir, prefix)
+    max_workers = max_workers or S3_UPLOAD_SETTINGS["upload_workers"]
+
+    def run(file_path, s3_key):
+        item = _upload_one(file_path, s3_key, skip_existing)
+        if on_item:
+            on_item(item)
+        return item
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="s3-upload") as executor:
+        items = list(executor.map(lambda args: run(*args), files))
+    elapsed = time.perf_counter() - started
+
+    uploaded_bytes = sum(item["bytes"] for item in items)
+    uploaded = sum(1 for item in items if item["status"] == "uploaded")
+    skipped = sum(1 for item in items if item["status"] == "skipped")
+    return {
+        "total": len(items),
+        "uploaded": uploaded,
+        "skipped": skipped,
+        "failed": len(items) - uploaded - skipped,
+        "bytes_uploaded": uploaded_bytes,
+        "elapsed_seconds": round(elapsed, 3),
+        "files_per_second": round(len(items) / elapsed, 2) if elapsed > 0 else 0.0,
+        "megabytes_per_second": round(uploaded_bytes / 1024 / 1024 / elapsed, 2) if elapsed > 0 else 0.0,
+        "items": items,
+    }
+
+
+def _iter_pymupdf_pages(file_path: str, start_page: int, end_page):
+    import fitz  # PyMuPDF
+
+    with fitz.open(file_path) as doc:
+        stop = doc.page_count if end_page is None else min(end_page, doc.page_count)
+        for page_number in range(start_page, stop):
+            yield doc[page_number].get_text()
+
+
+def _iter_pdfminer_pages(file_path: str, start_page: int, end_page):
+    from pdfminer.high_level import extract_pages
+    from pdfminer.layout import LTTextBox, LTTextContainer
+
+    # 범위 밖 페이지는 레이아웃 분석 없이 건너뛰고, end_page 에서 파싱을 멈춤 (end_page 가 없으면 끝까지)
+    page_numbers = range(start_page, sys.maxsize if end_page is None else end_page)
+    for page_layout in extract_pages(file_path, page_numbers=page_numbers, maxpages=end_page or 0):
+        # extract_text 와 같이 텍스트 상자마다 뒤에 줄바꿈을 붙임
+        yield "".join(
+            element.get_text() + ("\n" if isinstance(element, LTTextBox) else "")
+            for element in page_layout if isinstance(element, LTTextContainer)
+        )
+
+
+# analyze_pdf 가 페이지마다 붙이는 구분 문자 (pdfminer extract_text 와 동일)
+PAGE_SEPARATOR = "\f"
+
+PDF_BACKENDS = {
+    "pymupdf": _iter_pymupdf_pages,
+    "pdfminer": _iter_pdfminer_pages,
+}
+
+
+def iter_pdf_pages(file_path: str, backend: str = None, start_page: int = 0, end_page: int = None):
+    """
+    PDF 의 페이지 텍스트를 한 페이지씩 반환하는 제너레이터
+
+    - backend: "pymupdf"(기본값 PDF_BACKEND) 또는 "pdfminer"
+    - start_page, end_page: 0부터 시작하는 [start_page, end_page) 페이지 범위 (end_page 가 None 이면 끝까지)
+      start_page 가 음수이면 ValueError, end_page <= start_page 이면 빈 범위입니다.
+    필요한 페이지까지만 읽으므로 앞부분만 쓰는 경우 문서 전체를 파싱하지 않습니다.
+    """
+    backend = backend or PDF_BACKEND
+    if backend not in PDF_BACKENDS:
+        raise ValueError(f"지원하지 않는 PDF 백엔드입니다: {backend} (가능한 값: {', '.join(PDF_BACKENDS)})")
+    if start_page < 0:
+        raise ValueError(f"start_page 는 0 이상이어야 합니다: {start_page}")
+    if end_page is not None and end_page <= start_page:
+        # pdfminer 는 빈 page_numbers 와 maxpages=0 을 "전체 페이지"로 처리하므로 여기서 끝냄
+        return iter(())
+    return PDF_BACKENDS[backend](file_path, start_page, end_page)
 
 
-def analyze_pdf(file_path: str) -> str:
+def analyze_pdf(file_path: str, backend: str = None, start_page: int = 0, end_page: int = None,
+                max_chars: int = None) -> str:
     """
     PDF 파일을 분석해서 텍스트를 추출하는 함수 (간단한 버전)
+    페이지 범위와 엔진은 iter_pdf_pages 와 같고, max_chars 를 채우면 남은 페이지는 읽지 않고 잘라서 반환합니다.
+    이전 pdfminer extract_text 와 같이 각 페이지 텍스트 뒤에 페이지 구분 문자(\\f)를 붙입니다.
     """
-    from pdfminer.high_level import extract_text
+    pages = []
+    total = 0
+    for text in iter_pdf_pages(file_path, backend, start_page, end_page):
+        pages.append(text + PAGE_SEPARATOR)
+        total += len(pages[-1])
+        if max_chars is not None and total >= max_chars:
+            break
 
-    extracted_text = extract_text(file_path)
-    return extracted_text
+    extracted_text = "".join(pages)
+    return extracted_text if max_chars is None else extracted_text[:max_chars]
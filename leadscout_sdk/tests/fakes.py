@@ -0,0 +1,99 @@
+"""pymysql 대신 쓰는 테스트용 가짜 연결과, 이를 쓰는 연결 풀을 준비하는 TestCase"""
+import unittest
+from unittest import mock
+
+import pymysql
+
+from leadscout_sdk.utils import db_connection
+from leadscout_sdk.utils.db_connection import ConnectionPool
+
+PROFILE_ROWS = [(i, f"회사 {i}", "IT 서비스", f"https://company{i}.example.com") for i in range(1, 11)]
+
+
+class FakeCursor:
+    """scout_agent_companyprofile 조회/INSERT 만 흉내 내는 pymysql 커서"""
+
+    def __init__(self, conn, cursor_class=None):
+        self.conn = conn
+        self.cursor_class = cursor_class
+        self.rows = iter(())
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def execute(self, sql, params=None):
+        self.conn.queries.append((self.cursor_class, sql, params))
+        if sql.lstrip().startswith("INSERT"):
+            self.conn.server_status |= pymysql.constants.SERVER_STATUS.SERVER_STATUS_IN_TRANS
+            return
+        rows = PROFILE_ROWS
+        if "id > %s" in sql:
+            rows = [row for row in rows if row[0] > params[0]]
+        if "LIMIT" in sql:
+            rows = rows[:params[-1]]
+        self.rows = iter(rows)
+
+    def executemany(self, sql, rows):
+        if any(row[0] is None for row in rows):
+            raise pymysql.err.IntegrityError(1048, "Column 'company_name' cannot be null")
+        self.conn.inserted.append(len(rows))
+        self.conn.server_status |= pymysql.constants.SERVER_STATUS.SERVER_STATUS_IN_TRANS
+
+    def fetchmany(self, size):
+        return [row for _, row in zip(range(size), self.rows)]
+
+    def fetchall(self):
+        return list(self.rows)
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    def __init__(self, **kwargs):
+        self.open = True
+        self.server_status = 0
+        self.queries = []
+        self.inserted = []
+        self.commits = 0
+        self.rollbacks = 0
+
+    def cursor(self, cursor_class=None):
+        return FakeCursor(self, cursor_class)
+
+    def commit(self):
+        self.commits += 1
+        self.server_status = 0
+
+    def rollback(self):
+        self.rollbacks += 1
+        self.server_status = 0
+
+    def ping(self, reconnect=False):
+        pass
+
+    def close(self):
+        self.open = False
+
+
+class SDKDatabaseTestCase(unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.connections = []
+
+        def connect(**kwargs):
+            self.connections.append(FakeConnection(**kwargs))
+            return self.connections[-1]
+
+        patcher = mock.patch('pymysql.connect', side_effect=connect)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.pool = ConnectionPool(max_size=2, timeout=0.2, host='db')
+        pool_patcher = mock.patch.object(db_connection, '_pool', self.pool)
+        pool_patcher.start()
+        self.addCleanup(pool_patcher.stop)
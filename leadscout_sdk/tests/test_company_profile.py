@@ -0,0 +1,64 @@
+import pymysql
+
+from leadscout_sdk.scout_agent import company_profile
+
+from .fakes import SDKDatabaseTestCase
+
+
+class CompanyProfileTests(SDKDatabaseTestCase):
+
+    def test_bulk_create_commits_per_chunk(self):
+        rows = ({"company_name": f"회사 {i}", "industry": "IT", "homepage": None} for i in range(25))
+
+        result = company_profile.create_company_profiles(rows, chunk_size=10)
+
+        self.assertEqual(result["created"], 25)
+        conn = self.connections[0]
+        self.assertEqual(conn.inserted, [10, 10, 5])
+        self.assertEqual(conn.commits, 3)
+
+    def test_bulk_create_keeps_committed_chunks_on_error(self):
+        rows = [("회사", "IT", None)] * 3 + [(None, "IT", None)]
+
+        with self.assertRaises(pymysql.err.IntegrityError):
+            company_profile.create_company_profiles(rows, chunk_size=2)
+
+        conn = self.connections[0]
+        self.assertEqual(conn.inserted, [2])
+        self.assertEqual(conn.commits, 1)
+        self.assertEqual(conn.rollbacks, 1)
+
+    def test_batches_stream_with_server_side_cursor(self):
+        batches = list(company_profile.iter_company_profile_batches(batch_size=4))
+
+        self.assertEqual([len(batch) for batch in batches], [4, 4, 2])
+        self.assertEqual(batches[0][0], {
+            "id": 1, "company_name": "회사 1", "industry": "IT 서비스", "homepage": "https://company1.example.com",
+        })
+        cursor_class, sql, params = self.connections[0].queries[0]
+        self.assertIs(cursor_class, pymysql.cursors.SSCursor)
+        self.assertEqual(self.pool.stats()["idle"], 1)
+
+    def test_filters_escape_like_wildcards(self):
+        list(company_profile.iter_company_profiles(industry="IT 서비스", company_name_contains="5%_", after_id=2))
+
+        _, sql, params = self.connections[0].queries[0]
+        self.assertIn("WHERE id > %s AND industry = %s AND company_name LIKE %s", sql)
+        self.assertEqual(params, [2, "IT 서비스", "%5\\%\\_%"])
+
+    def test_closing_stream_early_discards_the_connection(self):
+        profiles = company_profile.iter_company_profiles(batch_size=3)
+        next(profiles)
+        profiles.close()
+
+        self.assertFalse(self.connections[0].open)
+        self.assertEqual(self.pool.stats()["size"], 0)
+
+    def test_keyset_pages(self):
+        first = company_profile.get_company_profiles_page(page_size=4)
+        last = company_profile.get_company_profiles_page(after_id=8, page_size=4)
+
+        self.assertEqual([profile["id"] for profile in first["profiles"]], [1, 2, 3, 4])
+        self.assertEqual(first["next_after_id"], 4)
+        self.assertEqual([profile["id"] for profile in last["profiles"]], [9, 10])
+        self.assertIsNone(last["next_after_id"])
@@ -0,0 +1,60 @@
+import threading
+import time
+
+import pymysql
+
+from leadscout_sdk.scout_agent import company_profile
+from leadscout_sdk.utils import db_connection
+from leadscout_sdk.utils.db_connection import PoolTimeoutError
+
+from .fakes import SDKDatabaseTestCase
+
+
+class ConnectionPoolTests(SDKDatabaseTestCase):
+
+    def test_connections_are_reused_across_threads(self):
+        def work():
+            for _ in range(20):
+                with db_connection.db_connection():
+                    time.sleep(0.001)
+
+        threads = [threading.Thread(target=work) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(self.connections), 2)
+        self.assertEqual(self.pool.stats(), {"size": 2, "idle": 2, "max_size": 2})
+
+    def test_acquire_times_out_when_pool_is_exhausted(self):
+        entries = [self.pool.acquire() for _ in range(2)]
+        self.addCleanup(lambda: [self.pool.release(entry) for entry in entries])
+
+        with self.assertRaises(PoolTimeoutError):
+            self.pool.acquire()
+
+    def test_uncommitted_transaction_is_rolled_back_on_release(self):
+        with db_connection.db_connection() as conn, conn.cursor() as cursor:
+            cursor.execute(company_profile.INSERT_COMPANY_PROFILE_SQL, ("a", "b", "c"))
+
+        self.assertEqual(conn.rollbacks, 1)
+        self.assertEqual(self.pool.stats()["idle"], 1)
+
+    def test_connection_errors_discard_the_connection(self):
+        with self.assertRaises(pymysql.err.OperationalError):
+            with db_connection.db_connection():
+                raise pymysql.err.OperationalError(2006, "MySQL server has gone away")
+
+        self.assertFalse(self.connections[0].open)
+        self.assertEqual(self.pool.stats()["size"], 0)
+
+    def test_expired_connections_are_recycled(self):
+        self.pool.recycle = 0
+        with db_connection.db_connection():
+            pass
+        with db_connection.db_connection():
+            pass
+
+        self.assertEqual(len(self.connections), 2)
+        self.assertFalse(self.connections[0].open)
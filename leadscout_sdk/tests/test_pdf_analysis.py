@@ -0,0 +1,43 @@
+import os
+import tempfile
+import unittest
+
+from leadscout_sdk.benchmark.pdf_backends import generate_sample_pdf
+from leadscout_sdk.scout_agent.pdf_analysis import PDF_BACKENDS, analyze_pdf, iter_pdf_pages
+
+
+class SDKPDFAnalysisTests(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        tmpdir = tempfile.TemporaryDirectory()
+        cls.addClassCleanup(tmpdir.cleanup)
+        cls.path = generate_sample_pdf(os.path.join(tmpdir.name, "sample.pdf"), 4)
+
+    def test_page_range_is_the_same_for_every_backend(self):
+        for backend in PDF_BACKENDS:
+            with self.subTest(backend=backend):
+                self.assertEqual(len(list(iter_pdf_pages(self.path, backend))), 4)
+                pages = list(iter_pdf_pages(self.path, backend, start_page=1, end_page=3))
+                self.assertEqual(len(pages), 2)
+                self.assertIn("page 2,", pages[0])
+                self.assertIn("page 3,", pages[1])
+                self.assertEqual(list(iter_pdf_pages(self.path, backend, end_page=0)), [])
+                self.assertEqual(list(iter_pdf_pages(self.path, backend, start_page=3, end_page=2)), [])
+                self.assertEqual(analyze_pdf(self.path, backend, end_page=0), "")
+
+    def test_negative_start_page_is_rejected(self):
+        with self.assertRaises(ValueError):
+            iter_pdf_pages(self.path, start_page=-1)
+
+    def test_pages_are_separated_like_pdfminer_extract_text(self):
+        from pdfminer.high_level import extract_text
+
+        self.assertEqual(analyze_pdf(self.path, "pdfminer"), extract_text(self.path))
+        self.assertEqual(analyze_pdf(self.path, "pymupdf").count("\f"), 4)
+
+    def test_max_chars_stops_after_the_page_that_fills_it(self):
+        text = analyze_pdf(self.path, "pymupdf", max_chars=100)
+
+        self.assertEqual(text, analyze_pdf(self.path, "pymupdf")[:100])
@@ -0,0 +1,91 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from leadscout_sdk.scout_agent import pdf_analysis
+
+try:
+    from moto import mock_aws
+except ImportError:  # moto 는 개발용 선택 의존성
+    mock_aws = None
+
+BUCKET = 'brochure-bucket'
+REGION = 'ap-northeast-2'
+
+
+@unittest.skipUnless(mock_aws, "moto 가 설치되어 있지 않습니다.")
+class UploadPDFsTests(unittest.TestCase):
+
+    def setUp(self):
+        aws = mock_aws()
+        aws.start()
+        self.addCleanup(aws.stop)
+
+        for patcher in (
+            mock.patch.dict(pdf_analysis.AWS_SETTINGS, {
+                "access_key": "test", "secret_key": "test", "region": REGION,
+                "bucket_name": BUCKET, "endpoint_url": None,
+            }),
+            mock.patch.dict(pdf_analysis.S3_UPLOAD_SETTINGS, {
+                "multipart_threshold": 5 * 1024 * 1024, "multipart_chunksize": 5 * 1024 * 1024,
+            }),
+            mock.patch.object(pdf_analysis, '_s3_client', None),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        pdf_analysis.get_s3_client().create_bucket(
+            Bucket=BUCKET, CreateBucketConfiguration={'LocationConstraint': REGION}
+        )
+
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        os.makedirs(os.path.join(self.directory, 'sub'))
+        self._write('a.pdf', b'%PDF-a' * 100)
+        self._write('b.PDF', b'%PDF-b' * 100)
+        self._write('sub/large.pdf', os.urandom(6 * 1024 * 1024))
+        self._write('note.txt', b'not a pdf')
+
+    def _write(self, name, content):
+        with open(os.path.join(self.directory, name), 'wb') as f:
+            f.write(content)
+
+    def _keys(self):
+        response = pdf_analysis.get_s3_client().list_objects_v2(Bucket=BUCKET)
+        return sorted(obj['Key'] for obj in response.get('Contents', []))
+
+    def test_directory_upload_keeps_relative_keys(self):
+        seen = []
+        result = pdf_analysis.upload_pdfs(self.directory, prefix='brochures/', on_item=seen.append)
+
+        self.assertEqual((result["total"], result["uploaded"], result["failed"]), (3, 3, 0))
+        self.assertEqual(len(seen), 3)
+        self.assertEqual(self._keys(), ['brochures/a.pdf', 'brochures/b.PDF', 'brochures/sub/large.pdf'])
+        self.assertEqual(
+            result["items"][0]["url"],
+            f"https://{BUCKET}.s3.{REGION}.amazonaws.com/brochures/a.pdf",
+        )
+
+    def test_unchanged_files_are_skipped(self):
+        pdf_analysis.upload_pdfs(self.directory, prefix='brochures/')
+        self._write('a.pdf', b'%PDF-changed')
+
+        result = pdf_analysis.upload_pdfs(self.directory, prefix='brochures/')
+
+        # 멀티파트로 올라간 large.pdf 도 로컬 ETag 계산이 S3 와 같아야 건너뜀
+        self.assertEqual((result["uploaded"], result["skipped"]), (1, 2))
+        self.assertEqual(
+            [item["key"] for item in result["items"] if item["status"] == "uploaded"], ['brochures/a.pdf']
+        )
+
+    def test_missing_file_is_reported_without_stopping_others(self):
+        missing = os.path.join(self.directory, 'missing.pdf')
+
+        result = pdf_analysis.upload_pdfs([os.path.join(self.directory, 'a.pdf'), missing])
+
+        self.assertEqual((result["uploaded"], result["failed"]), (1, 1))
+        self.assertEqual(result["items"][1]["status"], "error")
+        self.assertTrue(result["items"][1]["error"])
+        self.assertEqual(self._keys(), ['a.pdf'])
@@ -0,0 +1,50 @@
+import os
+import tempfile
+import time
+import unittest
+
+from leadscout_sdk.utils.llm_cache import LLMResponseCache
+
+
+class SQLiteLRUCacheTests(unittest.TestCase):
+
+    def setUp(self):
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.cache = LLMResponseCache(os.path.join(tmpdir.name, "llm.sqlite3"), max_entries=2)
+
+    def put(self, key, tokens=10):
+        self.cache.set(key, "chat.completions", "gpt-test", {"id": key, "usage": {"total_tokens": tokens}})
+
+    def test_least_recently_read_entry_is_evicted(self):
+        self.put("a")
+        time.sleep(0.01)
+        self.put("b")
+        time.sleep(0.01)
+        self.assertIsNotNone(self.cache.get("a"))
+        time.sleep(0.01)
+        self.put("c")
+
+        self.assertIsNone(self.cache.get("b"))
+        self.assertEqual(self.cache.get("a"), {"id": "a", "usage": {"total_tokens": 10}})
+        self.assertIsNotNone(self.cache.get("c"))
+
+    def test_stats_are_counted_and_cleared(self):
+        self.put("a", tokens=7)
+        self.cache.get("a")
+        self.cache.get("missing")
+
+        self.assertEqual(
+            self.cache.stats(),
+            {"hits": 1, "misses": 1, "hit_rate": 0.5, "tokens_saved": 7, "entries": 1},
+        )
+
+        self.cache.clear()
+        self.assertEqual(
+            self.cache.stats(),
+            {"hits": 0, "misses": 0, "hit_rate": 0.0, "tokens_saved": 0, "entries": 0},
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,21 +1,178 @@
-import os
+import threading
+import time
+from contextlib import contextmanager
+
 import pymysql
-from dotenv import load_dotenv
+from pymysql.constants import SERVER_STATUS
+
+from leadscout_sdk.config.settings import DB_POOL_SETTINGS, DB_SETTINGS
+
+
+class PoolTimeoutError(Exception):
+    """timeout 안에 풀에서 연결을 얻지 못했을 때 발생합니다."""
+
+
+class ConnectionPool:
+    """
+    스레드 간에 공유하는 pymysql 연결 풀입니다.
+
+    - 최대 max_size 개까지 연결을 만들고, 모두 사용 중이면 timeout 초까지 반환을 기다립니다.
+    - 반환된 연결은 다음 사용 전에 ping 으로 확인하고(끊겼으면 재연결), recycle 초가 지난 연결은 닫고 새로 만듭니다.
+    - 커밋하지 않은 트랜잭션이 남은 채 반환되면 롤백해 다음 사용자에게 넘어가지 않게 합니다.
+    """
+
+    def __init__(self, max_size=5, timeout=30, recycle=3600, **connect_kwargs):
+        self.max_size = max_size
+        self.timeout = timeout
+        self.recycle = recycle
+        self.connect_kwargs = connect_kwargs
+        self._condition = threading.Condition()
+        # (연결, 생성 시각) - 최근 반환한 연결부터 재사용
+        self._idle = []
+        self._size = 0
+        self._closed = False
+
+    def _connect(self):
+        return pymysql.connect(cursorclass=pymysql.cursors.Cursor, **self.connect_kwargs)
+
+    def _discard(self, conn):
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    def acquire(self):
+        """풀에서 연결을 꺼냅니다. 사용 후 반드시 release() 로 돌려줘야 합니다 (connection() 권장)."""
+        deadline = time.monotonic() + self.timeout
+        with self._condition:
+            while True:
+                if self._closed:
+                    raise RuntimeError("닫힌 연결 풀입니다.")
+                if self._idle:
+                    conn, created_at = self._idle.pop()
+                    if time.monotonic() - created_at < self.recycle:
+                        break
+                    self._discard(conn)
+                    self._size -= 1
+                    continue
+                if self._size < self.max_size:
+                    self._size += 1
+                    conn = None
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise PoolTimeoutError(f"{self.timeout}초 안에 DB 연결을 얻지 못했습니다 (최대 {self.max_size}개 사용 중).")
+                self._condition.wait(remaining)
+
+        # 연결 생성/확인은 네트워크 왕복이 있으므로 락 밖에서 실행
+        try:
+            if conn is None:
+                return self._connect(), time.monotonic()
+            conn.ping(reconnect=True)
+            return conn, created_at
+        except Exception:
+            if conn is not None:
+                self._discard(conn)
+            with self._condition:
+                self._size -= 1
+                self._condition.notify()
+            raise
+
+    def release(self, entry, discard=False):
+        """acquire() 로 꺼낸 연결을 돌려줍니다. discard=True 이면 닫고 버립니다."""
+        conn, created_at = entry
+        if not discard and conn.open and conn.server_status & SERVER_STATUS.SERVER_STATUS_IN_TRANS:
+            try:
+                conn.rollback()
+            except Exception:
+                discard = True
+
+        with self._condition:
+            if discard or self._closed or not conn.open:
+                self._discard(conn)
+                self._size -= 1
+            else:
+                self._idle.append((conn, created_at))
+            self._condition.notify()
+
+    @contextmanager
+    def connection(self):
+        """
+        연결을 빌려주고 블록이 끝나면 풀에 돌려줍니다.
+        커밋은 호출자가 합니다. 예외가 나면 롤백하고, 연결 자체의 오류면 연결을 버립니다.
+        """
+        entry = self.acquire()
+        conn = entry[0]
+        try:
+            yield conn
+        except BaseException as e:
+            discard = isinstance(e, (pymysql.err.OperationalError, pymysql.err.InterfaceError))
+            if not discard:
+                try:
+                    conn.rollback()
+                except Exception:
+                    discard = True
+            self.release(entry, discard=discard)
+            raise
+        self.release(entry)
+
+    @contextmanager
+    def transaction(self):
+        """connection() 과 같지만 블록이 정상 종료되면 커밋합니다."""
+        with self.connection() as conn:
+            yield conn
+            conn.commit()
+
+    def close(self):
+        """사용하지 않는 연결을 모두 닫습니다. 사용 중인 연결은 반환될 때 닫힙니다."""
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._size -= len(idle)
+            self._condition.notify_all()
+        for conn, _ in idle:
+            self._discard(conn)
+
+    def stats(self):
+        with self._condition:
+            return {"size": self._size, "idle": len(self._idle), "max_size": self.max_size}
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_connection_pool():
+    """
+    DB_SETTINGS / DB_POOL_SETTINGS 로 만든 프로세스 공용 연결 풀을 반환합니다.
+    """
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ConnectionPool(**DB_POOL_SETTINGS, **DB_SETTINGS)
+    return _pool
+
+
+def db_connection():
+    """
+    공용 풀의 연결을 빌려주는 컨텍스트 매니저 (커밋은 호출자가 함)
+
+        with db_connection() as conn, conn.cursor() as cursor:
+            cursor.execute(...)
+    """
+    return get_connection_pool().connection()
+
+
+def db_transaction():
+    """공용 풀의 연결을 빌려주고 블록이 정상 종료되면 커밋하는 컨텍스트 매니저"""
+    return get_connection_pool().transaction()
 
-# .env 파일 로드
-load_dotenv()
 
 def get_db_connection():
     """
     MySQL 데이터베이스 연결을 생성하는 함수
+    호출할 때마다 새 연결을 만들고 닫는 것도 호출자 몫이므로, 새 코드는 db_connection() 을 사용하세요.
     """
-    conn = pymysql.connect(
-        host=os.getenv("DB_HOST", "localhost"),
-        port=int(os.getenv("DB_PORT", 3306)),
-        user=os.getenv("DB_USER"),
-        password=os.getenv("DB_PASSWORD"),
-        db=os.getenv("DB_NAME"),
-        charset="utf8mb4",
-        cursorclass=pymysql.cursors.Cursor
-    )
+    conn = pymysql.connect(cursorclass=pymysql.cursors.Cursor, **DB_SETTINGS)
     return conn
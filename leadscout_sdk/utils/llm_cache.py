@@ -0,0 +1,119 @@
+import hashlib
+import json
+import sqlite3
+import time
+
+from openai.types.chat import ChatCompletion
+from openai.types.responses import Response
+
+from leadscout_sdk.utils.sqlite_cache import SQLiteLRUCache
+
+
+class LLMResponseCache(SQLiteLRUCache):
+    """
+    OpenAI 응답을 SQLite 파일에 저장하는 내용 기반(content-addressed) 캐시입니다.
+
+    - 키: 호출 종류(endpoint)와 요청 파라미터 전체(model, messages/input, tools, temperature 등)의 SHA-256
+    - 제거: max_entries를 넘으면 마지막 조회 시각이 가장 오래된 항목부터 삭제(LRU)
+    - 통계: 적중/미적중 횟수와 적중으로 아낀 토큰 수를 파일에 누적하므로
+      같은 파일을 쓰는 Django 서비스와 SDK 가 통계를 공유합니다.
+    """
+
+    table = "llm_cache"
+    columns = (
+        "endpoint TEXT NOT NULL",
+        "model TEXT",
+        "response TEXT NOT NULL",
+        "total_tokens INTEGER NOT NULL DEFAULT 0",
+        "created_at REAL NOT NULL",
+    )
+    counters = ("hits", "misses", "tokens_saved")
+
+    def __init__(self, path, max_entries=10000):
+        super().__init__(path, max_entries)
+
+    @staticmethod
+    def make_key(endpoint, params):
+        raw = json.dumps({"endpoint": endpoint, "params": params}, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key):
+        """저장된 응답(dict)을 반환합니다. 없으면 None을 반환합니다."""
+        try:
+            with self._connect() as conn:
+                row = conn.execute("SELECT response, total_tokens FROM llm_cache WHERE key = ?", (key,)).fetchone()
+                if row is None:
+                    self._count(conn, "misses")
+                    return None
+                self._touch(conn, key, time.time())
+                self._count(conn, "hits")
+                self._count(conn, "tokens_saved", row[1])
+                return json.loads(row[0])
+        except sqlite3.Error as e:
+            print(f"⚠️ LLM 캐시 조회 실패: {e}")
+            return None
+
+    def set(self, key, endpoint, model, response):
+        """응답(dict)을 저장하고 max_entries를 넘는 오래된 항목을 제거합니다."""
+        usage = response.get("usage") or {}
+        now = time.time()
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    """
+                    INSERT OR REPLACE INTO llm_cache
+                        (key, endpoint, model, response, total_tokens, created_at, last_accessed_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    (
+                        key,
+                        endpoint,
+                        model,
+                        json.dumps(response, ensure_ascii=False),
+                        usage.get("total_tokens") or 0,
+                        now,
+                        now,
+                    )
+                )
+                self._evict(conn)
+        except sqlite3.Error as e:
+            print(f"⚠️ LLM 캐시 저장 실패: {e}")
+
+
+def cached_create(cache, endpoint, create, response_type, use_cache=True, **params):
+    """
+    create(**params) 를 호출하되, 같은 요청의 응답이 캐시에 있으면 API 를 호출하지 않고 재사용합니다.
+
+    Args:
+        cache: LLMResponseCache (None 이면 캐시 없이 호출)
+        endpoint: 호출 종류 이름 (키에 포함)
+        create: 실제 API 호출 함수 (예: client.chat.completions.create)
+        response_type: 응답 pydantic 모델 (예: ChatCompletion). 저장된 dict 를 이 타입으로 복원합니다.
+        use_cache: False 이면 캐시를 읽지 않고 새 응답으로 갱신
+    """
+    if cache is None:
+        return create(**params)
+
+    key = cache.make_key(endpoint, params)
+    if use_cache:
+        payload = cache.get(key)
+        if payload is not None:
+            return response_type.model_validate(payload)
+
+    response = create(**params)
+    # Responses API 의 incomplete/failed 응답은 저장하지 않음
+    if getattr(response, "status", None) in (None, "completed"):
+        cache.set(key, endpoint, params.get("model"), response.model_dump(mode="json"))
+    return response
+
+
+def create_chat_completion(client, cache=None, use_cache=True, **params):
+    """client.chat.completions.create 의 캐시 적용 버전입니다."""
+    return cached_create(
+        cache, "chat.completions", client.chat.completions.create, ChatCompletion, use_cache, **params
+    )
+
+
+def create_response(client, cache=None, use_cache=True, **params):
+    """client.responses.create (Responses API) 의 캐시 적용 버전입니다."""
+    return cached_create(cache, "responses", client.responses.create, Response, use_cache, **params)
@@ -0,0 +1,107 @@
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+
+class SQLiteLRUCache:
+    """
+    SQLite 파일 하나에 항목과 누적 통계를 저장하는 LRU 캐시의 공통 부분입니다.
+    LLM 응답 캐시(LLMResponseCache)와 Tavily 검색 캐시(SearchResultCache)가 상속해 사용합니다.
+
+    - 항목 테이블 `table`: key(기본 키), 하위 클래스의 `columns`, last_accessed_at
+    - 통계 테이블 `{table}_stats`: `counters` 이름별 누적 값. 파일에 저장하므로 같은 파일을 쓰는
+      여러 워커 프로세스(와 SDK)가 통계를 공유합니다.
+    - 제거: max_entries 를 넘으면 마지막 조회 시각이 가장 오래된 항목부터 삭제
+    """
+
+    table = None
+    # key 와 last_accessed_at 사이에 들어갈 컬럼 정의
+    columns = ()
+    counters = ("hits", "misses")
+
+    def __init__(self, path, max_entries):
+        self.path = str(path)
+        self.max_entries = max_entries
+        self._init_lock = threading.Lock()
+        self._initialized = False
+
+    @contextmanager
+    def _connect(self):
+        """트랜잭션 단위로 커밋하고 연결을 닫는 SQLite 연결을 제공합니다."""
+        if not self._initialized:
+            with self._init_lock:
+                if not self._initialized:
+                    self._create_tables()
+                    self._initialized = True
+        conn = sqlite3.connect(self.path, timeout=10)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _create_tables(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        columns = ",\n".join(["key TEXT PRIMARY KEY", *self.columns, "last_accessed_at REAL NOT NULL"])
+        conn = sqlite3.connect(self.path, timeout=10)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(f"CREATE TABLE IF NOT EXISTS {self.table} ({columns})")
+            conn.execute(
+                f"CREATE INDEX IF NOT EXISTS {self.table}_last_accessed ON {self.table} (last_accessed_at)"
+            )
+            conn.execute(f"""
+                CREATE TABLE IF NOT EXISTS {self.table}_stats (
+                    name TEXT PRIMARY KEY,
+                    value INTEGER NOT NULL
+                )
+            """)
+            conn.executemany(
+                f"INSERT OR IGNORE INTO {self.table}_stats (name, value) VALUES (?, 0)",
+                [(name,) for name in self.counters],
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _count(self, conn, name, amount=1):
+        conn.execute(f"UPDATE {self.table}_stats SET value = value + ? WHERE name = ?", (amount, name))
+
+    def _touch(self, conn, key, now):
+        conn.execute(f"UPDATE {self.table} SET last_accessed_at = ? WHERE key = ?", (now, key))
+
+    def _evict(self, conn):
+        (count,) = conn.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()
+        overflow = count - self.max_entries
+        if overflow > 0:
+            conn.execute(
+                f"""
+                DELETE FROM {self.table} WHERE key IN (
+                    SELECT key FROM {self.table} ORDER BY last_accessed_at ASC LIMIT ?
+                )
+                """,
+                (overflow,)
+            )
+
+    def stats(self):
+        """누적 적중/미적중 횟수(와 그 밖의 counters), 적중률, 현재 항목 수를 반환합니다."""
+        with self._connect() as conn:
+            values = dict(conn.execute(f"SELECT name, value FROM {self.table}_stats").fetchall())
+            (entries,) = conn.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()
+        total = values["hits"] + values["misses"]
+        stats = {
+            "hits": values["hits"],
+            "misses": values["misses"],
+            "hit_rate": values["hits"] / total if total else 0.0,
+        }
+        stats.update((name, values[name]) for name in self.counters if name not in stats)
+        stats["entries"] = entries
+        return stats
+
+    def clear(self):
+        with self._connect() as conn:
+            conn.execute(f"DELETE FROM {self.table}")
+            conn.execute(f"UPDATE {self.table}_stats SET value = 0")
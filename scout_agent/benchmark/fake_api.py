@@ -0,0 +1,290 @@
+# benchmark/fake_api.py
+import json
+import random
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import fitz  # PyMuPDF
+
+from scout_agent.services.pdf_section_selector import estimate_tokens
+
+# 서비스별 LLM 호출을 구분하는 시스템 메시지/프롬프트 문구 -> 기본 응답 (JSON 문자열로 반환)
+DEFAULT_LEADS = {
+    "leads": [
+        {
+            "company": f"벤치마크 리드 {i}",
+            "industry": "IT 서비스",
+            "sales": 1000000000 * i,
+            "total_funding": 500000000 * i,
+            "homepage": f"https://lead{i}.example.com",
+            "key_executive": f"대표 {i}",
+            "address": "서울특별시 강남구",
+            "email": f"contact@lead{i}.example.com",
+            "phone_number": "02-000-0000",
+            "relevance_score": round(0.95 - i * 0.1, 2),
+            "reasoning": "벤치마크용 고정 응답입니다.",
+        }
+        for i in range(1, 6)
+    ]
+}
+
+DEFAULT_COMPANY_INFO = {
+    "industry": "IT 서비스",
+    "sales": 12000000000,
+    "total_funding": 3000000000,
+    "homepage": "https://source.example.com",
+    "key_executive": "홍길동",
+    "address": "서울특별시 강남구",
+    "email": "contact@source.example.com",
+    "phone_number": "02-000-0000",
+    "company_description": "벤치마크용 소스 회사입니다.",
+    "products_services": "B2B SaaS",
+    "target_customers": "중견 제조사",
+    "competitors": "경쟁사 A, 경쟁사 B",
+    "strengths": "빠른 도입",
+    "business_model": "구독",
+}
+
+DEFAULT_LEAD_DETAILS = {
+    "industry_keywords": "IT 서비스, SaaS",
+    "homepage_url": "https://lead.example.com",
+    "key_executives": "대표 홍길동",
+    "company_address": "서울특별시 강남구",
+    "company_summary": "벤치마크용 회사 설명입니다.",
+    "target_customers": "중견 제조사",
+    "competitors": "경쟁사 A, 경쟁사 B",
+    "strengths": "빠른 도입",
+    "risk_factors": "시장 경쟁 심화",
+    "recent_trends": "신규 투자 유치",
+    "financial_info": "매출 120억원",
+    "founded_date": "2015-01-01",
+    "logo_url": "https://lead.example.com/logo.png",
+}
+
+DEFAULT_PAYLOADS = {
+    # [{endpoint, match(프롬프트에 포함된 문구, 없으면 모든 요청), content}] - 위에서부터 처음 일치하는 항목 사용
+    "openai": [
+        {"endpoint": "responses", "content": DEFAULT_LEADS},
+        {"endpoint": "chat.completions", "match": "company analysis expert", "content": DEFAULT_COMPANY_INFO},
+        {"endpoint": "chat.completions", "match": "structured data extractor", "content": DEFAULT_LEAD_DETAILS},
+        {"endpoint": "chat.completions", "content": {}},
+    ],
+    "tavily": {
+        "results": [
+            {
+                "title": f"벤치마크 검색 결과 {i}",
+                "url": f"https://news.example.com/{i}",
+                "content": "벤치마크용 검색 결과 본문입니다. " * 20,
+            }
+            for i in range(1, 6)
+        ]
+    },
+    "pdf_pages": 10,
+}
+
+
+def build_sample_pdf(pages):
+    """텍스트가 들어 있는 pages 쪽짜리 PDF 바이트를 만듭니다."""
+    document = fitz.open()
+    for page_number in range(1, pages + 1):
+        page = document.new_page()
+        page.insert_text(
+            (72, 72),
+            "\n".join(
+                f"Benchmark company profile page {page_number}, line {line}: revenue, customers, products."
+                for line in range(1, 40)
+            ),
+            fontsize=9,
+        )
+    try:
+        return document.tobytes()
+    finally:
+        document.close()
+
+
+class FakeAPIServer:
+    """
+    OpenAI Chat Completions/Responses, Tavily /search 중 이 프로젝트가 쓰는 부분만 흉내 내는 로컬 HTTP 서버입니다.
+
+    - POST /v1/chat/completions, POST /v1/responses: payloads["openai"] 에서 프롬프트와 일치하는 응답을 JSON 문자열로 반환
+    - POST /search: payloads["tavily"] 반환
+    - GET /files/<이름>.pdf: 텍스트가 있는 샘플 PDF (PDF 분석 벤치마크용)
+    - GET /stats: 경로별 호출 수
+
+    latency_ms(+jitter_ms) 만큼 지연한 뒤 응답하고, error_rate 확률로 error_status(기본 429)를 Retry-After 헤더와 함께 반환합니다.
+    """
+
+    def __init__(self, host='127.0.0.1', port=0, latency_ms=0, jitter_ms=0, error_rate=0.0,
+                 error_status=429, retry_after=1, payloads=None):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.retry_after = retry_after
+        self.payloads = {**DEFAULT_PAYLOADS, **(payloads or {})}
+        self.pdf_bytes = build_sample_pdf(self.payloads["pdf_pages"])
+        self._stats = {}
+        self._stats_lock = threading.Lock()
+        self._thread = None
+        self.httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self.httpd.daemon_threads = True
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        """백그라운드 스레드에서 서버를 시작합니다."""
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self):
+        self.httpd.serve_forever()
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def stats(self):
+        with self._stats_lock:
+            return {path: dict(counts) for path, counts in self._stats.items()}
+
+    def _count(self, path, outcome):
+        with self._stats_lock:
+            counts = self._stats.setdefault(path, {"ok": 0, "error": 0})
+            counts[outcome] += 1
+
+    def _delay(self):
+        delay_ms = self.latency_ms + (random.uniform(0, self.jitter_ms) if self.jitter_ms else 0)
+        if delay_ms > 0:
+            time.sleep(delay_ms / 1000.0)
+
+    def _openai_content(self, endpoint, body):
+        if endpoint == "responses":
+            prompt = body.get("input")
+        else:
+            prompt = body.get("messages")
+        prompt = json.dumps(prompt, ensure_ascii=False) if not isinstance(prompt, str) else prompt
+
+        for route in self.payloads["openai"]:
+            if route["endpoint"] == endpoint and route.get("match", "") in prompt:
+                content = route["content"]
+                text = content if isinstance(content, str) else json.dumps(content, ensure_ascii=False)
+                return prompt, text
+        return prompt, "{}"
+
+    def chat_completion(self, body):
+        prompt, text = self._openai_content("chat.completions", body)
+        prompt_tokens, completion_tokens = estimate_tokens(prompt), estimate_tokens(text)
+        return {
+            "id": f"chatcmpl-{uuid.uuid4().hex}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body.get("model", "fake"),
+            "choices": [{
+                "index": 0,
+                "finish_reason": "stop",
+                "message": {"role": "assistant", "content": text},
+            }],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+            },
+        }
+
+    def response(self, body):
+        prompt, text = self._openai_content("responses", body)
+        input_tokens, output_tokens = estimate_tokens(prompt), estimate_tokens(text)
+        return {
+            "id": f"resp_{uuid.uuid4().hex}",
+            "object": "response",
+            "created_at": int(time.time()),
+            "model": body.get("model", "fake"),
+            "status": "completed",
+            "output": [{
+                "type": "message",
+                "id": f"msg_{uuid.uuid4().hex}",
+                "role": "assistant",
+                "status": "completed",
+                "content": [{"type": "output_text", "text": text, "annotations": []}],
+            }],
+            "parallel_tool_calls": True,
+            "tool_choice": body.get("tool_choice", "auto"),
+            "tools": body.get("tools", []),
+            "usage": {
+                "input_tokens": input_tokens,
+                "input_tokens_details": {"cached_tokens": 0},
+                "output_tokens": output_tokens,
+                "output_tokens_details": {"reasoning_tokens": 0},
+                "total_tokens": input_tokens + output_tokens,
+            },
+        }
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):
+                pass
+
+            def _send(self, status, body, content_type="application/json", headers=None):
+                data = body if isinstance(body, bytes) else json.dumps(body, ensure_ascii=False).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(data)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def _maybe_fail(self, path):
+                if server.error_rate and random.random() < server.error_rate:
+                    server._count(path, "error")
+                    self._send(
+                        server.error_status,
+                        {"error": {"message": "fake api error", "type": "fake_error"}},
+                        headers={"Retry-After": str(server.retry_after)},
+                    )
+                    return True
+                return False
+
+            def do_GET(self):
+                path = self.path.split("?", 1)[0]
+                if path == "/stats":
+                    self._send(200, server.stats())
+                elif path.startswith("/files/") and path.endswith(".pdf"):
+                    server._delay()
+                    server._count("/files", "ok")
+                    self._send(200, server.pdf_bytes, content_type="application/pdf")
+                else:
+                    self._send(404, {"error": {"message": f"unknown path {path}"}})
+
+            def do_POST(self):
+                path = self.path.split("?", 1)[0]
+                length = int(self.headers.get("Content-Length") or 0)
+                body = json.loads(self.rfile.read(length) or b"{}")
+
+                handlers = {
+                    "/v1/chat/completions": server.chat_completion,
+                    "/v1/responses": server.response,
+                    "/search": lambda _: server.payloads["tavily"],
+                }
+                handler = handlers.get(path)
+                if handler is None:
+                    self._send(404, {"error": {"message": f"unknown path {path}"}})
+                    return
+
+                server._delay()
+                if self._maybe_fail(path):
+                    return
+                server._count(path, "ok")
+                self._send(200, handler(body))
+
+        return Handler
@@ -0,0 +1,179 @@
+# benchmark/runner.py
+import json
+import math
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.db import connection
+from django.test import Client
+
+from scout_agent.models import CompanyData, CompanyProfile
+
+
+def percentile(values, pct):
+    """정렬한 values 의 pct(0~100) 백분위수 (선형 보간)."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100.0
+    low, high = math.floor(rank), math.ceil(rank)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+class QueryCounter:
+    """connection.execute_wrapper 로 등록해 현재 스레드에서 실행한 쿼리 수를 셉니다."""
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+class EndpointBenchmark:
+    """
+    find-leads/, analyze-pdf/, lead/details/ 를 Django 테스트 클라이언트로 동시에 호출해
+    지연 시간 백분위수, 처리량, 요청당 DB 쿼리 수를 측정합니다.
+
+    외부 API 는 fake_url 의 FakeAPIServer 가 대신하며, 캐시를 쓰지 않도록 force/refresh 를 붙여 호출합니다.
+    DB 쿼리 수는 요청을 처리한 스레드의 쿼리만 셉니다 (서비스 내부 스레드 풀의 쿼리는 제외).
+    """
+
+    ENDPOINTS = ('analyze-pdf', 'find-leads', 'lead-details')
+
+    def __init__(self, fake_url, concurrency_levels=(1, 4, 8), requests_per_level=20, warmup=1,
+                 endpoints=None, use_cache=False, stats=None):
+        self.fake_url = fake_url
+        self.concurrency_levels = concurrency_levels
+        self.requests_per_level = requests_per_level
+        self.warmup = warmup
+        self.endpoints = endpoints or self.ENDPOINTS
+        self.use_cache = use_cache
+        # 가짜 서버의 경로별 호출 수를 반환하는 함수 (요청당 외부 API 호출 수 계산용)
+        self.stats = stats
+        self.company = None
+        self.profile = None
+
+    def seed(self):
+        """벤치마크용 소스 회사와 샘플 PDF 프로필을 만듭니다."""
+        self.company = CompanyData.objects.create(company="벤치마크 소스 회사", industry="IT 서비스")
+        self.profile = CompanyProfile.objects.create(
+            company=self.company,
+            file_name="benchmark.pdf",
+            url=f"{self.fake_url}/files/benchmark.pdf",
+        )
+
+    def _request_args(self, endpoint):
+        refresh = not self.use_cache
+        if endpoint == 'analyze-pdf':
+            return '/api/scout/analyze-pdf/', {"profile_id": self.profile.id, "force": refresh}
+        if endpoint == 'find-leads':
+            return '/api/scout/find-leads/', {"company_id": self.company.id, "refresh": refresh}
+        if endpoint == 'lead-details':
+            return '/api/lead/details/', {"search_company_name": "벤치마크 리드 1", "refresh": refresh}
+        raise ValueError(f"알 수 없는 엔드포인트: {endpoint}")
+
+    def _request(self, endpoint):
+        path, payload = self._request_args(endpoint)
+        counter = QueryCounter()
+        started = time.perf_counter()
+        try:
+            with connection.execute_wrapper(counter):
+                response = Client().post(path, data=json.dumps(payload), content_type='application/json')
+            status_code = response.status_code
+        except Exception as e:
+            print(f"❌ {endpoint} 요청 실패: {e}")
+            status_code = None
+        return time.perf_counter() - started, status_code, counter.count
+
+    def _worker(self, endpoint, count, results, lock):
+        try:
+            for _ in range(count):
+                result = self._request(endpoint)
+                with lock:
+                    results.append(result)
+        finally:
+            connection.close()
+
+    def _upstream_calls(self):
+        if self.stats is None:
+            return None
+        return sum(counts["ok"] + counts["error"] for path, counts in self.stats().items() if path != "/files")
+
+    def run_level(self, endpoint, concurrency):
+        """endpoint 를 concurrency 개 스레드로 requests_per_level 번 호출한 결과를 집계합니다."""
+        results = []
+        lock = threading.Lock()
+        per_worker = [
+            self.requests_per_level // concurrency + (1 if i < self.requests_per_level % concurrency else 0)
+            for i in range(concurrency)
+        ]
+
+        upstream_before = self._upstream_calls()
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            for count in per_worker:
+                if count:
+                    executor.submit(self._worker, endpoint, count, results, lock)
+        elapsed = time.perf_counter() - started
+        upstream_after = self._upstream_calls()
+
+        latencies = [latency * 1000 for latency, _, _ in results]
+        queries = [query_count for _, _, query_count in results]
+        errors = sum(1 for _, status_code, _ in results if status_code is None or status_code >= 400)
+        return {
+            "endpoint": endpoint,
+            "concurrency": concurrency,
+            "requests": len(results),
+            "errors": errors,
+            "p50_ms": round(percentile(latencies, 50), 1),
+            "p95_ms": round(percentile(latencies, 95), 1),
+            "p99_ms": round(percentile(latencies, 99), 1),
+            "mean_ms": round(sum(latencies) / len(latencies), 1),
+            "throughput_rps": round(len(results) / elapsed, 2) if elapsed else None,
+            "db_queries_avg": round(sum(queries) / len(queries), 1),
+            "db_queries_max": max(queries),
+            "upstream_calls_per_request": (
+                round((upstream_after - upstream_before) / len(results), 2)
+                if upstream_before is not None else None
+            ),
+        }
+
+    def run(self, on_result=None):
+        """모든 엔드포인트 x 동시 실행 수 조합을 측정합니다. (엔드포인트마다 warmup 회 먼저 호출)"""
+        if self.company is None:
+            self.seed()
+
+        summaries = []
+        for endpoint in self.endpoints:
+            for _ in range(self.warmup):
+                self._request(endpoint)
+            for concurrency in self.concurrency_levels:
+                summary = self.run_level(endpoint, concurrency)
+                summaries.append(summary)
+                if on_result:
+                    on_result(summary)
+        return summaries
+
+
+def compare_with_baseline(summaries, baseline, tolerance):
+    """
+    baseline(이전 실행 결과) 대비 p95 지연 시간이 tolerance 비율 넘게 늘었거나
+    요청당 평균 쿼리 수가 늘어난 항목을 반환합니다.
+    """
+    previous = {(item["endpoint"], item["concurrency"]): item for item in baseline}
+    regressions = []
+    for summary in summaries:
+        before = previous.get((summary["endpoint"], summary["concurrency"]))
+        if before is None:
+            continue
+        label = f"{summary['endpoint']} x{summary['concurrency']}"
+        if summary["p95_ms"] > before["p95_ms"] * (1 + tolerance):
+            regressions.append(f"{label}: p95 {before['p95_ms']}ms -> {summary['p95_ms']}ms")
+        if summary["db_queries_avg"] > before["db_queries_avg"]:
+            regressions.append(
+                f"{label}: DB 쿼리 {before['db_queries_avg']} -> {summary['db_queries_avg']}/요청"
+            )
+    return regressions
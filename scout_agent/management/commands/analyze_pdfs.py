@@ -0,0 +1,49 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from scout_agent.repository.company_profile_repository import (
+    get_company_profiles_by_ids,
+    get_company_profiles_without_analysis,
+)
+from scout_agent.services.pdf_batch_service import PDFBatchAnalyzer
+
+
+class Command(BaseCommand):
+    help = "여러 CompanyProfile 의 PDF 를 동시에 분석합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument('profile_ids', nargs='*', type=int, help="분석할 CompanyProfile ID 목록")
+        parser.add_argument('--pending', action='store_true', help="PDF 분석본이 없는 모든 프로필을 분석")
+        parser.add_argument('--force', action='store_true', help="기존 분석본 재사용 없이 재분석")
+        parser.add_argument('--download-concurrency', type=int, help="동시 다운로드 수")
+        parser.add_argument('--extraction-concurrency', type=int, help="동시 텍스트 추출 수")
+        parser.add_argument('--llm-concurrency', type=int, help="동시 LLM 호출 수")
+
+    def handle(self, *args, **options):
+        if options['pending']:
+            profiles = get_company_profiles_without_analysis()
+        elif options['profile_ids']:
+            profiles = get_company_profiles_by_ids(options['profile_ids'])
+        else:
+            raise CommandError("profile_ids 또는 --pending 중 하나를 지정해야 합니다.")
+
+        profiles = list(profiles)
+        self.stdout.write(f"PDF 분석 시작: {len(profiles)}개 프로필")
+
+        analyzer = PDFBatchAnalyzer(
+            download_concurrency=options['download_concurrency'],
+            extraction_concurrency=options['extraction_concurrency'],
+            llm_concurrency=options['llm_concurrency'],
+        )
+        summary = analyzer.analyze(profiles, force=options['force'], on_item=self._write_item)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"완료: 성공 {summary['succeeded']} / 실패 {summary['failed']} / 전체 {summary['total']}, "
+            f"{summary['elapsed_seconds']}초, 분당 {summary['throughput_per_minute']}건"
+        ))
+
+    def _write_item(self, item):
+        line = f"[{item['status']}] profile_id={item['profile_id']} ({item['elapsed_seconds']}초)"
+        if item['error']:
+            line += f" - {item['error']}"
+        style = self.style.SUCCESS if item['status'] == 'success' else self.style.ERROR
+        self.stdout.write(style(line))
@@ -0,0 +1,43 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from scout_agent.repository.api_usage_repository import get_api_usage_summary, get_costliest_requests
+
+
+class Command(BaseCommand):
+    help = "최근 N일 동안의 외부 API(OpenAI/Tavily) 호출 수, 토큰, 예상 비용을 작업/모델별로 출력합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=1, help="집계 기간(일, 기본 1)")
+        parser.add_argument('--top', type=int, default=10, help="비용이 큰 요청을 몇 개 출력할지 (기본 10)")
+
+    def handle(self, *args, **options):
+        if options['days'] < 1:
+            raise CommandError("--days 는 1 이상이어야 합니다.")
+        since = timezone.now() - timedelta(days=options['days'])
+
+        rows = list(get_api_usage_summary(since))
+        if not rows:
+            self.stdout.write(f"최근 {options['days']}일 동안 기록된 외부 API 호출이 없습니다.")
+            return
+
+        total_cost = sum(row['cost'] for row in rows)
+        total_calls = sum(row['calls'] for row in rows)
+        self.stdout.write(f"최근 {options['days']}일: 호출 {total_calls}회, 예상 비용 ${total_cost:.4f}")
+        for row in rows:
+            self.stdout.write(
+                f"  {row['operation']:<13} {row['provider']:<7} {row['model']:<14} "
+                f"{row['calls']:>6}회 입력 {row['prompt_tokens']}(캐시 {row['cached_tokens']}) "
+                f"출력 {row['completion_tokens']} 토큰, 평균 {row['latency_ms'] // row['calls']}ms, "
+                f"${row['cost']:.4f}"
+            )
+
+        top = list(get_costliest_requests(since, options['top']))
+        if top:
+            self.stdout.write("비용이 큰 요청:")
+            for row in top:
+                self.stdout.write(
+                    f"  {row['request_id']} {row['company'] or '-'}: {row['calls']}회, ${row['cost']:.4f}"
+                )
@@ -0,0 +1,144 @@
+import contextlib
+import json
+import os
+import tempfile
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import setup_test_environment, teardown_test_environment
+
+from scout_agent.benchmark.runner import EndpointBenchmark, compare_with_baseline
+from .fake_api_server import add_fake_api_arguments, build_fake_api_server
+
+# 벤치마크 중에는 호출 한도로 대기하지 않도록 사실상 무제한으로 설정
+UNLIMITED_RATE_LIMITS = {
+    'openai': {'default': {'rpm': 10 ** 9, 'tpm': 10 ** 12}},
+    'tavily': {'default': {'rpm': 10 ** 9}},
+}
+
+
+def _int_list(value):
+    try:
+        return [int(item) for item in value.split(',') if item.strip()]
+    except ValueError:
+        raise CommandError(f"정수 목록이 아닙니다: {value}")
+
+
+class Command(BaseCommand):
+    help = (
+        "로컬 가짜 OpenAI/Tavily 서버를 띄우고 find-leads/analyze-pdf/lead-details 의 "
+        "p50/p95/p99 지연 시간, 처리량, 요청당 DB 쿼리 수를 동시 실행 수별로 측정합니다. "
+        "측정은 테스트 DB(test_<DB 이름>)에서 실행되며 끝나면 삭제됩니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--endpoints', default=','.join(EndpointBenchmark.ENDPOINTS),
+            help="측정할 엔드포인트 (쉼표 구분)"
+        )
+        parser.add_argument('--concurrency', default='1,4,8', help="동시 실행 수 목록 (쉼표 구분)")
+        parser.add_argument('--requests', type=int, default=20, help="동시 실행 수마다 보낼 요청 수")
+        parser.add_argument('--warmup', type=int, default=1, help="엔드포인트마다 측정 전에 보낼 요청 수")
+        parser.add_argument('--use-cache', action='store_true', help="LLM/검색/결과 캐시를 켠 상태로 측정 (임시 디렉터리 사용)")
+        parser.add_argument('--rate-limits', action='store_true', help="settings.RATE_LIMITS 를 그대로 적용")
+        parser.add_argument('--fake-url', help="이미 실행 중인 fake_api_server 주소 (없으면 내부에서 실행)")
+        parser.add_argument('--keepdb', action='store_true', help="테스트 DB 를 삭제하지 않고 재사용")
+        parser.add_argument('--output', help="결과를 저장할 JSON 파일")
+        parser.add_argument('--baseline', help="비교할 이전 결과 JSON 파일")
+        parser.add_argument(
+            '--tolerance', type=float, default=0.2,
+            help="baseline 대비 허용하는 p95 증가 비율 (기본 0.2)"
+        )
+        add_fake_api_arguments(parser)
+
+    def handle(self, *args, **options):
+        endpoints = [item.strip() for item in options['endpoints'].split(',') if item.strip()]
+        unknown = set(endpoints) - set(EndpointBenchmark.ENDPOINTS)
+        if unknown:
+            raise CommandError(f"알 수 없는 엔드포인트: {', '.join(sorted(unknown))}")
+        concurrency_levels = _int_list(options['concurrency'])
+        if not concurrency_levels or min(concurrency_levels) < 1 or options['requests'] < 1:
+            raise CommandError("--concurrency 와 --requests 는 1 이상이어야 합니다.")
+
+        baseline = None
+        if options['baseline']:
+            with open(options['baseline'], encoding='utf-8') as f:
+                baseline = json.load(f)
+
+        server = None
+        fake_url = options['fake_url']
+        if not fake_url:
+            server = build_fake_api_server(options).start()
+            fake_url = server.url
+        self.stdout.write(f"가짜 API 서버: {fake_url}")
+
+        cache_dir = tempfile.TemporaryDirectory(prefix='leadscout-benchmark-')
+        overrides = {
+            'OPENAI_API_KEY': 'benchmark',
+            'OPENAI_BASE_URL': f"{fake_url}/v1",
+            'TAVILY_API_KEY': 'benchmark',
+            'TAVILY_API_URL': f"{fake_url}/search",
+            'LLM_CACHE_ENABLED': options['use_cache'],
+            'LLM_CACHE_PATH': f"{cache_dir.name}/llm_responses.sqlite3",
+            'TAVILY_CACHE_ENABLED': options['use_cache'],
+            'TAVILY_CACHE_PATH': f"{cache_dir.name}/tavily_search.sqlite3",
+            # 벤치마크는 비용 한도 없이 측정
+            'REQUEST_COST_BUDGET': 0,
+            'DAILY_COST_BUDGET': 0,
+        }
+        if not options['rate_limits']:
+            overrides['RATE_LIMITS'] = UNLIMITED_RATE_LIMITS
+
+        old_name = connection.settings_dict['NAME']
+        setup_test_environment()
+        # 서비스의 print 로그는 -v 2 이상일 때만 출력 (self.stdout 은 영향 없음)
+        quiet = options['verbosity'] < 2
+        devnull = open(os.devnull, 'w') if quiet else None
+        try:
+            connection.creation.create_test_db(verbosity=0, autoclobber=True, keepdb=options['keepdb'])
+            with override_settings(**overrides), \
+                    (contextlib.redirect_stdout(devnull) if quiet else contextlib.nullcontext()):
+                benchmark = EndpointBenchmark(
+                    fake_url,
+                    concurrency_levels=concurrency_levels,
+                    requests_per_level=options['requests'],
+                    warmup=options['warmup'],
+                    endpoints=endpoints,
+                    use_cache=options['use_cache'],
+                    stats=server.stats if server else None,
+                )
+                summaries = benchmark.run(on_result=self._write_summary)
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0, keepdb=options['keepdb'])
+            teardown_test_environment()
+            if server is not None:
+                server.stop()
+            cache_dir.cleanup()
+            if devnull is not None:
+                devnull.close()
+
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as f:
+                json.dump(summaries, f, ensure_ascii=False, indent=2)
+            self.stdout.write(f"결과 저장: {options['output']}")
+
+        if baseline is not None:
+            regressions = compare_with_baseline(summaries, baseline, options['tolerance'])
+            if regressions:
+                for line in regressions:
+                    self.stdout.write(self.style.ERROR(f"[REGRESSION] {line}"))
+                raise CommandError(f"baseline 대비 성능 저하 {len(regressions)}건")
+            self.stdout.write(self.style.SUCCESS("baseline 대비 성능 저하 없음"))
+
+    def _write_summary(self, summary):
+        style = self.style.SUCCESS if summary['errors'] == 0 else self.style.WARNING
+        upstream = summary['upstream_calls_per_request']
+        self.stdout.write(style(
+            f"{summary['endpoint']:<13} x{summary['concurrency']:<3} "
+            f"n={summary['requests']} err={summary['errors']} "
+            f"p50={summary['p50_ms']}ms p95={summary['p95_ms']}ms p99={summary['p99_ms']}ms "
+            f"{summary['throughput_rps']} req/s, "
+            f"DB {summary['db_queries_avg']}/req (max {summary['db_queries_max']})"
+            + (f", 외부 API {upstream}/req" if upstream is not None else "")
+        ))
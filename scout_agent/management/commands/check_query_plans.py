@@ -0,0 +1,63 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from scout_agent.models import CompanyData, LeadProspect
+from scout_agent.repository.lead_prospect_repository import LEAD_RANKING_ORDER
+
+
+class Command(BaseCommand):
+    help = "리드 저장/랭킹 조회가 인덱스를 사용하는지 MySQL EXPLAIN 으로 확인합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--company-id', type=int, help="랭킹 조회에 사용할 소스 회사 ID (기본값: 첫 번째 회사)")
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'mysql':
+            raise CommandError(f"MySQL 에서만 실행할 수 있습니다 (현재: {connection.vendor}).")
+
+        company = CompanyData.objects.order_by('id').first()
+        company_id = options['company_id'] or (company.id if company else 0)
+        normalized_name = company.normalized_name if company else ''
+
+        checks = [
+            (
+                "회사 이름 upsert 조회",
+                CompanyData.objects.filter(normalized_name=normalized_name),
+                {'companydata_normalized_idx'},
+            ),
+            (
+                "리드 관계 upsert 조회",
+                LeadProspect.objects.filter(source_company_id=company_id, prospect_company_id=company_id),
+                {'unique_lead_prospect_pair'},
+            ),
+            (
+                "소스 회사별 리드 랭킹 조회",
+                LeadProspect.objects.filter(source_company_id=company_id).order_by(*LEAD_RANKING_ORDER)[:20],
+                {'leadprospect_ranking_idx'},
+            ),
+        ]
+
+        failures = []
+        for label, queryset, expected_keys in checks:
+            plan = self._explain(queryset)
+            key = plan.get('key')
+            extra = plan.get('Extra') or ''
+            ok = key in expected_keys and 'Using filesort' not in extra
+            line = f"{label}: type={plan.get('type')}, key={key}, rows={plan.get('rows')}, extra={extra}"
+            if ok:
+                self.stdout.write(self.style.SUCCESS(f"[OK] {line}"))
+            else:
+                self.stdout.write(self.style.ERROR(f"[FAIL] {line} (기대 인덱스: {', '.join(sorted(expected_keys))})"))
+                failures.append(label)
+
+        if failures:
+            raise CommandError(f"인덱스를 사용하지 않는 쿼리: {', '.join(failures)}")
+
+    def _explain(self, queryset):
+        """쿼리셋의 EXPLAIN 첫 행(기준 테이블)을 컬럼명 -> 값 딕셔너리로 반환합니다."""
+        sql, params = queryset.query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN {sql}", params)
+            columns = [column[0] for column in cursor.description]
+            row = cursor.fetchone()
+        return dict(zip(columns, row)) if row else {}
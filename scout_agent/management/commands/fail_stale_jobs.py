@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+
+from scout_agent.services.job_service import fail_stale_jobs
+
+
+class Command(BaseCommand):
+    help = "끝나지 않은 채 남은 find-leads 비동기 작업을 오류로 기록합니다. 서버 시작 전에 실행합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--all', action='store_true',
+            help="경과 시간과 관계없이 모든 pending/running 작업을 정리 (프로세스 하나로 실행할 때 시작 직전에 사용)",
+        )
+
+    def handle(self, *args, **options):
+        count = fail_stale_jobs(older_than=0 if options['all'] else None)
+        self.stdout.write(self.style.SUCCESS(f"끝나지 않은 작업 {count}건을 오류로 기록했습니다."))
@@ -0,0 +1,53 @@
+import json
+
+from django.core.management.base import BaseCommand
+
+from scout_agent.benchmark.fake_api import FakeAPIServer
+
+
+def add_fake_api_arguments(parser):
+    parser.add_argument('--latency-ms', type=float, default=0, help="응답 지연 시간(ms)")
+    parser.add_argument('--jitter-ms', type=float, default=0, help="지연 시간에 더할 무작위 값의 최대치(ms)")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="오류 응답 비율 (0~1)")
+    parser.add_argument('--error-status', type=int, default=429, help="오류 응답 상태 코드")
+    parser.add_argument('--retry-after', type=float, default=1, help="오류 응답의 Retry-After(초)")
+    parser.add_argument('--payloads', help="기본 응답을 덮어쓸 JSON 파일 (openai/tavily/pdf_pages 키)")
+
+
+def build_fake_api_server(options, host='127.0.0.1', port=0):
+    payloads = None
+    if options['payloads']:
+        with open(options['payloads'], encoding='utf-8') as f:
+            payloads = json.load(f)
+    return FakeAPIServer(
+        host=host,
+        port=port,
+        latency_ms=options['latency_ms'],
+        jitter_ms=options['jitter_ms'],
+        error_rate=options['error_rate'],
+        error_status=options['error_status'],
+        retry_after=options['retry_after'],
+        payloads=payloads,
+    )
+
+
+class Command(BaseCommand):
+    help = "OpenAI/Tavily API 를 흉내 내는 로컬 가짜 서버를 실행합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--host', default='127.0.0.1')
+        parser.add_argument('--port', type=int, default=8765)
+        add_fake_api_arguments(parser)
+
+    def handle(self, *args, **options):
+        server = build_fake_api_server(options, host=options['host'], port=options['port'])
+        self.stdout.write(self.style.SUCCESS(f"가짜 API 서버 실행 중: {server.url}"))
+        self.stdout.write(
+            f"OPENAI_BASE_URL={server.url}/v1 TAVILY_API_URL={server.url}/search 로 서버를 실행하면 이 서버를 사용합니다."
+        )
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.stop()
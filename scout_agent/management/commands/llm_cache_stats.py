@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from scout_agent.services.llm_cache import get_llm_cache
+
+
+class Command(BaseCommand):
+    help = "OpenAI 응답 캐시의 적중률과 항목 수를 출력합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--clear', action='store_true', help="캐시 항목과 통계를 모두 삭제")
+
+    def handle(self, *args, **options):
+        cache = get_llm_cache()
+        if cache is None:
+            raise CommandError("LLM_CACHE_ENABLED 가 꺼져 있습니다.")
+
+        if options['clear']:
+            cache.clear()
+            self.stdout.write(self.style.SUCCESS("LLM 응답 캐시를 비웠습니다."))
+            return
+
+        stats = cache.stats()
+        self.stdout.write(
+            f"적중 {stats['hits']} / 미적중 {stats['misses']} (적중률 {stats['hit_rate']:.1%}), "
+            f"아낀 토큰 {stats['tokens_saved']}, 항목 {stats['entries']}개"
+        )
@@ -0,0 +1,68 @@
+import re
+import time
+
+from django.db import connection
+
+from .services.metrics import DB_QUERIES, HTTP_REQUEST_SECONDS, REQUEST_DB_SECONDS
+from .services.tracing import current_request_id, request_context, server_timing
+
+# 클라이언트/프록시가 보낸 X-Request-ID 는 이 형식일 때만 그대로 사용
+_REQUEST_ID_PATTERN = re.compile(r'^[A-Za-z0-9._-]{1,64}$')
+
+
+class _DBTimer:
+    """connection.execute_wrapper 로 등록해 요청 스레드의 쿼리 수와 시간을 합산합니다."""
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.count += 1
+            self.seconds += time.perf_counter() - started
+
+
+class RequestTracingMiddleware:
+    """
+    요청마다 request_id 를 정하고(X-Request-ID 헤더 또는 새로 생성) 처리 중 기록된 span 과 로그에 붙입니다.
+
+    - 응답에 X-Request-ID 와 단계별 소요 시간(Server-Timing) 헤더를 추가합니다.
+    - 요청 처리 시간과 DB 쿼리 수/시간을 route 별 지표로 기록합니다.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        request_id = request.headers.get('X-Request-ID', '')
+        if not _REQUEST_ID_PATTERN.match(request_id):
+            request_id = None
+
+        db_timer = _DBTimer()
+        started = time.perf_counter()
+        with request_context(request_id) as spans, connection.execute_wrapper(db_timer):
+            request.request_id = current_request_id()
+            response = self.get_response(request)
+        response['X-Request-ID'] = request.request_id
+        elapsed = time.perf_counter() - started
+
+        route = self._route(request)
+        HTTP_REQUEST_SECONDS.observe(elapsed, method=request.method, route=route, status=response.status_code)
+        REQUEST_DB_SECONDS.observe(db_timer.seconds, route=route)
+        DB_QUERIES.inc(db_timer.count, route=route)
+
+        # 스트리밍 응답은 헤더를 먼저 보내므로 본문 생성 중의 span 은 포함되지 않음
+        timing = server_timing(spans, db_timer.seconds)
+        if timing:
+            response['Server-Timing'] = timing
+        return response
+
+    def _route(self, request):
+        match = getattr(request, 'resolver_match', None)
+        if match is None:
+            return 'unmatched'
+        return match.route or match.view_name
@@ -0,0 +1,35 @@
+# Generated by Django 4.2.20 on 2026-10-18 10:26
+
+from django.db import migrations, models
+import django.core.serializers.json
+import django.db.models.deletion
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scout_agent', '0005_alter_companyprofile_url'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LeadScoutJob',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('running', 'Running'), ('success', 'Success'), ('error', 'Error')], default='pending', max_length=20)),
+                ('stage', models.CharField(blank=True, max_length=50, null=True)),
+                ('result', models.JSONField(blank=True, encoder=django.core.serializers.json.DjangoJSONEncoder, null=True)),
+                ('error', models.TextField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('started_at', models.DateTimeField(blank=True, null=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+                ('company', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='scout_jobs', to='scout_agent.companydata')),
+            ],
+            options={
+                'verbose_name': 'Lead Scout Job',
+                'verbose_name_plural': 'Lead Scout Jobs',
+            },
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 4.2.20 on 2026-10-18 10:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scout_agent', '0006_leadscoutjob'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='pdfanalysis',
+            name='content_hash',
+            field=models.CharField(blank=True, db_index=True, max_length=64, null=True),
+        ),
+        migrations.AddField(
+            model_name='pdfanalysis',
+            name='text_hash',
+            field=models.CharField(blank=True, db_index=True, max_length=64, null=True),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 4.2.20 on 2026-10-18 10:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scout_agent', '0007_pdfanalysis_content_hash'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='companyprofile',
+            name='pdf_etag',
+            field=models.CharField(blank=True, max_length=255, null=True),
+        ),
+        migrations.AddField(
+            model_name='companyprofile',
+            name='pdf_last_modified',
+            field=models.CharField(blank=True, max_length=64, null=True),
+        ),
+    ]
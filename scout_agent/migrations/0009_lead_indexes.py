@@ -0,0 +1,47 @@
+# Generated by Django 4.2.20 on 2026-10-18 10:35
+
+from django.db import migrations, models
+from django.db.models import Count, Max, Min
+
+
+def merge_duplicate_lead_prospects(apps, schema_editor):
+    """
+    유니크 제약을 걸기 전에 같은 (source_company, prospect_company) 쌍의 중복 행을 하나로 합칩니다.
+    가장 최근 행(id 최대)의 점수/근거를 남기고, created_at 은 가장 처음 발견한 시각으로 맞춥니다.
+    """
+    LeadProspect = apps.get_model('scout_agent', 'LeadProspect')
+    duplicates = (
+        LeadProspect.objects
+        .values('source_company_id', 'prospect_company_id')
+        .annotate(row_count=Count('id'), keep_id=Max('id'), first_created_at=Min('created_at'))
+        .filter(row_count__gt=1)
+    )
+    for group in duplicates:
+        LeadProspect.objects.filter(id=group['keep_id']).update(created_at=group['first_created_at'])
+        LeadProspect.objects.filter(
+            source_company_id=group['source_company_id'],
+            prospect_company_id=group['prospect_company_id'],
+        ).exclude(id=group['keep_id']).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scout_agent', '0008_companyprofile_pdf_validators'),
+    ]
+
+    operations = [
+        migrations.RunPython(merge_duplicate_lead_prospects, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='companydata',
+            index=models.Index(fields=['company'], name='companydata_company_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='leadprospect',
+            index=models.Index(fields=['source_company', '-relevance_score', '-id'], name='leadprospect_ranking_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='leadprospect',
+            constraint=models.UniqueConstraint(fields=('source_company', 'prospect_company'), name='unique_lead_prospect_pair'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.20 on 2026-10-18 10:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scout_agent', '0009_lead_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='leadprospect',
+            name='leadprospect_ranking_idx',
+        ),
+        migrations.AddIndex(
+            model_name='leadprospect',
+            index=models.Index(fields=['source_company', '-relevance_score', '-created_at', '-id'], name='leadprospect_ranking_idx'),
+        ),
+    ]
@@ -0,0 +1,136 @@
+# Generated by Django 4.2.20 on 2026-10-18 10:38
+
+import re
+import unicodedata
+
+from django.db import migrations, models
+
+# 이 마이그레이션 시점의 scout_agent.models.company_data.normalize_company_name 복사본
+# (이후 정규화 규칙이 바뀌어도 이 마이그레이션의 결과는 바뀌지 않도록 모델 코드를 import 하지 않음)
+_KOREAN_CORPORATE_MARKERS = re.compile(
+    r'\((주|유|사|재|합|합자|합명|유한|주식)\)'
+    r'|주식회사|유한책임회사|유한회사|합자회사|합명회사|사단법인|재단법인|농업회사법인|영농조합법인'
+)
+_ENGLISH_CORPORATE_SUFFIXES = re.compile(
+    r'(?:[\s,.]+(?:co\.?,?\s*ltd|co|inc|incorporated|corp|corporation|company|ltd|limited|llc|plc|gmbh)\.?)+$'
+)
+_NON_WORD = re.compile(r'[\W_]+')
+
+COMPANY_DATA_FIELDS = [
+    'industry', 'sales', 'total_funding', 'address', 'email',
+    'homepage', 'key_executive', 'logo_url', 'phone_number',
+]
+
+
+def normalize_company_name(name):
+    key = unicodedata.normalize('NFKC', name or '').lower().strip()
+    key = _KOREAN_CORPORATE_MARKERS.sub(' ', key)
+    key = _ENGLISH_CORPORATE_SUFFIXES.sub('', key)
+    return _NON_WORD.sub('', key)
+
+
+def fill_normalized_name(apps, schema_editor):
+    CompanyData = apps.get_model('scout_agent', 'CompanyData')
+    rows = list(CompanyData.objects.only('id', 'company'))
+    for company_data in rows:
+        company_data.normalized_name = normalize_company_name(company_data.company)
+    CompanyData.objects.bulk_update(rows, ['normalized_name'], batch_size=1000)
+
+
+def merge_lead_prospects(LeadProspect, duplicate_to_keep):
+    """
+    합쳐진 회사를 가리키는 리드를 남는 회사로 옮깁니다.
+    같은 (source_company, prospect_company) 쌍이 되면 0009 와 같이 가장 최근 행(id 최대)의 점수/근거를 남기고
+    created_at 은 가장 처음 발견한 시각으로 맞춥니다. 자기 자신을 가리키게 된 리드는 삭제합니다.
+    """
+    company_ids = set(duplicate_to_keep) | set(duplicate_to_keep.values())
+    leads = LeadProspect.objects.filter(
+        models.Q(source_company_id__in=company_ids) | models.Q(prospect_company_id__in=company_ids)
+    ).order_by('-id')
+
+    groups = {}
+    for lead in leads:
+        pair = (
+            duplicate_to_keep.get(lead.source_company_id, lead.source_company_id),
+            duplicate_to_keep.get(lead.prospect_company_id, lead.prospect_company_id),
+        )
+        groups.setdefault(pair, []).append(lead)
+
+    for (source_id, prospect_id), group in groups.items():
+        if source_id == prospect_id:
+            LeadProspect.objects.filter(id__in=[lead.id for lead in group]).delete()
+            continue
+        keep, *others = group
+        if not others and (keep.source_company_id, keep.prospect_company_id) == (source_id, prospect_id):
+            continue
+        # 유니크 제약에 걸리지 않도록 나머지 행을 먼저 삭제
+        LeadProspect.objects.filter(id__in=[lead.id for lead in others]).delete()
+        LeadProspect.objects.filter(id=keep.id).update(
+            source_company_id=source_id,
+            prospect_company_id=prospect_id,
+            created_at=min(lead.created_at for lead in group),
+        )
+
+
+def merge_duplicate_companies(apps, schema_editor):
+    """
+    normalized_name 이 같은 CompanyData 행을 가장 먼저 만든 행(id 최소)으로 합칩니다.
+    남는 행의 빈 항목은 다른 행의 최근 값으로 채우고, 프로필/PDF 분석본/작업/리드는 남는 행으로 옮깁니다.
+    """
+    CompanyData = apps.get_model('scout_agent', 'CompanyData')
+    CompanyProfile = apps.get_model('scout_agent', 'CompanyProfile')
+    PDFAnalysis = apps.get_model('scout_agent', 'PDFAnalysis')
+    LeadScoutJob = apps.get_model('scout_agent', 'LeadScoutJob')
+    LeadProspect = apps.get_model('scout_agent', 'LeadProspect')
+
+    duplicates = (
+        CompanyData.objects
+        .exclude(normalized_name='')
+        .values('normalized_name')
+        .annotate(row_count=models.Count('id'))
+        .filter(row_count__gt=1)
+        .values_list('normalized_name', flat=True)
+    )
+    duplicate_to_keep = {}
+    for normalized_name in duplicates:
+        keep, *others = CompanyData.objects.filter(normalized_name=normalized_name).order_by('id')
+        for other in sorted(others, key=lambda company_data: -company_data.id):
+            for field in COMPANY_DATA_FIELDS:
+                if getattr(keep, field) in (None, '') and getattr(other, field) not in (None, ''):
+                    setattr(keep, field, getattr(other, field))
+            duplicate_to_keep[other.id] = keep.id
+        keep.save(update_fields=COMPANY_DATA_FIELDS)
+
+    if not duplicate_to_keep:
+        return
+
+    for duplicate_id, keep_id in duplicate_to_keep.items():
+        for model in (CompanyProfile, PDFAnalysis, LeadScoutJob):
+            model.objects.filter(company_id=duplicate_id).update(company_id=keep_id)
+    merge_lead_prospects(LeadProspect, duplicate_to_keep)
+    CompanyData.objects.filter(id__in=list(duplicate_to_keep)).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scout_agent', '0010_leadprospect_ranking_created_at'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='companydata',
+            name='companydata_company_idx',
+        ),
+        migrations.AddField(
+            model_name='companydata',
+            name='normalized_name',
+            field=models.CharField(blank=True, default='', max_length=255),
+        ),
+        migrations.RunPython(fill_normalized_name, migrations.RunPython.noop),
+        migrations.RunPython(merge_duplicate_companies, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='companydata',
+            index=models.Index(fields=['normalized_name'], name='companydata_normalized_idx'),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 4.2.20 on 2026-10-18 10:40
+
+from django.db import migrations, models
+import django.db.models.deletion
+import rest_framework.utils.encoders
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scout_agent', '0011_companydata_normalized_name'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LeadScoutResult',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('fingerprint', models.CharField(max_length=64)),
+                ('result', models.JSONField(encoder=rest_framework.utils.encoders.JSONEncoder)),
+                ('created_at', models.DateTimeField()),
+                ('company', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='scout_result', to='scout_agent.companydata')),
+            ],
+            options={
+                'verbose_name': 'Lead Scout Result',
+                'verbose_name_plural': 'Lead Scout Results',
+            },
+        ),
+    ]
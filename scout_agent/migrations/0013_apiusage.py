@@ -0,0 +1,38 @@
+# Generated by Django 4.2.20 on 2026-10-18 10:57
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scout_agent', '0012_leadscoutresult'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='APIUsage',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('request_id', models.CharField(blank=True, max_length=64, null=True)),
+                ('operation', models.CharField(max_length=64)),
+                ('provider', models.CharField(choices=[('openai', 'OpenAI'), ('tavily', 'Tavily')], max_length=20)),
+                ('model', models.CharField(blank=True, default='', max_length=64)),
+                ('prompt_tokens', models.PositiveIntegerField(default=0)),
+                ('cached_tokens', models.PositiveIntegerField(default=0)),
+                ('completion_tokens', models.PositiveIntegerField(default=0)),
+                ('tool_calls', models.PositiveIntegerField(default=0)),
+                ('latency_ms', models.PositiveIntegerField(default=0)),
+                ('cost', models.DecimalField(decimal_places=6, default=0, max_digits=12)),
+                ('success', models.BooleanField(default=True)),
+                ('company', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='api_usages', to='scout_agent.companydata')),
+            ],
+            options={
+                'verbose_name': 'API Usage',
+                'verbose_name_plural': 'API Usage',
+                'indexes': [models.Index(fields=['created_at'], name='apiusage_created_idx'), models.Index(fields=['request_id'], name='apiusage_request_idx'), models.Index(fields=['company', 'created_at'], name='apiusage_company_idx')],
+            },
+        ),
+    ]
@@ -2,10 +2,16 @@ from .company_data import CompanyData
 from .lead_prospect import LeadProspect
 from .company_profile import CompanyProfile
 from .pdf_analysis import PDFAnalysis
+from .lead_scout_job import LeadScoutJob
+from .lead_scout_result import LeadScoutResult
+from .api_usage import APIUsage
 
 __all__ = [
     'CompanyData',
     'LeadProspect',
     'CompanyProfile',
     'PDFAnalysis',
+    'LeadScoutJob',
+    'LeadScoutResult',
+    'APIUsage',
 ]
@@ -0,0 +1,46 @@
+from django.db import models
+
+from scout_agent.models import CompanyData
+
+
+class APIUsage(models.Model):
+    """OpenAI/Tavily 호출 1건의 토큰 사용량, 응답 시간, 예상 비용. 캐시 적중은 호출이 아니므로 기록하지 않습니다."""
+    PROVIDER_OPENAI = 'openai'
+    PROVIDER_TAVILY = 'tavily'
+    PROVIDER_CHOICES = [
+        (PROVIDER_OPENAI, 'OpenAI'),
+        (PROVIDER_TAVILY, 'Tavily'),
+    ]
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    # 호출을 일으킨 API 요청의 X-Request-ID (비동기 작업은 작업을 등록한 요청의 ID)
+    request_id = models.CharField(max_length=64, null=True, blank=True)
+    company = models.ForeignKey(
+        CompanyData, on_delete=models.SET_NULL, null=True, blank=True, related_name='api_usages'
+    )
+    # 호출한 코드 경로 (예: find_leads, analyze_pdf, lead_details)
+    operation = models.CharField(max_length=64)
+    provider = models.CharField(max_length=20, choices=PROVIDER_CHOICES)
+    model = models.CharField(max_length=64, blank=True, default='')
+    prompt_tokens = models.PositiveIntegerField(default=0)
+    # prompt_tokens 중 OpenAI 프롬프트 캐시에서 처리된 토큰 (할인 단가 적용)
+    cached_tokens = models.PositiveIntegerField(default=0)
+    completion_tokens = models.PositiveIntegerField(default=0)
+    # Responses API 웹 검색 도구 호출 수 / Tavily 검색 크레딧
+    tool_calls = models.PositiveIntegerField(default=0)
+    latency_ms = models.PositiveIntegerField(default=0)
+    cost = models.DecimalField(max_digits=12, decimal_places=6, default=0)
+    success = models.BooleanField(default=True)
+
+    class Meta:
+        verbose_name = 'API Usage'
+        verbose_name_plural = 'API Usage'
+        indexes = [
+            # 일 예산 합계 / 기간별 리포트
+            models.Index(fields=['created_at'], name='apiusage_created_idx'),
+            models.Index(fields=['request_id'], name='apiusage_request_idx'),
+            models.Index(fields=['company', 'created_at'], name='apiusage_company_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.operation} {self.provider}:{self.model} ${self.cost}"
@@ -1,9 +1,37 @@
+import re
+import unicodedata
+
 from django.db import models
 
+# 회사명 앞뒤/괄호 안에 붙는 법인 형태 표기 (NFKC 정규화 + 소문자 변환 후 기준)
+_KOREAN_CORPORATE_MARKERS = re.compile(
+    r'\((주|유|사|재|합|합자|합명|유한|주식)\)'
+    r'|주식회사|유한책임회사|유한회사|합자회사|합명회사|사단법인|재단법인|농업회사법인|영농조합법인'
+)
+_ENGLISH_CORPORATE_SUFFIXES = re.compile(
+    r'(?:[\s,.]+(?:co\.?,?\s*ltd|co|inc|incorporated|corp|corporation|company|ltd|limited|llc|plc|gmbh)\.?)+$'
+)
+_NON_WORD = re.compile(r'[\W_]+')
+
+
+def normalize_company_name(name):
+    """
+    회사명 비교용 키를 만듭니다.
+    전각/반각과 대소문자를 통일하고, (주)/주식회사/Inc./Co., Ltd. 등 법인 형태 표기와 문장 부호, 공백을 제거합니다.
+    예: "(주)가나다", "주식회사 가나다", "가나다 Inc." -> "가나다"
+    """
+    key = unicodedata.normalize('NFKC', name or '').lower().strip()
+    key = _KOREAN_CORPORATE_MARKERS.sub(' ', key)
+    key = _ENGLISH_CORPORATE_SUFFIXES.sub('', key)
+    return _NON_WORD.sub('', key)
+
+
 class CompanyData(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     company = models.CharField(max_length=255)
+    # normalize_company_name(company) - 같은 회사의 표기 차이로 중복 행이 생기지 않도록 조회에 사용
+    normalized_name = models.CharField(max_length=255, blank=True, default='')
     industry = models.CharField(max_length=255, null=True, blank=True)
     sales = models.DecimalField(max_digits=15, decimal_places=2, null=True, blank=True)
     total_funding = models.DecimalField(max_digits=15, decimal_places=2, null=True, blank=True)
@@ -14,8 +42,19 @@ class CompanyData(models.Model):
     logo_url = models.URLField(null=True, blank=True)
     phone_number = models.CharField(max_length=50, null=True, blank=True)
 
+    def save(self, *args, **kwargs):
+        self.normalized_name = normalize_company_name(self.company)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'company' in update_fields:
+            kwargs['update_fields'] = set(update_fields) | {'normalized_name'}
+        super().save(*args, **kwargs)
+
     def __str__(self):
         return self.company
 
     class Meta:
-        verbose_name_plural = "Company Data"
\ No newline at end of file
+        verbose_name_plural = "Company Data"
+        indexes = [
+            # 리드 저장 시 정규화한 회사 이름으로 기존 레코드를 찾는 조회용
+            models.Index(fields=['normalized_name'], name='companydata_normalized_idx'),
+        ]
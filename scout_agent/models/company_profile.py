@@ -6,6 +6,9 @@ class CompanyProfile(models.Model):
     company = models.ForeignKey(CompanyData, on_delete=models.CASCADE, related_name='profiles')
     file_name = models.CharField(max_length=255)
     url = models.URLField(max_length=1000)
+    # 마지막으로 분석한 PDF 의 HTTP 캐시 검증자 (조건부 GET 용)
+    pdf_etag = models.CharField(max_length=255, null=True, blank=True)
+    pdf_last_modified = models.CharField(max_length=64, null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
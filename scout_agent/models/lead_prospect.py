@@ -11,4 +11,20 @@ class LeadProspect(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
 
     def __str__(self):
-        return f"{self.source_company.company} → {self.prospect_company.company}"
\ No newline at end of file
+        return f"{self.source_company.company} → {self.prospect_company.company}"
+
+    class Meta:
+        constraints = [
+            # (소스 회사, 리드 회사) 쌍은 하나의 관계만 가짐 - upsert 조회에도 이 인덱스를 사용
+            models.UniqueConstraint(
+                fields=['source_company', 'prospect_company'],
+                name='unique_lead_prospect_pair',
+            ),
+        ]
+        indexes = [
+            # 소스 회사별 리드를 관련도 순으로 정렬하는 랭킹 조회용
+            models.Index(
+                fields=['source_company', '-relevance_score', '-created_at', '-id'],
+                name='leadprospect_ranking_idx',
+            ),
+        ]
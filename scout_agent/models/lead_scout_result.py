@@ -0,0 +1,21 @@
+from django.db import models
+from rest_framework.utils.encoders import JSONEncoder
+
+from scout_agent.models import CompanyData
+
+
+class LeadScoutResult(models.Model):
+    """소스 회사별 마지막 리드 검색 결과. 입력(fingerprint)이 같고 TTL 이내면 LLM 을 다시 호출하지 않고 재사용합니다."""
+    company = models.OneToOneField(CompanyData, on_delete=models.CASCADE, related_name='scout_result')
+    # 프롬프트 입력(CompanyData 항목 + 사용한 PDFAnalysis 의 updated_at)의 SHA-256
+    fingerprint = models.CharField(max_length=64)
+    # API 응답과 같은 형식(Decimal -> float)으로 저장
+    result = models.JSONField(encoder=JSONEncoder)
+    created_at = models.DateTimeField()
+
+    class Meta:
+        verbose_name = 'Lead Scout Result'
+        verbose_name_plural = 'Lead Scout Results'
+
+    def __str__(self):
+        return f"{self.company.company} - {self.fingerprint[:12]}"
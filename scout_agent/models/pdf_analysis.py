@@ -25,6 +25,10 @@ class PDFAnalysis(models.Model):
     strengths = models.TextField(null=True, blank=True)
     business_model = models.TextField(null=True, blank=True)
 
+    # 중복 분석 방지용 해시 (PDF 원본 바이트 / LLM 에 전달한 추출 텍스트의 SHA-256)
+    content_hash = models.CharField(max_length=64, null=True, blank=True, db_index=True)
+    text_hash = models.CharField(max_length=64, null=True, blank=True, db_index=True)
+
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -11,3 +11,11 @@ def post_pdf_analysis(company, profile, defaults):
 
 def get_pdf_analysis_by_company_id(company_id):
     return PDFAnalysis.objects.filter(company_id=company_id)
+
+
+def get_pdf_analysis_by_content_hash(content_hash):
+    return PDFAnalysis.objects.filter(content_hash=content_hash).order_by('-updated_at')
+
+
+def get_pdf_analysis_by_text_hash(text_hash):
+    return PDFAnalysis.objects.filter(text_hash=text_hash).order_by('-updated_at')
@@ -0,0 +1,40 @@
+from django.db.models import Count, Max, Sum
+
+from ..models import APIUsage
+
+
+def bulk_create_api_usages(rows):
+    """APIUsage 인스턴스 목록을 한 번의 INSERT 로 저장합니다."""
+    return APIUsage.objects.bulk_create(rows)
+
+
+def get_api_cost_since(since):
+    """since 이후 호출의 예상 비용 합계 (Decimal)"""
+    return APIUsage.objects.filter(created_at__gte=since).aggregate(total=Sum('cost'))['total'] or 0
+
+
+def get_api_usage_summary(since, group_by=('operation', 'provider', 'model')):
+    """since 이후 호출을 group_by 항목별로 합산해 비용이 큰 순으로 반환합니다."""
+    return (
+        APIUsage.objects.filter(created_at__gte=since)
+        .values(*group_by)
+        .annotate(
+            calls=Count('id'),
+            prompt_tokens=Sum('prompt_tokens'),
+            cached_tokens=Sum('cached_tokens'),
+            completion_tokens=Sum('completion_tokens'),
+            latency_ms=Sum('latency_ms'),
+            cost=Sum('cost'),
+        )
+        .order_by('-cost')
+    )
+
+
+def get_costliest_requests(since, limit=10):
+    """since 이후 요청(request_id)별 비용 합계 상위 limit 개"""
+    return (
+        APIUsage.objects.filter(created_at__gte=since, request_id__isnull=False)
+        .values('request_id')
+        .annotate(company=Max('company__company'), calls=Count('id'), cost=Sum('cost'))
+        .order_by('-cost')[:limit]
+    )
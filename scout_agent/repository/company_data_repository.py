@@ -1,7 +1,84 @@
+from django.db.models import Q
+from django.utils import timezone
+
 from ..models import CompanyData
+from ..models.company_data import normalize_company_name
 
 def get_company_data_by_id(company_id):
     return CompanyData.objects.get(id=company_id)
 
 def create_or_update_company_data(company_name, defaults):
-    return CompanyData.objects.update_or_create(company=company_name, defaults=defaults)
\ No newline at end of file
+    """정규화한 회사 이름(normalized_name)이 같은 기존 레코드를 갱신하고, 없으면 생성합니다."""
+    key = normalize_company_name(company_name)
+    company_data = CompanyData.objects.filter(normalized_name=key).order_by('id').first() if key else None
+    if company_data is None:
+        return CompanyData.objects.create(company=company_name, **defaults), True
+    return update_company_data(company_data, defaults), False
+
+def update_company_data(company_data, defaults):
+    for field, value in defaults.items():
+        setattr(company_data, field, value)
+    company_data.save(update_fields=list(defaults.keys()) + ['updated_at'])
+    return company_data
+
+def bulk_upsert_company_data(rows, matched_ids=None):
+    """
+    회사 이름별 defaults({company_name: defaults})를 일괄 생성/수정합니다.
+    matched_ids({company_name: company_id})로 이미 찾아 둔 회사가 있으면 그 행을 갱신하고,
+    나머지는 정규화한 이름이 같은 기존 행을 갱신하거나 새로 만듭니다.
+    행 수와 무관하게 조회 2회 + bulk_create 1회 + bulk_update 1회로 처리합니다.
+
+    Returns:
+        dict: {company_name: CompanyData} (같은 회사로 판단된 이름들은 같은 객체)
+    """
+    if not rows:
+        return {}
+
+    matched_ids = matched_ids or {}
+    keys = {name: normalize_company_name(name) for name in rows}
+
+    by_id = {}
+    by_key = {}
+    existing = CompanyData.objects.filter(
+        Q(id__in=set(matched_ids.values())) | Q(normalized_name__in=set(keys.values()))
+    ).order_by('id')
+    for company_data in existing:
+        by_id[company_data.id] = company_data
+        by_key.setdefault(company_data.normalized_name, company_data)
+
+    resolved = {}
+    to_update = {}
+    to_create = {}
+    for name, defaults in rows.items():
+        company_data = by_id.get(matched_ids.get(name)) or by_key.get(keys[name])
+        if company_data is None:
+            company_data = to_create.get(keys[name])
+            if company_data is None:
+                company_data = CompanyData(company=name, normalized_name=normalize_company_name(name))
+                to_create[keys[name]] = company_data
+        else:
+            to_update[company_data.id] = company_data
+        for field, value in defaults.items():
+            setattr(company_data, field, value)
+        resolved[name] = company_data
+
+    if to_update:
+        fields = list(next(iter(rows.values())).keys()) + ['updated_at']
+        now = timezone.now()
+        for company_data in to_update.values():
+            company_data.updated_at = now
+        CompanyData.objects.bulk_update(list(to_update.values()), fields)
+
+    if to_create:
+        CompanyData.objects.bulk_create(list(to_create.values()))
+        # MySQL 은 bulk_create 후 PK 를 돌려주지 않으므로 다시 조회
+        created = {}
+        for company_data in CompanyData.objects.filter(
+            normalized_name__in=[company_data.normalized_name for company_data in to_create.values()]
+        ).order_by('id'):
+            created.setdefault(company_data.normalized_name, company_data)
+        for name, company_data in resolved.items():
+            if company_data.pk is None:
+                resolved[name] = created[company_data.normalized_name]
+
+    return resolved
@@ -1,4 +1,27 @@
-from ..models import CompanyProfile
+from django.db.models import Prefetch
+
+from ..models import CompanyProfile, PDFAnalysis
 
 def get_company_profile_by_company(company):
-    return CompanyProfile.objects.filter(company=company)
\ No newline at end of file
+    return CompanyProfile.objects.filter(company=company)
+
+def get_company_profiles_with_analyses(company):
+    """
+    회사의 프로필 목록과 각 프로필의 (해당 회사) PDF 분석본을 함께 조회합니다.
+    분석본은 profile.company_analyses 리스트로 prefetch 되어 프로필 수와 무관하게 쿼리 2회로 끝납니다.
+    """
+    return CompanyProfile.objects.filter(company=company).select_related('company').prefetch_related(
+        Prefetch(
+            'analyses',
+            queryset=PDFAnalysis.objects.filter(company=company),
+            to_attr='company_analyses',
+        )
+    )
+
+
+def get_company_profiles_by_ids(profile_ids):
+    return CompanyProfile.objects.filter(id__in=profile_ids).select_related('company')
+
+
+def get_company_profiles_without_analysis():
+    return CompanyProfile.objects.filter(analyses__isnull=True).select_related('company')
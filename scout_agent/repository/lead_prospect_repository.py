@@ -1,8 +1,87 @@
+from django.db import connection
+from django.db.models import Q
+
 from ..models import LeadProspect
 
+# 리드 랭킹 정렬 순서 (leadprospect_ranking_idx 와 같은 순서)
+LEAD_RANKING_ORDER = ('-relevance_score', '-created_at', '-id')
+
+def get_ranked_lead_prospects(source_company_id, after=None, only_fields=None):
+    """
+    소스 회사의 리드를 관련도 -> 발견 시각 -> id 내림차순으로 조회합니다.
+
+    Args:
+        after: 이전 페이지 마지막 행의 (relevance_score, created_at, id). 주어지면 그 다음 행부터 조회 (keyset)
+        only_fields: 읽어올 컬럼 목록 (prospect_company__ 접두어로 리드 회사 컬럼 지정)
+    """
+    queryset = LeadProspect.objects.filter(source_company_id=source_company_id).select_related('prospect_company')
+    if after is not None:
+        score, created_at, last_id = after
+        queryset = queryset.filter(
+            Q(relevance_score__lt=score)
+            | Q(relevance_score=score, created_at__lt=created_at)
+            | Q(relevance_score=score, created_at=created_at, id__lt=last_id)
+        )
+    if only_fields:
+        queryset = queryset.only(*only_fields)
+    return queryset.order_by(*LEAD_RANKING_ORDER)
+
+
 def create_or_update_prospect_data(company, prospect, defaults):
     return LeadProspect.objects.update_or_create(
         source_company=company,
         prospect_company=prospect,
         defaults=defaults
-    )
\ No newline at end of file
+    )
+
+
+def bulk_upsert_prospect_data(company, rows):
+    """
+    소스 회사의 리드 관계({prospect_id: defaults})를 일괄 생성/수정합니다.
+    행 수와 무관하게 조회 최대 2회 + bulk_create 1회 + bulk_update 1회로 처리합니다.
+
+    Returns:
+        dict: {prospect_id: LeadProspect}
+    """
+    if not rows:
+        return {}
+
+    prospect_ids = list(rows.keys())
+    existing = {
+        relation.prospect_company_id: relation
+        for relation in LeadProspect.objects.filter(source_company=company, prospect_company_id__in=prospect_ids)
+    }
+
+    to_update = []
+    to_create = []
+    for prospect_id, defaults in rows.items():
+        relation = existing.get(prospect_id)
+        if relation is None:
+            to_create.append(LeadProspect(source_company=company, prospect_company_id=prospect_id, **defaults))
+            continue
+        for field, value in defaults.items():
+            setattr(relation, field, value)
+        to_update.append(relation)
+
+    if to_update:
+        LeadProspect.objects.bulk_update(to_update, list(next(iter(rows.values())).keys()))
+
+    if to_create:
+        # 동시에 같은 리드를 저장한 다른 요청이 있어도 unique_lead_prospect_pair 충돌 시 갱신으로 처리
+        # (MySQL 은 ON DUPLICATE KEY UPDATE 로 충돌 대상을 지정하지 않음)
+        conflict_target = {}
+        if connection.features.supports_update_conflicts_with_target:
+            conflict_target['unique_fields'] = ['source_company', 'prospect_company']
+        LeadProspect.objects.bulk_create(
+            to_create,
+            update_conflicts=True,
+            update_fields=list(next(iter(rows.values())).keys()),
+            **conflict_target,
+        )
+        created_ids = [relation.prospect_company_id for relation in to_create]
+        for relation in LeadProspect.objects.filter(source_company=company, prospect_company_id__in=created_ids):
+            existing[relation.prospect_company_id] = relation
+
+    for relation in to_update:
+        existing[relation.prospect_company_id] = relation
+    return {prospect_id: existing[prospect_id] for prospect_id in prospect_ids}
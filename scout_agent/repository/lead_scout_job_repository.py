@@ -0,0 +1,34 @@
+from django.db.models import Q
+from django.utils import timezone
+
+from ..models import LeadScoutJob
+
+
+def create_lead_scout_job(company):
+    return LeadScoutJob.objects.create(company=company)
+
+
+def get_lead_scout_job_by_id(job_id):
+    return LeadScoutJob.objects.get(id=job_id)
+
+
+def update_lead_scout_job(job_id, **fields):
+    return LeadScoutJob.objects.filter(id=job_id).update(updated_at=timezone.now(), **fields)
+
+
+def fail_stale_lead_scout_jobs(created_before, started_before, error, job_id=None):
+    """
+    created_before 이전에 만들어지고 아직 pending 이거나, started_before 이전에 시작해 아직 running 인 작업을
+    error 로 바꿉니다. job_id 가 주어지면 그 작업만 확인합니다.
+
+    Returns:
+        int: 바뀐 작업 수
+    """
+    jobs = LeadScoutJob.objects.filter(
+        Q(status=LeadScoutJob.STATUS_PENDING, created_at__lt=created_before)
+        | Q(status=LeadScoutJob.STATUS_RUNNING, started_at__lt=started_before)
+    )
+    if job_id is not None:
+        jobs = jobs.filter(id=job_id)
+    now = timezone.now()
+    return jobs.update(status=LeadScoutJob.STATUS_ERROR, error=error, finished_at=now, updated_at=now)
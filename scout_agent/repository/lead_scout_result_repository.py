@@ -0,0 +1,14 @@
+from django.utils import timezone
+
+from ..models import LeadScoutResult
+
+
+def get_lead_scout_result(company):
+    return LeadScoutResult.objects.filter(company=company).first()
+
+
+def save_lead_scout_result(company, fingerprint, result):
+    return LeadScoutResult.objects.update_or_create(
+        company=company,
+        defaults={'fingerprint': fingerprint, 'result': result, 'created_at': timezone.now()},
+    )
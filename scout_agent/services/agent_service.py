@@ -1,19 +1,45 @@
 # services/agent_service.py
+import hashlib
+import json
+from decimal import Decimal, InvalidOperation
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from .metrics import record_cache
 from .openai_service import OpenAIService
 from .pdf_service import PDFAnalysisService
+from .rate_limiter import RateLimitRetriesExhausted
+from .tracing import StageTimer
+from .usage_service import BudgetExceeded, usage_scope
 from scout_agent.models import CompanyData
-from ..repository.PDFAnalysis_repository import get_pdf_analysis_by_company_and_profile
-from ..repository.company_data_repository import get_company_data_by_id, create_or_update_company_data
-from ..repository.company_profile_repository import get_company_profile_by_company
-from ..repository.lead_prospect_repository import create_or_update_prospect_data
+from scout_agent.models.company_data import normalize_company_name
+from .company_resolver import get_company_name_index
+from ..repository.company_data_repository import get_company_data_by_id, bulk_upsert_company_data
+from ..repository.company_profile_repository import get_company_profiles_with_analyses
+from ..repository.lead_prospect_repository import bulk_upsert_prospect_data
+from ..repository.lead_scout_result_repository import get_lead_scout_result, save_lead_scout_result
 
 
 class LeadScoutAgent:
-    def __init__(self):
+    STAGE_LOADING_COMPANY = 'loading_company'
+    STAGE_ANALYZING_PDFS = 'analyzing_pdfs'
+    STAGE_GENERATING_LEADS = 'generating_leads'
+    STAGE_SAVING_LEADS = 'saving_leads'
+
+    # 결과 캐시 fingerprint 에 포함하는 소스 회사 항목 (리드 생성 프롬프트에 들어가는 값)
+    FINGERPRINT_FIELDS = (
+        'company', 'industry', 'sales', 'total_funding', 'homepage',
+        'key_executive', 'address', 'email', 'phone_number',
+    )
+
+    def __init__(self, cache_ttl=None):
         self.openai_service = OpenAIService()
         self.pdf_service = PDFAnalysisService()
+        self.cache_ttl = settings.LEAD_SCOUT_CACHE_TTL if cache_ttl is None else cache_ttl
 
-    def find_potential_leads(self, company_id):
+    def find_potential_leads(self, company_id, progress=None, refresh=False):
         """
         주어진 회사 ID를 기반으로 잠재적인 리드를 찾고 저장합니다.
 
@@ -21,33 +47,65 @@ class LeadScoutAgent:
         2. PDF 프로필이 있으면 분석본이 있는지 확인
         3. 분석본이 있으면 바로 사용, 없으면 분석 생성
         4. 수집된 정보를 바탕으로 OpenAI의 웹서치 도구를 활용하여 잠재적 리드를 생성
+
+        progress가 주어지면 각 단계 시작 시 단계 이름(STAGE_*)으로 호출합니다.
+        각 단계의 소요 시간은 find_leads.<단계> span 으로 기록합니다.
+
+        소스 회사 정보와 PDF 분석본이 마지막 검색 때와 같고 cache_ttl 이내이면 저장된 결과를 반환합니다.
+        refresh=True 이면 저장된 결과를 무시하고 다시 검색합니다. 응답의 cache 항목에 적중 여부가 담깁니다.
+
+        외부 API 호출 수와 예상 비용은 usage 항목에 담깁니다. 요청/일 비용 한도에 도달하면 더 호출하지 않고
+        저장된 이전 결과(fingerprint, TTL 과 무관)를 cache.stale=True 로 반환하며, 없으면 오류를 반환합니다.
+        두 경우 모두 budget_exceeded=True 입니다.
         """
+        with usage_scope('find_leads', company_id) as usage:
+            result = self._find_potential_leads(company_id, progress, refresh)
+        result["usage"] = usage.summary()
+        return result
+
+    def _find_potential_leads(self, company_id, progress, refresh):
+        stages = StageTimer('find_leads')
+
+        def report(stage):
+            stages.start(stage)
+            if progress:
+                progress(stage)
+
+        source_company = None
         try:
             print(f"리드 검색 시작: company_id={company_id}")
+            report(self.STAGE_LOADING_COMPANY)
 
             # 소스 회사 정보 가져오기
             source_company = get_company_data_by_id(company_id)
             print(f"소스 회사: {source_company.company}")
 
-            # 회사에 대한 PDF 프로필이 있는지 확인
-            company_profiles = get_company_profile_by_company(source_company)
+            # 회사에 대한 PDF 프로필과 기존 분석본을 한 번에 조회 (프로필 1회 + 분석본 1회 쿼리)
+            company_profiles = list(get_company_profiles_with_analyses(source_company))
+
+            # 모든 프로필에 분석본이 있으면 입력이 확정되므로 저장된 결과 재사용 여부를 먼저 확인
+            fingerprint = self._fingerprint(source_company, company_profiles)
+            if fingerprint and self.cache_ttl and not refresh:
+                cached = self._cached_result(source_company, fingerprint)
+                record_cache('lead_scout_result', hit=cached is not None)
+                if cached:
+                    return cached
+
             pdf_analyses = []
 
-            if company_profiles.exists():
-                print(f"PDF 프로필 발견: {company_profiles.count()}개")
-                
+            if company_profiles:
+                print(f"PDF 프로필 발견: {len(company_profiles)}개")
+                report(self.STAGE_ANALYZING_PDFS)
+
                 for profile in company_profiles:
                     try:
                         # 기존 분석본 확인
-                        existing_analysis = get_pdf_analysis_by_company_and_profile(
-                            source_company,
-                            profile
-                        ).first()
-                        
+                        existing_analysis = profile.company_analyses[0] if profile.company_analyses else None
+
                         if existing_analysis:
                             print(f"기존 PDF 분석본 사용: {profile.url}")
                             pdf_analyses.append({
-                                'company': profile.company,
+                                'company': source_company,
                                 'profile': profile,
                                 'industry': existing_analysis.industry,
                                 'sales': existing_analysis.sales,
@@ -66,11 +124,11 @@ class LeadScoutAgent:
                             })
                         else:
                             print(f"새로운 PDF 분석 생성: {profile.url}")
-                            
+
                             analysis = self.pdf_service.analyze_company_pdf(profile)
                             if analysis:
                                 pdf_analyses.append({
-                                    'company': profile.company,
+                                    'company': source_company,
                                     'profile': profile,
                                     'industry': analysis.get('industry'),
                                     'sales': analysis.get('sales'),
@@ -87,6 +145,8 @@ class LeadScoutAgent:
                                     'strengths': analysis.get('strengths'),
                                     'business_model': analysis.get('business_model')
                                 })
+                    except (BudgetExceeded, RateLimitRetriesExhausted):
+                        raise
                     except Exception as e:
                         print(f"PDF 처리 중 오류: {e}")
 
@@ -104,6 +164,7 @@ class LeadScoutAgent:
             }
 
             # OpenAI 서비스를 통해 잠재적인 리드 생성
+            report(self.STAGE_GENERATING_LEADS)
             has_pdf = len(pdf_analyses) > 0
             leads_data = self.openai_service.generate_potential_leads(
                 source_company, 
@@ -113,76 +174,208 @@ class LeadScoutAgent:
 
             if not leads_data:
                 print("OpenAI 응답이 비어있습니다")
+                stages.stop('error')
                 return {"status": "error", "message": "Failed to generate leads - empty response"}
 
             # leads 키가 있는지 확인
             if 'leads' not in leads_data:
                 print("'leads' 키를 찾을 수 없습니다")
+                stages.stop('error')
                 return {"status": "error", "message": "Invalid response format - 'leads' key not found"}
 
             # 각 리드에 대해 처리
             print(f"총 {len(leads_data['leads'])}개의 리드 처리 시작")
-            created_leads = []
+            report(self.STAGE_SAVING_LEADS)
 
+            # 회사명 인덱스로 기존 회사를 찾아 같은 회사로 판단되는 리드는 하나로 합침 (마지막 값 사용)
+            name_index = get_company_name_index()
+            company_rows = {}
+            prospect_rows = {}
+            matched_ids = {}
+            names_by_identity = {}
             for lead in leads_data['leads']:
-                try:
-                    # 회사 이름으로 기존 레코드 확인
-                    company_name = lead.get('company', 'Unknown')
-                    print(f"리드 처리 중: {company_name}")
-
-                    prospect, created = create_or_update_company_data(
-                        company_name,
-                        {
-                            'industry': lead.get('industry'),
-                            'sales': lead.get('sales'),
-                            'total_funding': lead.get('total_funding'),
-                            'homepage': lead.get('homepage'),
-                            'key_executive': lead.get('key_executive'),
-                            'address': lead.get('address'),
-                            'email': lead.get('email'),
-                            'phone_number': lead.get('phone_number')
-                        }
-                    )
-
-                    # 리드 관계 생성 또는 업데이트
-                    lead_relation, relation_created = create_or_update_prospect_data(
-                        source_company,
-                        prospect,
-                        {
-                            'relevance_score': lead.get('relevance_score', 0.0),
-                            'reasoning': lead.get('reasoning', '')
-                        }
-                    )
+                if not isinstance(lead, dict):
+                    print(f"리드 형식 오류로 건너뜀: {lead!r}")
+                    continue
+                company_name = lead.get('company') or 'Unknown'
+                key = normalize_company_name(company_name)
+                if not key:
+                    print(f"회사명을 알 수 없는 리드 건너뜀: {company_name!r}")
+                    continue
+                print(f"리드 처리 중: {company_name}")
 
-                    created_leads.append({
-                        'company': prospect.company,
-                        'industry': prospect.industry,
-                        'sales': prospect.sales,
-                        'total_funding': prospect.total_funding,
-                        'homepage': prospect.homepage,
-                        'key_executive': prospect.key_executive,
-                        'relevance_score': lead_relation.relevance_score,
-                        'reasoning': lead_relation.reasoning
-                    })
-
-                except Exception as e:
-                    print(f"리드 처리 중 오류: {e}")
+                match = name_index.resolve(company_name)
+                if match and match[0] == source_company.id:
+                    print(f"소스 회사와 같은 회사로 판단되어 건너뜀: {company_name}")
                     continue
+                identity = ('id', match[0]) if match else ('name', key)
+                if match:
+                    matched_ids[company_name] = match[0]
+                    if match[1] < 1.0:
+                        print(f"유사 회사명 매칭: {company_name} -> company_id={match[0]} (score={match[1]:.2f})")
+
+                # 같은 회사가 다른 표기로 다시 나오면 이전 행을 대체
+                previous_name = names_by_identity.pop(identity, None)
+                if previous_name is not None:
+                    company_rows.pop(previous_name, None)
+                    prospect_rows.pop(previous_name, None)
+                names_by_identity[identity] = company_name
+
+                company_rows[company_name] = {
+                    'industry': lead.get('industry'),
+                    'sales': self._to_decimal(lead.get('sales')),
+                    'total_funding': self._to_decimal(lead.get('total_funding')),
+                    'homepage': lead.get('homepage'),
+                    'key_executive': lead.get('key_executive'),
+                    'address': lead.get('address'),
+                    'email': lead.get('email'),
+                    'phone_number': lead.get('phone_number')
+                }
+                prospect_rows[company_name] = {
+                    'relevance_score': self._to_float(lead.get('relevance_score')),
+                    'reasoning': lead.get('reasoning', '')
+                }
+
+            # 회사 데이터와 리드 관계를 하나의 트랜잭션에서 일괄 저장
+            with transaction.atomic():
+                prospects = bulk_upsert_company_data(company_rows, matched_ids=matched_ids)
+                relations = bulk_upsert_prospect_data(
+                    source_company,
+                    {prospects[name].id: defaults for name, defaults in prospect_rows.items()}
+                )
+
+            created_leads = []
+            for company_name, prospect in prospects.items():
+                if company_name not in matched_ids:
+                    name_index.add(prospect.id, prospect.company)
+                lead_relation = relations[prospect.id]
+                created_leads.append({
+                    'company': prospect.company,
+                    'industry': prospect.industry,
+                    'sales': prospect.sales,
+                    'total_funding': prospect.total_funding,
+                    'homepage': prospect.homepage,
+                    'key_executive': prospect.key_executive,
+                    'relevance_score': lead_relation.relevance_score,
+                    'reasoning': lead_relation.reasoning
+                })
 
             print(f"총 {len(created_leads)}개의 리드 처리 완료")
-            return {
+            result = {
                 "status": "success",
                 "message": f"Found {len(created_leads)} potential leads",
                 "source_used": "pdf_analysis" if pdf_analyses else "web_search",
                 "leads": created_leads
             }
+            if self.cache_ttl:
+                if fingerprint is None:
+                    # 이번 검색에서 새로 만든 분석본까지 반영한 입력으로 fingerprint 계산
+                    # (PDF 분석이 소스 회사 항목을 갱신했으므로 DB 값으로 다시 읽음)
+                    source_company.refresh_from_db(fields=list(self.FINGERPRINT_FIELDS))
+                    fingerprint = self._fingerprint(
+                        source_company, list(get_company_profiles_with_analyses(source_company))
+                    )
+                if fingerprint:
+                    save_lead_scout_result(source_company, fingerprint, result)
+            result["cache"] = {"hit": False, "fingerprint": fingerprint}
+            return result
 
         except CompanyData.DoesNotExist:
             print(f"회사 ID {company_id}를 찾을 수 없습니다")
+            stages.stop('error')
             return {"status": "error", "message": "Source company not found"}
+        except RateLimitRetriesExhausted as e:
+            print(f"OpenAI 호출 한도 초과: {e}")
+            stages.stop('error')
+            return {"status": "error", "message": str(e), "rate_limited": True}
+        except BudgetExceeded as e:
+            print(f"외부 API 비용 한도 초과: {e}")
+            stages.stop('error')
+            return self._stale_result(source_company, str(e))
         except Exception as e:
             print(f"예상치 못한 오류: {e}")
+            stages.stop('error')
             return {"status": "error", "message": str(e)}
+        finally:
+            stages.stop()
+
+    def _fingerprint(self, source_company, company_profiles):
+        """
+        리드 생성 입력(소스 회사 항목, 사용한 PDF 분석본의 updated_at, 모델)의 SHA-256 을 반환합니다.
+        분석본이 없는 프로필이 있으면 입력이 아직 확정되지 않았으므로 None 을 반환합니다.
+        """
+        analyses = []
+        for profile in company_profiles:
+            if not profile.company_analyses:
+                return None
+            analysis = profile.company_analyses[0]
+            analyses.append([profile.id, analysis.id, analysis.updated_at.isoformat()])
+
+        payload = {
+            "model": self.openai_service.LEADS_MODEL,
+            "company": {field: getattr(source_company, field) for field in self.FINGERPRINT_FIELDS},
+            "analyses": sorted(analyses),
+        }
+        raw = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _cached_result(self, source_company, fingerprint):
+        """fingerprint 가 같고 cache_ttl 이내인 저장된 결과를 cache 메타데이터와 함께 반환합니다."""
+        stored = get_lead_scout_result(source_company)
+        if stored is None or stored.fingerprint != fingerprint:
+            return None
+
+        age = (timezone.now() - stored.created_at).total_seconds()
+        if age > self.cache_ttl:
+            return None
+
+        print(f"저장된 리드 검색 결과 사용: company_id={source_company.id}, {age:.0f}초 전 결과")
+        return {
+            **stored.result,
+            "cache": {
+                "hit": True,
+                "fingerprint": fingerprint,
+                "cached_at": stored.created_at,
+                "age_seconds": int(age),
+                "ttl_seconds": self.cache_ttl,
+            },
+        }
+
+    def _stale_result(self, source_company, message):
+        """비용 한도 초과 시 입력이 바뀌었거나 TTL 이 지났더라도 마지막으로 저장된 결과를 반환합니다."""
+        stored = get_lead_scout_result(source_company) if source_company is not None else None
+        if stored is None:
+            return {"status": "error", "message": message, "budget_exceeded": True}
+
+        print(f"비용 한도 초과로 이전 리드 검색 결과 사용: company_id={source_company.id}")
+        return {
+            **stored.result,
+            "budget_exceeded": True,
+            "cache": {
+                "hit": True,
+                "stale": True,
+                "fingerprint": stored.fingerprint,
+                "cached_at": stored.created_at,
+                "age_seconds": int((timezone.now() - stored.created_at).total_seconds()),
+                "ttl_seconds": self.cache_ttl,
+            },
+        }
+
+    def _to_decimal(self, value):
+        """LLM 이 준 숫자 값을 DecimalField(max_digits=15, decimal_places=2)에 맞게 변환합니다. 변환할 수 없으면 None."""
+        if value is None or value == "":
+            return None
+        try:
+            number = Decimal(str(value).replace(",", "")).quantize(Decimal("0.01"))
+        except (InvalidOperation, ValueError):
+            return None
+        return number if abs(number) < Decimal(10) ** 13 else None
+
+    def _to_float(self, value, default=0.0):
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return default
 
     def _enrich_company_info(self, base_info, pdf_analyses):
         """PDF 분석 결과를 기반으로 회사 정보를 강화합니다."""
@@ -0,0 +1,83 @@
+# services/client_registry.py
+import threading
+
+import httpx
+import requests
+from django.conf import settings
+from openai import OpenAI
+from requests.adapters import HTTPAdapter
+
+_lock = threading.Lock()
+_openai_clients = {}
+_tavily_session = None
+_download_session = None
+
+
+def get_openai_client(api_key=None):
+    """
+    프로세스 전체에서 공유하는 OpenAI 클라이언트를 반환합니다.
+
+    OpenAI 클라이언트는 스레드 안전하므로 API 키마다 하나만 만들어 재사용하고,
+    내부 httpx 연결 풀을 유지하여 요청마다 TLS 핸드셰이크를 반복하지 않습니다.
+    """
+    api_key = api_key or settings.OPENAI_API_KEY
+    client = _openai_clients.get(api_key)
+    if client is not None:
+        return client
+
+    with _lock:
+        client = _openai_clients.get(api_key)
+        if client is None:
+            http_client = httpx.Client(
+                limits=httpx.Limits(
+                    max_connections=settings.OPENAI_MAX_CONNECTIONS,
+                    max_keepalive_connections=settings.OPENAI_MAX_KEEPALIVE_CONNECTIONS,
+                ),
+                timeout=settings.OPENAI_TIMEOUT,
+            )
+            client = OpenAI(
+                api_key=api_key,
+                base_url=settings.OPENAI_BASE_URL,
+                http_client=http_client,
+                timeout=settings.OPENAI_TIMEOUT,
+                max_retries=settings.OPENAI_MAX_RETRIES,
+            )
+            _openai_clients[api_key] = client
+    return client
+
+
+def _build_session(pool_maxsize):
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_maxsize)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def get_tavily_session():
+    """
+    Tavily 호출에 사용하는 keep-alive requests.Session 을 반환합니다.
+
+    연결 풀 크기는 TAVILY_POOL_MAXSIZE로 지정하며, 리드 상세 조회의 동시 실행 수
+    (LEAD_DETAILS_MAX_WORKERS)보다 작으면 초과 연결은 재사용되지 않습니다.
+    """
+    global _tavily_session
+    if _tavily_session is not None:
+        return _tavily_session
+
+    with _lock:
+        if _tavily_session is None:
+            _tavily_session = _build_session(settings.TAVILY_POOL_MAXSIZE)
+    return _tavily_session
+
+
+def get_download_session():
+    """PDF 다운로드(S3 등)에 사용하는 keep-alive requests.Session 을 반환합니다."""
+    global _download_session
+    if _download_session is not None:
+        return _download_session
+
+    with _lock:
+        if _download_session is None:
+            _download_session = _build_session(settings.PDF_DOWNLOAD_POOL_MAXSIZE)
+    return _download_session
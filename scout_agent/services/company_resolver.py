@@ -0,0 +1,126 @@
+# services/company_resolver.py
+import math
+import threading
+import time
+from collections import defaultdict
+
+from django.conf import settings
+
+from scout_agent.models import CompanyData
+from scout_agent.models.company_data import normalize_company_name
+
+
+def name_grams(key, size=2):
+    """정규화한 이름의 문자 n-gram 집합. 앞뒤 경계(^, $)를 붙여 짧은 한글 이름도 구분되도록 합니다."""
+    padded = f"^{key}$"
+    if len(padded) <= size:
+        return {padded}
+    return {padded[i:i + size] for i in range(len(padded) - size + 1)}
+
+
+class CompanyNameIndex:
+    """
+    회사명 -> CompanyData id 를 찾는 프로세스 내 인덱스입니다.
+
+    - 정규화한 이름(normalize_company_name)이 같으면 바로 같은 회사로 판단합니다.
+    - 아니면 문자 bigram 역색인에서 (prefix filtering 으로) 후보를 모아 Dice 계수가 threshold 이상인 가장 비슷한 회사를 고릅니다.
+    - refresh_interval 마다 DB 에서 다시 읽어 다른 프로세스가 추가한 회사도 반영합니다.
+    """
+
+    # 이 길이보다 짧은 이름은 오탐이 많아 정확히 일치할 때만 매칭
+    MIN_FUZZY_LENGTH = 3
+
+    def __init__(self, threshold=None, refresh_interval=None):
+        self.threshold = threshold or settings.COMPANY_MATCH_THRESHOLD
+        self.refresh_interval = refresh_interval or settings.COMPANY_INDEX_REFRESH_SECONDS
+        self._lock = threading.RLock()
+        self._loaded_at = None
+        self._ids_by_key = {}
+        self._grams_by_key = {}
+        self._keys_by_gram = defaultdict(set)
+
+    def _ensure_loaded(self):
+        if self._loaded_at is not None and time.monotonic() - self._loaded_at < self.refresh_interval:
+            return
+        with self._lock:
+            if self._loaded_at is not None and time.monotonic() - self._loaded_at < self.refresh_interval:
+                return
+            started = time.perf_counter()
+            self._ids_by_key = {}
+            self._grams_by_key = {}
+            self._keys_by_gram = defaultdict(set)
+            for company_id, name in CompanyData.objects.order_by('id').values_list('id', 'company').iterator():
+                self._add(company_id, normalize_company_name(name))
+            self._loaded_at = time.monotonic()
+            print(
+                f"회사명 인덱스 로드: {len(self._ids_by_key)}개 이름, "
+                f"{(time.perf_counter() - started) * 1000:.0f}ms"
+            )
+
+    def _add(self, company_id, key):
+        # 같은 키가 여러 행이면 먼저 생성된(id 가 작은) 회사를 대표로 사용
+        if not key or key in self._ids_by_key:
+            return
+        grams = name_grams(key)
+        self._ids_by_key[key] = company_id
+        self._grams_by_key[key] = grams
+        for gram in grams:
+            self._keys_by_gram[gram].add(key)
+
+    def add(self, company_id, name):
+        """새로 저장한 회사를 인덱스에 추가합니다."""
+        with self._lock:
+            self._add(company_id, normalize_company_name(name))
+
+    def resolve(self, name):
+        """
+        이름에 해당하는 기존 회사를 찾습니다.
+
+        Returns:
+            (company_id, score) 또는 None. 정확히 일치하면 score 는 1.0
+        """
+        key = normalize_company_name(name)
+        if not key:
+            return None
+
+        self._ensure_loaded()
+        with self._lock:
+            company_id = self._ids_by_key.get(key)
+            if company_id is not None:
+                return company_id, 1.0
+            if len(key) < self.MIN_FUZZY_LENGTH:
+                return None
+
+            grams = name_grams(key)
+            # Dice >= threshold 이려면 최소 min_overlap 개의 gram 을 공유해야 하므로,
+            # 드문 gram 순으로 (len(grams) - min_overlap + 1)개의 역색인만 보면 후보를 빠짐없이 모을 수 있음
+            min_overlap = math.ceil(self.threshold * len(grams) / (2.0 - self.threshold))
+            rare_grams = sorted(grams, key=lambda gram: len(self._keys_by_gram.get(gram, ())))
+            candidates = set()
+            for gram in rare_grams[:max(len(grams) - min_overlap + 1, 1)]:
+                candidates.update(self._keys_by_gram.get(gram, ()))
+
+            best_key, best_score = None, 0.0
+            for candidate in candidates:
+                candidate_grams = self._grams_by_key[candidate]
+                score = 2.0 * len(grams & candidate_grams) / (len(grams) + len(candidate_grams))
+                if score > best_score:
+                    best_key, best_score = candidate, score
+
+            if best_key is None or best_score < self.threshold:
+                return None
+            return self._ids_by_key[best_key], best_score
+
+
+_company_name_index = None
+_company_name_index_lock = threading.Lock()
+
+
+def get_company_name_index():
+    """프로세스 공용 회사명 인덱스를 반환합니다."""
+    global _company_name_index
+    if _company_name_index is None:
+        with _company_name_index_lock:
+            if _company_name_index is None:
+                _company_name_index = CompanyNameIndex()
+    return _company_name_index
@@ -0,0 +1,125 @@
+# services/job_service.py
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import close_old_connections, connection, transaction
+from django.utils import timezone
+
+from scout_agent.models import LeadScoutJob
+from ..repository.lead_scout_job_repository import (
+    create_lead_scout_job,
+    fail_stale_lead_scout_jobs,
+    update_lead_scout_job,
+)
+from .agent_service import LeadScoutAgent
+from .rate_limiter import PRIORITY_BATCH, request_priority
+from .tracing import current_request_id, request_context
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor():
+    """
+    프로세스 단위 백그라운드 작업 스레드 풀을 반환합니다.
+    처음 만들 때 이전 프로세스에서 끝나지 못한 작업을 정리합니다.
+    """
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                fail_stale_jobs()
+                _executor = ThreadPoolExecutor(
+                    max_workers=settings.LEAD_SCOUT_JOB_WORKERS,
+                    thread_name_prefix='lead-scout-job',
+                )
+    return _executor
+
+
+def fail_stale_jobs(job_id=None, older_than=None):
+    """
+    older_than 초(기본 LEAD_SCOUT_JOB_TIMEOUT)가 지나도록 pending(created_at 기준) 또는
+    running(started_at 기준)인 작업을 error 로 바꿉니다.
+
+    작업은 이 프로세스의 스레드 풀에서만 실행되므로, 워커가 재시작되거나 교체되면 대기 중이거나 실행 중이던
+    작업은 사라지고 레코드만 남습니다. 조회하는 쪽이 끝나지 않는 작업을 계속 기다리지 않도록 오류로 기록합니다.
+
+    Returns:
+        int: 오류로 바꾼 작업 수
+    """
+    if older_than is None:
+        older_than = settings.LEAD_SCOUT_JOB_TIMEOUT
+        if not older_than:
+            return 0
+    cutoff = timezone.now() - timedelta(seconds=older_than)
+    count = fail_stale_lead_scout_jobs(
+        created_before=cutoff,
+        started_before=cutoff,
+        error=f"작업이 {older_than}초 안에 끝나지 않았습니다 (작업을 실행하던 프로세스가 재시작되었을 수 있습니다).",
+        job_id=job_id,
+    )
+    if count:
+        print(f"끝나지 않은 리드 검색 작업 {count}건을 오류로 기록했습니다.")
+    return count
+
+
+def enqueue_find_leads_job(company, refresh=False):
+    """
+    리드 검색 작업을 생성하고 백그라운드 스레드 풀에 등록합니다.
+    refresh=True 이면 저장된 검색 결과를 재사용하지 않습니다.
+
+    작업 레코드가 커밋된 후에 실행되도록 transaction.on_commit 으로 등록합니다.
+
+    Returns:
+        LeadScoutJob: 생성된 작업 (status=pending)
+    """
+    job = create_lead_scout_job(company)
+    # 작업의 span/로그도 작업을 등록한 요청의 request_id 로 기록
+    request_id = current_request_id()
+    transaction.on_commit(
+        lambda: _get_executor().submit(run_find_leads_job, job.id, company.id, refresh, request_id)
+    )
+    return job
+
+
+def run_find_leads_job(job_id, company_id, refresh=False, request_id=None):
+    """작업 스레드에서 리드 검색을 실행하고 진행 단계와 결과를 작업 레코드에 기록합니다."""
+    close_old_connections()
+    try:
+        update_lead_scout_job(job_id, status=LeadScoutJob.STATUS_RUNNING, started_at=timezone.now())
+
+        # 백그라운드 작업은 대화형 요청보다 OpenAI/Tavily 호출 순서를 양보
+        with request_priority(PRIORITY_BATCH), request_context(request_id):
+            result = LeadScoutAgent().find_potential_leads(
+                company_id,
+                progress=lambda stage: update_lead_scout_job(job_id, stage=stage),
+                refresh=refresh,
+            )
+
+        if result["status"] == "error":
+            update_lead_scout_job(
+                job_id,
+                status=LeadScoutJob.STATUS_ERROR,
+                error=result["message"],
+                finished_at=timezone.now(),
+            )
+        else:
+            update_lead_scout_job(
+                job_id,
+                status=LeadScoutJob.STATUS_SUCCESS,
+                result=result,
+                finished_at=timezone.now(),
+            )
+    except Exception as e:
+        print(f"리드 검색 작업 오류: job_id={job_id}, {e}")
+        update_lead_scout_job(
+            job_id,
+            status=LeadScoutJob.STATUS_ERROR,
+            error=str(e),
+            finished_at=timezone.now(),
+        )
+    finally:
+        # 작업 스레드가 사용한 DB 연결 정리
+        connection.close()
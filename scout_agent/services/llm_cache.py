@@ -0,0 +1,93 @@
+# services/llm_cache.py
+import threading
+import time
+
+from django.conf import settings
+
+from openai.types.chat import ChatCompletion
+from openai.types.responses import Response
+
+from leadscout_sdk.utils.llm_cache import LLMResponseCache, cached_create
+from .metrics import record_cache
+from .pdf_section_selector import estimate_tokens
+from .rate_limiter import call_with_rate_limit, get_rate_limiter
+from .usage_service import check_budget, record_llm_call
+
+# 응답 토큰 수 추정치 (요청에 max_tokens 가 없을 때)
+DEFAULT_COMPLETION_TOKENS = 1000
+
+_llm_cache = None
+_llm_cache_lock = threading.Lock()
+
+
+def get_llm_cache():
+    """
+    프로세스 공용 OpenAI 응답 캐시를 반환합니다. LLM_CACHE_ENABLED가 꺼져 있으면 None을 반환합니다.
+    """
+    global _llm_cache
+    if not settings.LLM_CACHE_ENABLED:
+        return None
+    if _llm_cache is None:
+        with _llm_cache_lock:
+            if _llm_cache is None:
+                _llm_cache = LLMResponseCache(
+                    path=settings.LLM_CACHE_PATH,
+                    max_entries=settings.LLM_CACHE_MAX_ENTRIES,
+                )
+    return _llm_cache
+
+
+def _cached_create(endpoint, create, response_type, use_cache, params):
+    """
+    create 를 공용 캐시와 모델별 RateLimiter 에 통과시켜 호출합니다.
+    요청 토큰 수는 프롬프트 길이로 추정하고, 응답의 usage.total_tokens 로 보정합니다.
+    캐시 적중 여부는 /metrics 지표로, 실제 호출의 토큰 사용량과 예상 비용은 APIUsage 로 기록합니다.
+    비용 한도에 도달했으면 호출하지 않고 BudgetExceeded 를 발생시킵니다 (캐시 적중은 비용이 없으므로 허용).
+
+    도구(tools)를 쓰는 호출은 캐시를 읽지도 저장하지도 않습니다. 웹 검색 결과는 시간이 지나면 바뀌는데
+    응답 캐시에는 만료 기간이 없어, 저장하면 같은 프롬프트에 예전 검색 결과가 계속 반환되기 때문입니다.
+    """
+    cache = None if params.get('tools') else get_llm_cache()
+    called = []
+
+    def limited_create(**params):
+        called.append(True)
+        check_budget()
+        prompt = params.get('messages') or params.get('input') or ''
+        estimated = estimate_tokens(str(prompt)) + (
+            params.get('max_tokens') or params.get('max_output_tokens') or DEFAULT_COMPLETION_TOKENS
+        )
+        started = time.perf_counter()
+        try:
+            result = call_with_rate_limit(
+                get_rate_limiter('openai', params.get('model')),
+                lambda: create(**params),
+                estimated_tokens=estimated,
+                usage_tokens=lambda result: result.usage.total_tokens if result.usage else None,
+            )
+        except Exception:
+            record_llm_call(params.get('model'), None, time.perf_counter() - started, success=False)
+            raise
+        record_llm_call(params.get('model'), result, time.perf_counter() - started)
+        return result
+
+    response = cached_create(cache, endpoint, limited_create, response_type, use_cache, **params)
+    if cache is not None and use_cache:
+        record_cache('llm', hit=not called)
+    return response
+
+
+def cached_chat_completion(client, use_cache=True, **params):
+    """
+    공용 캐시와 속도 제한을 거치는 chat.completions.create 호출.
+    use_cache=False 이면 캐시를 읽지 않습니다.
+    """
+    return _cached_create("chat.completions", client.chat.completions.create, ChatCompletion, use_cache, params)
+
+
+def cached_response(client, use_cache=True, **params):
+    """
+    공용 캐시와 속도 제한을 거치는 responses.create 호출.
+    use_cache=False 이면 캐시를 읽지 않습니다. tools(웹 검색 등)가 있으면 캐시를 쓰지 않습니다.
+    """
+    return _cached_create("responses", client.responses.create, Response, use_cache, params)
@@ -0,0 +1,167 @@
+# services/metrics.py
+import bisect
+import threading
+
+# 초 단위 지연 시간 버킷 (DB 쿼리 ~ gpt-4o 웹 검색 호출까지)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_labels(labels):
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in labels) + '}'
+
+
+def _format_value(value):
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    kind = None
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._values = {}
+
+    def _key(self, labels):
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} 레이블은 {self.labelnames} 이어야 합니다: {tuple(labels)}")
+        return tuple((name, labels[name]) for name in self.labelnames)
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        with self._lock:
+            items = sorted(self._values.items())
+            lines.extend(self._render_samples(items))
+        return lines
+
+
+class Counter(_Metric):
+    kind = 'counter'
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def _render_samples(self, items):
+        return [f"{self.name}{_format_labels(key)} {_format_value(value)}" for key, value in items]
+
+
+class Histogram(_Metric):
+    kind = 'histogram'
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                # [버킷별 개수..., +Inf 개수], 합계
+                state = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0]
+            state[0][bisect.bisect_left(self.buckets, value)] += 1
+            state[1] += value
+
+    def _render_samples(self, items):
+        lines = []
+        for key, (counts, total) in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float('inf'),), counts):
+                cumulative += count
+                labels = key + (('le', _format_value(float(bound))),)
+                lines.append(f"{self.name}_bucket{_format_labels(labels)} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(key)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_format_labels(key)} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    프로세스 단위 Prometheus 지표 저장소입니다. render() 는 text exposition format(0.0.4) 문자열을 반환합니다.
+
+    collector 는 조회 시점에 값을 계산하는 지표용으로, [(이름, 종류, 설명, [(레이블 dict, 값)])] 을 반환하는 함수입니다.
+    """
+
+    def __init__(self):
+        self._metrics = []
+        self._collectors = []
+
+    def counter(self, name, documentation, labelnames=()):
+        metric = Counter(name, documentation, labelnames)
+        self._metrics.append(metric)
+        return metric
+
+    def histogram(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        metric = Histogram(name, documentation, labelnames, buckets)
+        self._metrics.append(metric)
+        return metric
+
+    def register_collector(self, collector):
+        self._collectors.append(collector)
+
+    def render(self):
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        for collector in self._collectors:
+            for name, kind, documentation, samples in collector():
+                lines.append(f"# HELP {name} {documentation}")
+                lines.append(f"# TYPE {name} {kind}")
+                for labels, value in samples:
+                    lines.append(f"{name}{_format_labels(sorted(labels.items()))} {_format_value(value)}")
+        return '\n'.join(lines) + '\n'
+
+
+REGISTRY = MetricsRegistry()
+
+HTTP_REQUEST_SECONDS = REGISTRY.histogram(
+    'leadscout_http_request_duration_seconds', "API 요청 처리 시간", ('method', 'route', 'status')
+)
+REQUEST_DB_SECONDS = REGISTRY.histogram(
+    'leadscout_request_db_seconds', "API 요청 하나가 DB 쿼리에 쓴 시간", ('route',)
+)
+DB_QUERIES = REGISTRY.counter('leadscout_db_queries_total', "API 요청에서 실행한 DB 쿼리 수", ('route',))
+STAGE_SECONDS = REGISTRY.histogram(
+    'leadscout_stage_duration_seconds', "처리 단계(span)별 소요 시간", ('stage', 'outcome')
+)
+EXTERNAL_CALLS = REGISTRY.counter(
+    'leadscout_external_calls_total', "외부 API 호출 결과 (ok/retry/error/exhausted)", ('provider', 'outcome')
+)
+EXTERNAL_CALL_SECONDS = REGISTRY.histogram(
+    'leadscout_external_call_duration_seconds', "외부 API 호출 1회의 응답 시간", ('provider',)
+)
+RATE_LIMIT_WAIT_SECONDS = REGISTRY.histogram(
+    'leadscout_rate_limit_wait_seconds', "호출 한도 대기열에서 기다린 시간", ('limiter', 'priority')
+)
+LLM_TOKENS = REGISTRY.counter('leadscout_llm_tokens_total', "OpenAI 사용 토큰 수", ('model', 'kind'))
+CACHE_REQUESTS = REGISTRY.counter('leadscout_cache_requests_total', "캐시 조회 결과", ('cache', 'result'))
+API_COST = REGISTRY.counter(
+    'leadscout_api_cost_usd_total', "외부 API 예상 비용(USD)", ('provider', 'model', 'operation')
+)
+PDF_EXTRACTION_SECONDS = REGISTRY.histogram(
+    'leadscout_pdf_extraction_seconds', "PDF 텍스트 추출 시간 (sequential/parallel)", ('mode',)
+)
+PDF_PAGES_PARSED = REGISTRY.counter('leadscout_pdf_pages_parsed_total', "텍스트를 추출한 PDF 페이지 수", ('mode',))
+PDF_BYTES_EXTRACTED = REGISTRY.counter(
+    'leadscout_pdf_extracted_bytes_total', "텍스트를 추출한 PDF 파일 크기(bytes)", ('mode',)
+)
+BUDGET_REJECTIONS = REGISTRY.counter(
+    'leadscout_budget_rejections_total', "비용 한도 초과로 거절한 외부 API 호출 수", ('budget',)
+)
+
+
+def record_cache(cache, hit):
+    CACHE_REQUESTS.inc(cache=cache, result='hit' if hit else 'miss')
+
@@ -1,20 +1,27 @@
 # services/openai_service.py
-from openai import OpenAI
-from django.conf import settings
 import json
+from .client_registry import get_openai_client
+from .llm_cache import cached_response
+from .rate_limiter import RateLimitRetriesExhausted
+from .usage_service import BudgetExceeded
 
 
 class OpenAIService:
+    # 리드 생성 모델 (LeadScoutAgent 결과 캐시 fingerprint 에도 포함)
+    LEADS_MODEL = "gpt-4o"
+
     def __init__(self):
-        self.client = OpenAI(api_key=settings.OPENAI_API_KEY)
+        self.client = get_openai_client()
 
     def generate_potential_leads(self, company_data, pdf_analyses=None, has_pdf=False):
         """
         OpenAI API의 Responses API와 웹서치 도구를 사용하여 주어진 회사 정보를 기반으로 잠재적인 리드를 생성합니다.
         PDF 분석 결과가 있는 경우 이를 함께 활용합니다.
+        웹 검색 도구를 쓰는 호출은 OpenAI 응답 캐시를 거치지 않으며(cached_response 참고),
+        결과 재사용은 만료 기간이 있는 find-leads 결과 캐시(LEAD_SCOUT_CACHE_TTL)가 맡습니다.
         """
         # 모델 지정
-        model = "gpt-4o"
+        model = self.LEADS_MODEL
 
         # 회사 정보 준비
         company_context = {
@@ -108,7 +115,8 @@ class OpenAIService:
 
         try:
             # Responses API와 웹서치 도구 사용
-            response = self.client.responses.create(
+            response = cached_response(
+                self.client,
                 model=model,
                 input=prompt,
                 tools=[{
@@ -144,6 +152,9 @@ class OpenAIService:
                     print(f"정제 시도 후에도 파싱 오류: {e2}")
                     return {"leads": []}
 
+        except (RateLimitRetriesExhausted, BudgetExceeded):
+            # 재시도 후에도 한도 초과거나 비용 한도에 도달했으면 빈 결과 대신 원인을 호출자에게 전달
+            raise
         except Exception as e:
             print(f"OpenAI API 호출 오류: {e}")
             return None
@@ -0,0 +1,88 @@
+# services/pdf_batch_service.py
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import connection
+
+from .pdf_service import PDFAnalysisService
+from .rate_limiter import PRIORITY_BATCH, RateLimitRetriesExhausted, request_priority
+from .tracing import submit_in_context
+
+
+class PDFBatchAnalyzer:
+    """
+    여러 CompanyProfile 의 PDF 를 동시에 분석합니다.
+
+    다운로드(네트워크), 텍스트 추출(CPU), LLM 호출(외부 API)은 병목이 서로 다르므로
+    단계마다 별도의 동시 실행 한도를 두고, 한 항목이 LLM 응답을 기다리는 동안
+    다른 항목의 다운로드와 추출이 진행되도록 겹쳐서 실행합니다.
+    """
+
+    def __init__(self, download_concurrency=None, extraction_concurrency=None, llm_concurrency=None):
+        self.download_concurrency = download_concurrency or settings.PDF_BATCH_DOWNLOAD_CONCURRENCY
+        self.extraction_concurrency = extraction_concurrency or settings.PDF_BATCH_EXTRACTION_CONCURRENCY
+        self.llm_concurrency = llm_concurrency or settings.PDF_BATCH_LLM_CONCURRENCY
+
+    def analyze(self, profiles, force=False, on_item=None):
+        """
+        Args:
+            profiles: CompanyProfile 목록 (company 를 select_related 해두는 것을 권장)
+            force: True 이면 기존 분석본 재사용 없이 재분석
+            on_item: 항목 하나가 끝날 때마다 항목 결과 dict 로 호출되는 콜백
+
+        Returns:
+            dict: 항목별 결과(items, 입력 순서)와 전체 처리량 요약
+        """
+        profiles = list(profiles)
+        service = PDFAnalysisService(stage_limits={
+            'download': threading.Semaphore(self.download_concurrency),
+            'extract': threading.Semaphore(self.extraction_concurrency),
+            'llm': threading.Semaphore(self.llm_concurrency),
+        })
+        max_workers = self.download_concurrency + self.extraction_concurrency + self.llm_concurrency
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='pdf-batch') as executor:
+            futures = [
+                submit_in_context(executor, self._analyze_one, service, profile, force, on_item)
+                for profile in profiles
+            ]
+            items = [future.result() for future in futures]
+        elapsed = time.perf_counter() - started
+
+        succeeded = sum(1 for item in items if item["status"] == "success")
+        return {
+            "total": len(items),
+            "succeeded": succeeded,
+            "failed": len(items) - succeeded,
+            "elapsed_seconds": round(elapsed, 3),
+            "throughput_per_minute": round(len(items) / elapsed * 60, 2) if elapsed > 0 else 0.0,
+            "items": items,
+        }
+
+    def _analyze_one(self, service, profile, force, on_item):
+        started = time.perf_counter()
+        try:
+            # 일괄 분석은 대화형 요청보다 OpenAI 호출 순서를 양보
+            with request_priority(PRIORITY_BATCH):
+                analysis = service.analyze_company_pdf(profile, force=force)
+            item = {
+                "profile_id": profile.id,
+                "status": "success" if analysis else "error",
+                "error": None if analysis else "Failed to analyze PDF",
+            }
+        except RateLimitRetriesExhausted as e:
+            # 잠시 후 다시 시도하면 되는 항목 (analyze-pdf 의 503 에 해당)
+            item = {"profile_id": profile.id, "status": "rate_limited", "error": str(e)}
+        except Exception as e:
+            item = {"profile_id": profile.id, "status": "error", "error": str(e)}
+        finally:
+            # 작업 스레드가 사용한 DB 연결 정리
+            connection.close()
+
+        item["elapsed_seconds"] = round(time.perf_counter() - started, 3)
+        if on_item:
+            on_item(item)
+        return item
@@ -0,0 +1,131 @@
+# services/pdf_downloader.py
+import hashlib
+import io
+import os
+import tempfile
+
+import fitz  # PyMuPDF
+from django.conf import settings
+
+from .client_registry import get_download_session
+
+
+class PDFTooLargeError(Exception):
+    pass
+
+
+class DownloadedPDF:
+    """
+    다운로드한 PDF. 크기가 메모리 한도 이하이면 data(bytes)에, 초과하면 임시 파일(path)에 보관합니다.
+    사용 후 close()로 임시 파일을 정리해야 합니다.
+    """
+
+    def __init__(self, data=None, path=None, content_hash=None, etag=None, last_modified=None,
+                 not_modified=False, size=0):
+        self.data = data
+        self.path = path
+        self.content_hash = content_hash
+        self.etag = etag
+        self.last_modified = last_modified
+        self.not_modified = not_modified
+        self.size = size
+
+    def open_document(self):
+        if self.data is not None:
+            return fitz.open(stream=self.data, filetype="pdf")
+        return fitz.open(self.path)
+
+    def ensure_file(self):
+        """
+        PDF 가 있는 파일 경로를 반환합니다. 메모리에 받은 PDF 는 임시 파일로 한 번 써 두고 close() 때 함께 지웁니다.
+        다른 프로세스에 넘길 때 바이트 대신 경로만 전달하기 위해 사용합니다.
+        """
+        if self.path is None:
+            with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as temp_file:
+                temp_file.write(self.data)
+            self.path = temp_file.name
+        return self.path
+
+    def close(self):
+        if self.path and os.path.exists(self.path):
+            os.remove(self.path)
+        self.path = None
+        self.data = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class PDFDownloader:
+    """
+    PDF 를 스트리밍으로 내려받는 다운로더.
+
+    - memory_limit 까지는 메모리에 받고, 넘으면 임시 파일로 옮겨 이어서 씁니다.
+    - max_bytes 를 넘으면 PDFTooLargeError 를 발생시킵니다.
+    - etag/last_modified 를 주면 조건부 GET 을 보내고, 304 응답이면 not_modified=True 를 반환합니다.
+    """
+
+    CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, timeout=None, memory_limit=None, max_bytes=None):
+        self.session = get_download_session()
+        self.timeout = timeout or settings.PDF_DOWNLOAD_TIMEOUT
+        self.memory_limit = memory_limit or settings.PDF_DOWNLOAD_MEMORY_LIMIT
+        self.max_bytes = max_bytes or settings.PDF_DOWNLOAD_MAX_BYTES
+
+    def download(self, url, etag=None, last_modified=None):
+        headers = {}
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+
+        with self.session.get(url, headers=headers, stream=True, timeout=self.timeout) as response:
+            if response.status_code == 304:
+                return DownloadedPDF(etag=etag, last_modified=last_modified, not_modified=True)
+            response.raise_for_status()
+
+            content_length = response.headers.get('Content-Length')
+            if content_length and int(content_length) > self.max_bytes:
+                raise PDFTooLargeError(f"PDF 크기 제한 초과: {content_length} > {self.max_bytes} bytes")
+
+            downloaded = self._read_body(response)
+            downloaded.etag = response.headers.get('ETag')
+            downloaded.last_modified = response.headers.get('Last-Modified')
+            return downloaded
+
+    def _read_body(self, response):
+        digest = hashlib.sha256()
+        buffer = io.BytesIO()
+        temp_file = None
+        size = 0
+        try:
+            for chunk in response.iter_content(chunk_size=self.CHUNK_SIZE):
+                size += len(chunk)
+                if size > self.max_bytes:
+                    raise PDFTooLargeError(f"PDF 크기 제한 초과: {self.max_bytes} bytes")
+                digest.update(chunk)
+
+                if temp_file is None and size > self.memory_limit:
+                    # 메모리 한도 초과 시 지금까지 받은 내용을 임시 파일로 옮김
+                    temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.pdf')
+                    temp_file.write(buffer.getvalue())
+                    buffer = None
+
+                if temp_file is not None:
+                    temp_file.write(chunk)
+                else:
+                    buffer.write(chunk)
+        except Exception:
+            if temp_file is not None:
+                temp_file.close()
+                os.remove(temp_file.name)
+            raise
+
+        if temp_file is not None:
+            temp_file.close()
+            return DownloadedPDF(path=temp_file.name, content_hash=digest.hexdigest(), size=size)
+        return DownloadedPDF(data=buffer.getvalue(), content_hash=digest.hexdigest(), size=size)
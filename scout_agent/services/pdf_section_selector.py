@@ -0,0 +1,165 @@
+# services/pdf_section_selector.py
+import math
+import re
+
+# 추출 대상 항목별 단서 키워드 (소문자 비교)
+FIELD_KEYWORDS = {
+    'industry': ['산업', '업종', '분야', 'industry', 'sector'],
+    'sales': ['매출', '매출액', '영업이익', '순이익', '억원', '백만원', 'revenue', 'sales', 'profit'],
+    'total_funding': ['투자', '투자유치', '유치', '시리즈', 'series', 'funding', 'investment', 'vc'],
+    'homepage': ['홈페이지', 'www.', 'http', 'website'],
+    'key_executive': ['대표', '대표이사', 'ceo', 'cto', 'cfo', '사장', '창업자', '임원', 'founder', 'president'],
+    'address': ['주소', '소재지', '본사', '본점', '사옥', '서울', '경기', '특별시', '광역시', 'address'],
+    'email': ['이메일', 'e-mail', 'email', '메일'],
+    'phone_number': ['전화', '연락처', 'tel', 'fax', 'phone', '문의'],
+    'company_description': ['회사소개', '회사 소개', '기업소개', '개요', '비전', '미션', 'about', 'overview'],
+    'products_services': ['제품', '서비스', '솔루션', '플랫폼', 'product', 'service', 'solution'],
+    'target_customers': ['고객', '고객사', '타겟', '레퍼런스', '도입', 'customer', 'client'],
+    'competitors': ['경쟁', '경쟁사', '시장점유율', '점유율', '비교', 'competitor', 'competition'],
+    'strengths': ['강점', '차별', '특허', '경쟁력', '수상', '인증', 'strength', 'patent'],
+    'business_model': ['비즈니스 모델', '수익', '구독', '과금', '라이선스', 'business model', 'pricing'],
+}
+
+# 키워드로 잡기 어려운 항목은 패턴 일치도 점수에 반영
+FIELD_PATTERNS = {
+    'email': re.compile(r'[\w.+-]+@[\w-]+\.[\w.]+'),
+    'phone_number': re.compile(r'\d{2,4}[-.\s]\d{3,4}[-.\s]\d{4}'),
+    'homepage': re.compile(r'(https?://|www\.)\S+'),
+    'sales': re.compile(r'\d[\d,.]*\s*(억|조|만)\s*원'),
+}
+
+
+def estimate_tokens(text):
+    """
+    tokenizer 없이 토큰 수를 근사합니다.
+    영문/숫자는 약 4자당 1토큰, 한글 등 비 ASCII 문자는 1자당 1토큰으로 계산합니다.
+    """
+    ascii_chars = sum(1 for ch in text if ord(ch) < 128)
+    return math.ceil(ascii_chars / 4 + (len(text) - ascii_chars))
+
+
+def split_sections(text, section_chars=1200):
+    """
+    빈 줄(또는 페이지 구분)을 기준으로 문단을 나누고, section_chars 이하가 되도록 이어 붙여 섹션을 만듭니다.
+    """
+    paragraphs = [p.strip() for p in re.split(r'\n\s*\n|\f', text) if p.strip()]
+
+    sections = []
+    current = ""
+    for paragraph in paragraphs:
+        # 긴 문단은 section_chars 단위로 자름
+        while len(paragraph) > section_chars:
+            if current:
+                sections.append(current)
+                current = ""
+            sections.append(paragraph[:section_chars])
+            paragraph = paragraph[section_chars:]
+
+        if current and len(current) + len(paragraph) + 2 > section_chars:
+            sections.append(current)
+            current = ""
+        current = f"{current}\n\n{paragraph}" if current else paragraph
+
+    if current:
+        sections.append(current)
+    return sections
+
+
+class PDFSectionSelector:
+    """
+    긴 PDF 텍스트를 섹션으로 나누고, 추출 대상 항목 관련도가 높은 섹션을 토큰 예산 안에서 고릅니다.
+
+    - 섹션별로 항목 키워드의 TF-IDF(로그 TF × 섹션 기준 IDF)와 패턴 일치 수를 합산해 항목 점수를 매깁니다.
+    - 이미 선택한 섹션이 다룬 항목은 점수를 낮춰(diminishing return) 여러 항목이 고르게 포함되도록 합니다.
+    - 첫 섹션(표지/회사 소개)은 항상 포함하고, 남는 예산은 문서 앞부분 섹션으로 채웁니다.
+    - 선택된 섹션은 원래 문서 순서로 이어 붙입니다.
+    """
+
+    def __init__(self, token_budget, section_chars=1200, fields=None):
+        self.token_budget = token_budget
+        self.section_chars = section_chars
+        self.fields = fields or list(FIELD_KEYWORDS.keys())
+
+    def select(self, text):
+        if estimate_tokens(text) <= self.token_budget:
+            return text
+
+        sections = split_sections(text, self.section_chars)
+        scores = self._score_sections(sections)
+        tokens = [estimate_tokens(section) for section in sections]
+
+        selected = []
+        used_tokens = 0
+        coverage = {field: 0.0 for field in self.fields}
+
+        if sections and tokens[0] <= self.token_budget:
+            selected.append(0)
+            used_tokens += tokens[0]
+            self._add_coverage(coverage, scores[0])
+
+        remaining = set(range(len(sections))) - set(selected)
+        while remaining:
+            best, best_gain = None, 0.0
+            for index in remaining:
+                if used_tokens + tokens[index] > self.token_budget:
+                    continue
+                gain = sum(
+                    score / (1.0 + coverage[field])
+                    for field, score in scores[index].items()
+                )
+                # 같은 이득이면 짧은 섹션 우선
+                gain /= math.sqrt(max(tokens[index], 1))
+                if gain > best_gain:
+                    best, best_gain = index, gain
+
+            if best is None:
+                break
+            selected.append(best)
+            used_tokens += tokens[best]
+            self._add_coverage(coverage, scores[best])
+            remaining.discard(best)
+
+        # 관련 섹션을 모두 담고 남은 예산은 문서 앞부분 섹션으로 채움
+        for index in sorted(remaining):
+            if used_tokens + tokens[index] <= self.token_budget:
+                selected.append(index)
+                used_tokens += tokens[index]
+
+        print(
+            f"PDF 섹션 선택: {len(selected)}/{len(sections)}개 섹션, "
+            f"약 {used_tokens}/{self.token_budget} 토큰"
+        )
+        return "\n\n".join(sections[index] for index in sorted(selected))
+
+    def _add_coverage(self, coverage, section_scores):
+        for field, score in section_scores.items():
+            coverage[field] += score
+
+    def _score_sections(self, sections):
+        lowered = [section.lower() for section in sections]
+        total = len(sections)
+
+        # 키워드별 문서 빈도(해당 키워드가 등장하는 섹션 수)
+        document_frequency = {}
+        for field in self.fields:
+            for keyword in FIELD_KEYWORDS.get(field, []):
+                if keyword not in document_frequency:
+                    document_frequency[keyword] = sum(1 for section in lowered if keyword in section)
+
+        scores = []
+        for section in lowered:
+            section_scores = {}
+            for field in self.fields:
+                score = 0.0
+                for keyword in FIELD_KEYWORDS.get(field, []):
+                    count = section.count(keyword)
+                    if count:
+                        idf = math.log((1 + total) / (1 + document_frequency[keyword])) + 1.0
+                        score += (1.0 + math.log(count)) * idf
+                pattern = FIELD_PATTERNS.get(field)
+                if pattern:
+                    score += 2.0 * len(pattern.findall(section))
+                if score:
+                    section_scores[field] = score
+            scores.append(section_scores)
+        return scores
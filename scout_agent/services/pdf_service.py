@@ -1,127 +1,237 @@
 # services/pdf_service.py
-from openai import OpenAI
-import fitz  # PyMuPDF
-from django.conf import settings
-import os
 import json
-import tempfile
-import urllib.request
+import hashlib
+from contextlib import contextmanager
+from decimal import Decimal
+from django.conf import settings
 from django.db import transaction
-from scout_agent.repository.PDFAnalysis_repository import post_pdf_analysis
-from scout_agent.repository.company_data_repository import create_or_update_company_data
+from scout_agent.repository.PDFAnalysis_repository import (
+    get_pdf_analysis_by_company_and_profile,
+    get_pdf_analysis_by_content_hash,
+    get_pdf_analysis_by_text_hash,
+    post_pdf_analysis,
+)
+from scout_agent.repository.company_data_repository import update_company_data
+from .client_registry import get_openai_client
+from .llm_cache import cached_chat_completion
+from .metrics import record_cache
+from .rate_limiter import RateLimitRetriesExhausted
+from .usage_service import BudgetExceeded, usage_scope
+from .pdf_downloader import PDFDownloader
+from .pdf_section_selector import PDFSectionSelector
+from .pdf_text_extractor import PDFTextExtractor
+from .tracing import span
 
 
 class PDFAnalysisService:
-    def __init__(self):
-        self.client = OpenAI(api_key=settings.OPENAI_API_KEY)
+    ANALYSIS_FIELDS = [
+        # 기본 회사 정보
+        'industry', 'sales', 'total_funding', 'homepage', 'key_executive',
+        'address', 'email', 'phone_number',
+        # 상세 정보
+        'company_description', 'products_services', 'target_customers',
+        'competitors', 'strengths', 'business_model',
+    ]
+
+    def __init__(self, stage_limits=None):
+        """
+        Args:
+            stage_limits: 단계별 동시 실행 제한 {"download"|"extract"|"llm": threading.Semaphore}.
+                여러 스레드가 한 인스턴스를 공유하는 일괄 분석에서 사용합니다.
+        """
+        self.client = get_openai_client()
+        self.stage_limits = stage_limits or {}
+        self.downloader = PDFDownloader()
+        self.text_extractor = PDFTextExtractor()
+        self.section_selector = PDFSectionSelector(
+            token_budget=settings.PDF_PROMPT_TOKEN_BUDGET,
+            section_chars=settings.PDF_SECTION_CHARS,
+        )
 
-    def analyze_company_pdf(self, company_profile):
+    def analyze_company_pdf(self, company_profile, force=False):
         """
         PDF 파일을 분석하여 회사 정보를 추출하고 DB에 저장합니다.
 
+        - 이전 분석 때 받은 ETag/Last-Modified 로 조건부 GET 을 보내, 파일이 바뀌지 않았으면(304)
+          전송 없이 이 프로필의 기존 분석본을 반환합니다.
+        - PDF 원본 바이트 또는 추출 텍스트의 SHA-256 이 같은 분석본이 이미 있으면
+          (다른 프로필이나 다른 파일명으로 올라온 같은 문서 포함) LLM 호출 없이 그 결과를 재사용합니다.
+        - force=True 이면 위 캐시와 LLM 응답 캐시를 모두 무시하고 다시 분석합니다.
+        - LLM 이 아무 정보도 추출하지 못하면 분석본을 저장하지 않아, 다음 호출 때 다시 분석합니다.
+        - 비용 한도에 도달해 LLM 을 호출할 수 없으면 BudgetExceeded 를,
+          재시도 한도까지 429/일시 오류가 계속되면 RateLimitRetriesExhausted 를 발생시킵니다.
+
         Returns:
             dict: 추출된 회사 정보
         """
+        with usage_scope('analyze_pdf', company_profile.company_id):
+            return self._analyze_company_pdf(company_profile, force)
+
+    def _analyze_company_pdf(self, company_profile, force):
         try:
-            # PDF 텍스트 추출
-            extracted_text = self._extract_text_from_pdf(company_profile.url)
-            if not extracted_text:
-                print("PDF에서 텍스트를 추출할 수 없습니다.")
+            existing = None
+            if not force:
+                existing = get_pdf_analysis_by_company_and_profile(
+                    company_profile.company, company_profile
+                ).first()
+
+            with self._limit('download'), span('pdf.download', profile_id=company_profile.id):
+                downloaded = self._download_pdf(company_profile, conditional=existing is not None)
+            if downloaded is None:
                 return {}
 
-            # OpenAI를 사용하여 텍스트에서 회사 정보 추출
-            company_info = self._extract_company_info_with_ai(extracted_text, company_profile.company.company)
-
-            with transaction.atomic():
-                # 기본 회사 정보 업데이트 or 생성
-                create_or_update_company_data(
-                    company_name=company_profile.company,
-                    defaults={
-                        'industry': company_info.get('industry'),
-                        'sales': company_info.get('sales'),
-                        'total_funding': company_info.get('total_funding'),
-                        'homepage': company_info.get('homepage'),
-                        'key_executive': company_info.get('key_executive'),
-                        'address': company_info.get('address'),
-                        'email': company_info.get('email'),
-                        'phone_number': company_info.get('phone_number'),
-                    }
-                )
+            with downloaded:
+                if downloaded.not_modified:
+                    record_cache('pdf_analysis', hit=True)
+                    print(f"PDF 변경 없음 (304), 기존 분석본 사용: {company_profile.url}")
+                    return self._analysis_to_dict(existing)
 
-                post_pdf_analysis(
-                    company_profile.company,
-                    company_profile,
-                    {
-                        # 기본 회사 정보
-                        'industry': company_info.get('industry'),
-                        'sales': company_info.get('sales'),
-                        'total_funding': company_info.get('total_funding'),
-                        'homepage': company_info.get('homepage'),
-                        'key_executive': company_info.get('key_executive'),
-                        'address': company_info.get('address'),
-                        'email': company_info.get('email'),
-                        'phone_number': company_info.get('phone_number'),
-                        
-                        # 상세 정보
-                        'company_description': company_info.get('company_description'),
-                        'products_services': company_info.get('products_services'),
-                        'target_customers': company_info.get('target_customers'),
-                        'competitors': company_info.get('competitors'),
-                        'strengths': company_info.get('strengths'),
-                        'business_model': company_info.get('business_model')
-                    }
-                )
+                content_hash = downloaded.content_hash
+                if not force:
+                    cached = get_pdf_analysis_by_content_hash(content_hash).first()
+                    record_cache('pdf_analysis', hit=cached is not None)
+                    if cached:
+                        print(f"동일한 PDF 분석본 재사용 (content_hash={content_hash[:12]})")
+                        return self._reuse_analysis(company_profile, cached, downloaded)
 
-            return company_info
+                # PDF 텍스트 추출
+                with self._limit('extract'), span('pdf.extract_text', profile_id=company_profile.id) as attrs:
+                    extracted_text = self._extract_text_from_pdf(downloaded, attrs)
+                if not extracted_text:
+                    print("PDF에서 텍스트를 추출할 수 없습니다.")
+                    return {}
+
+                text_hash = hashlib.sha256(extracted_text.encode('utf-8')).hexdigest()
+                if not force:
+                    cached = get_pdf_analysis_by_text_hash(text_hash).first()
+                    record_cache('pdf_text', hit=cached is not None)
+                    if cached:
+                        print(f"동일한 텍스트의 PDF 분석본 재사용 (text_hash={text_hash[:12]})")
+                        return self._reuse_analysis(company_profile, cached, downloaded)
+
+                # OpenAI를 사용하여 텍스트에서 회사 정보 추출
+                with self._limit('llm'), span('pdf.llm_extract', profile_id=company_profile.id):
+                    company_info = self._extract_company_info_with_ai(
+                        extracted_text, company_profile.company.company, use_cache=not force
+                    )
+                if not any(value not in (None, '') for value in company_info.values()):
+                    # 빈 결과를 해시/검증자와 함께 저장하면 이후 304·해시 재사용 경로가 빈 분석본을 계속 반환하므로 저장하지 않음
+                    print(f"PDF 분석 결과가 비어 있어 저장하지 않습니다: {company_profile.url}")
+                    return {}
+
+                with span('pdf.save', profile_id=company_profile.id):
+                    self._save_analysis(company_profile, company_info, downloaded, text_hash)
+
+                return company_info
 
+        except (BudgetExceeded, RateLimitRetriesExhausted):
+            # 빈 결과로 바꾸지 않고 호출한 쪽에서 429/503 으로 응답하도록 전달
+            raise
         except Exception as e:
             print(f"PDF 분석 중 오류 발생: {e}")
             return {}
 
-    def _extract_text_from_pdf(self, pdf_path):
+    @contextmanager
+    def _limit(self, stage):
+        semaphore = self.stage_limits.get(stage)
+        if semaphore is None:
+            yield
+            return
+        with semaphore:
+            yield
+
+    def _analysis_to_dict(self, analysis):
+        company_info = {}
+        for field in self.ANALYSIS_FIELDS:
+            value = getattr(analysis, field)
+            company_info[field] = float(value) if isinstance(value, Decimal) else value
+        return company_info
+
+    def _reuse_analysis(self, company_profile, cached, downloaded):
+        """저장된 분석본의 값을 현재 프로필의 분석 결과로 저장하고 반환합니다."""
+        company_info = self._analysis_to_dict(cached)
+        self._save_analysis(company_profile, company_info, downloaded, cached.text_hash)
+        return company_info
+
+    def _save_analysis(self, company_profile, company_info, downloaded, text_hash):
+        with transaction.atomic():
+            # 기본 회사 정보 업데이트 (프로필이 가리키는 회사 행을 직접 갱신해 이름 표기 차이로 중복 행이 생기지 않도록 함)
+            update_company_data(
+                company_profile.company,
+                {
+                    'industry': company_info.get('industry'),
+                    'sales': company_info.get('sales'),
+                    'total_funding': company_info.get('total_funding'),
+                    'homepage': company_info.get('homepage'),
+                    'key_executive': company_info.get('key_executive'),
+                    'address': company_info.get('address'),
+                    'email': company_info.get('email'),
+                    'phone_number': company_info.get('phone_number'),
+                }
+            )
+
+            defaults = {field: company_info.get(field) for field in self.ANALYSIS_FIELDS}
+            defaults['content_hash'] = downloaded.content_hash
+            defaults['text_hash'] = text_hash
+            post_pdf_analysis(company_profile.company, company_profile, defaults)
+
+            # 다음 분석 때 조건부 GET 에 사용할 검증자 저장
+            company_profile.pdf_etag = downloaded.etag
+            company_profile.pdf_last_modified = downloaded.last_modified
+            company_profile.save(update_fields=['pdf_etag', 'pdf_last_modified', 'updated_at'])
+
+    def _download_pdf(self, company_profile, conditional=False):
         """
-        PyMuPDF를 사용하여 PDF에서 텍스트를 추출합니다.
+        프로필의 PDF 를 내려받습니다. conditional=True 이면 저장된 ETag/Last-Modified 로 조건부 요청합니다.
+
+        Returns:
+            DownloadedPDF: 다운로드 결과, 실패 시 None
         """
         try:
-            downloaded_path = self._download_pdf(pdf_path)
-            text = ""
-            # PDF 파일 열기
-            with fitz.open(downloaded_path) as doc:
-                # 각 페이지의 텍스트 추출
-                for page in doc:
-                    text += page.get_text()
-
-            # 텍스트가 너무 길면 잘라내기 (OpenAI API 제한 고려)
-            max_length = 15000
-            if len(text) > max_length:
-                print(f"PDF 텍스트가 너무 길어 {max_length}자로 제한합니다.")
-                text = text[:max_length]
-
-            os.remove(downloaded_path)
-            
+            downloaded = self.downloader.download(
+                company_profile.url,
+                etag=company_profile.pdf_etag if conditional else None,
+                last_modified=company_profile.pdf_last_modified if conditional else None,
+            )
+            if not downloaded.not_modified:
+                print(f"PDF 다운로드 완료: {company_profile.url} ({downloaded.size} bytes)")
+            return downloaded
+        except Exception as e:
+            print(f"PDF 다운로드 오류: {e}")
+            return None
+
+    def _extract_text_from_pdf(self, downloaded, span_attrs=None):
+        """
+        PyMuPDF를 사용하여 다운로드한 PDF 에서 LLM 에 전달할 텍스트를 추출합니다.
+
+        기본값(PDF_SECTION_SELECTION_ENABLED 켜짐)은 앞에서부터 PDF_SECTION_SOURCE_MAX_CHARS 까지 읽은 뒤
+        항목 관련도가 높은 섹션만 PDF_PROMPT_TOKEN_BUDGET 안에서 골라 사용합니다.
+        꺼져 있으면 앞에서부터 PDF_TEXT_MAX_CHARS 까지만 읽습니다. 두 경로 모두 한도를 채우면 남은 페이지는 읽지 않습니다.
+        span_attrs 가 주어지면 읽은 페이지 수와 파일 크기를 추가해 span 로그에 남깁니다.
+        """
+        try:
+            if settings.PDF_SECTION_SELECTION_ENABLED:
+                result = self.text_extractor.extract(downloaded, max_chars=settings.PDF_SECTION_SOURCE_MAX_CHARS)
+                text = self.section_selector.select(result.text)
+            else:
+                result = self.text_extractor.extract(downloaded, max_chars=settings.PDF_TEXT_MAX_CHARS)
+                text = result.text
+
+            if span_attrs is not None:
+                span_attrs.update(
+                    pages=f"{result.pages_parsed}/{result.page_count}",
+                    bytes=result.size,
+                    parallel=result.parallel,
+                )
             return text
         except Exception as e:
             print(f"PDF 텍스트 추출 오류: {e}")
             return ""
 
-    def _download_pdf(self, url):
-        """URL에서 PDF 파일을 다운로드하고 임시 파일 경로를 반환합니다."""
-        try:
-            # 임시 파일 생성
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as temp_file:
-                temp_path = temp_file.name
-
-            # PDF 다운로드
-            urllib.request.urlretrieve(url, temp_path)
-            print(f"PDF 다운로드 완료: {url}")
-            return temp_path
-        except Exception as e:
-            print(f"PDF 다운로드 오류: {e}")
-            return None
-        
-    def _extract_company_info_with_ai(self, text, company_name):
+    def _extract_company_info_with_ai(self, text, company_name, use_cache=True):
         """
         OpenAI API를 사용하여 PDF 텍스트에서 회사 정보를 추출합니다.
+        use_cache=False 이면 같은 프롬프트의 저장된 응답을 재사용하지 않습니다.
         """
         try:
             prompt = f"""
@@ -154,7 +264,9 @@ class PDFAnalysisService:
             """
 
             # GPT-4 API 호출
-            response = self.client.chat.completions.create(
+            response = cached_chat_completion(
+                self.client,
+                use_cache=use_cache,
                 model="gpt-4o",
                 messages=[
                     {"role": "system",
@@ -172,6 +284,9 @@ class PDFAnalysisService:
 
             return company_info
 
+        except (RateLimitRetriesExhausted, BudgetExceeded):
+            # 빈 분석 결과가 저장되지 않도록 상위로 전달
+            raise
         except Exception as e:
             print(f"AI를 사용한 정보 추출 오류: {e}")
             return {}
\ No newline at end of file
@@ -0,0 +1,170 @@
+# services/pdf_text_extractor.py
+import itertools
+import math
+import multiprocessing
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import fitz  # PyMuPDF
+from django.conf import settings
+
+from .metrics import PDF_BYTES_EXTRACTED, PDF_EXTRACTION_SECONDS, PDF_PAGES_PARSED
+
+_process_pool = None
+_process_pool_lock = threading.Lock()
+
+
+def _get_process_pool():
+    """페이지 병렬 추출용 프로세스 풀. 웹 워커의 스레드와 섞이지 않도록 spawn 방식으로 생성합니다."""
+    global _process_pool
+    if _process_pool is None:
+        with _process_pool_lock:
+            if _process_pool is None:
+                _process_pool = ProcessPoolExecutor(
+                    max_workers=settings.PDF_EXTRACTION_WORKERS,
+                    mp_context=multiprocessing.get_context('spawn'),
+                )
+    return _process_pool
+
+
+def _open_document(source):
+    if isinstance(source, (bytes, bytearray)):
+        return fitz.open(stream=source, filetype="pdf")
+    return fitz.open(source)
+
+
+def _extract_page_range(source, start, stop):
+    """[start, stop) 페이지의 텍스트 목록을 반환합니다. 프로세스 풀 작업 함수입니다."""
+    with _open_document(source) as doc:
+        return [doc[page_number].get_text() for page_number in range(start, stop)]
+
+
+class PDFExtractionResult:
+    def __init__(self, text, page_count, pages_parsed, size, elapsed, truncated, parallel=False):
+        self.text = text
+        self.page_count = page_count
+        self.pages_parsed = pages_parsed
+        self.size = size
+        self.elapsed = elapsed
+        self.truncated = truncated
+        self.parallel = parallel
+
+    def summary(self):
+        return (
+            f"{self.pages_parsed}/{self.page_count} 페이지, {self.size} bytes, "
+            f"{len(self.text)}자, {self.elapsed * 1000:.0f}ms"
+            + (" (병렬)" if self.parallel else "")
+            + (" (글자 수 제한으로 조기 종료)" if self.truncated else "")
+        )
+
+
+class PDFTextExtractor:
+    """
+    PyMuPDF 텍스트 추출기.
+
+    - max_chars 가 주어지면 앞 페이지부터 읽다가 글자 수를 채우는 즉시 멈춥니다.
+    - 첫 pages_per_task 페이지는 직접 읽고, 그래도 글자 수를 채우지 못했고 문서가 parallel_min_pages 이상이면
+      나머지 페이지 구간을 프로세스 풀에서 병렬로 추출합니다 (예: 섹션 선택용 PDF_SECTION_SOURCE_MAX_CHARS).
+      워커 수만큼만 미리 제출하고 글자 수를 채우면 남은 구간은 제출하지 않습니다.
+      워커에는 PDF 파일 경로만 넘기므로 메모리에 받은 PDF 는 임시 파일로 한 번 기록합니다 (DownloadedPDF.close() 때 삭제).
+    - 페이지 수, 파일 크기, 소요 시간은 leadscout_pdf_extraction_* 지표로 기록합니다.
+    """
+
+    def __init__(self, parallel_min_pages=None, pages_per_task=None):
+        self.parallel_min_pages = parallel_min_pages or settings.PDF_EXTRACTION_PARALLEL_MIN_PAGES
+        self.pages_per_task = pages_per_task or settings.PDF_EXTRACTION_PAGES_PER_TASK
+
+    def extract(self, downloaded, max_chars=None):
+        """
+        Args:
+            downloaded: DownloadedPDF
+            max_chars: 최대 글자 수 (None 이면 전체)
+
+        Returns:
+            PDFExtractionResult
+        """
+        started = time.perf_counter()
+        source = downloaded.data if downloaded.data is not None else downloaded.path
+        limit = max_chars if max_chars is not None else math.inf
+
+        with _open_document(source) as doc:
+            page_count = doc.page_count
+            pages = self._extract_until(doc, 0, min(self.pages_per_task, page_count), limit)
+            parallel = (
+                len(pages) < page_count
+                and self._char_count(pages) < limit
+                and page_count >= self.parallel_min_pages
+                and settings.PDF_EXTRACTION_WORKERS > 1
+            )
+            if not parallel:
+                pages += self._extract_until(doc, len(pages), page_count, limit - self._char_count(pages))
+
+        if parallel:
+            # 작업마다 원본 바이트를 피클링해 보내지 않도록 파일 경로만 넘기고 각 워커가 직접 엶
+            pages += self._extract_parallel(
+                downloaded.ensure_file(), len(pages), page_count, limit - self._char_count(pages)
+            )
+
+        total = self._char_count(pages)
+        result = PDFExtractionResult(
+            text="".join(pages)[:max_chars] if max_chars is not None else "".join(pages),
+            page_count=page_count,
+            pages_parsed=len(pages),
+            size=downloaded.size,
+            elapsed=time.perf_counter() - started,
+            truncated=len(pages) < page_count or total > limit,
+            parallel=parallel,
+        )
+        mode = 'parallel' if parallel else 'sequential'
+        PDF_EXTRACTION_SECONDS.observe(result.elapsed, mode=mode)
+        PDF_PAGES_PARSED.inc(result.pages_parsed, mode=mode)
+        PDF_BYTES_EXTRACTED.inc(result.size or 0, mode=mode)
+        print(f"PDF 텍스트 추출 완료: {result.summary()}")
+        return result
+
+    def _char_count(self, pages):
+        return sum(len(text) for text in pages)
+
+    def _extract_until(self, doc, start, stop, max_chars):
+        """[start, stop) 페이지를 앞에서부터 읽다가 max_chars 를 채우면 멈춥니다."""
+        pages = []
+        total = 0
+        for page_number in range(start, stop):
+            if total >= max_chars:
+                break
+            text = doc[page_number].get_text()
+            pages.append(text)
+            total += len(text)
+        return pages
+
+    def _extract_parallel(self, path, start, page_count, max_chars):
+        """
+        [start, page_count) 페이지를 pages_per_task 단위로 프로세스 풀에서 추출합니다.
+        결과는 문서 순서로 모으고, max_chars 를 채우면 남은 구간은 제출하지 않습니다.
+        """
+        pool = _get_process_pool()
+        ranges = iter(
+            (range_start, min(range_start + self.pages_per_task, page_count))
+            for range_start in range(start, page_count, self.pages_per_task)
+        )
+        pending = deque(
+            pool.submit(_extract_page_range, path, *page_range)
+            for page_range in itertools.islice(ranges, settings.PDF_EXTRACTION_WORKERS)
+        )
+
+        pages = []
+        total = 0
+        while pending:
+            chunk = pending.popleft().result()
+            pages.extend(chunk)
+            total += self._char_count(chunk)
+            if total >= max_chars:
+                for future in pending:
+                    future.cancel()
+                break
+            next_range = next(ranges, None)
+            if next_range is not None:
+                pending.append(pool.submit(_extract_page_range, path, *next_range))
+        return pages
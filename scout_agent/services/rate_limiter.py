@@ -0,0 +1,299 @@
+# services/rate_limiter.py
+import heapq
+import itertools
+import random
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from email.utils import parsedate_to_datetime
+
+import openai
+import requests
+from django.conf import settings
+
+from .metrics import EXTERNAL_CALL_SECONDS, EXTERNAL_CALLS, RATE_LIMIT_WAIT_SECONDS, REGISTRY
+
+# 요청 우선순위 (작을수록 먼저 처리)
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BATCH = 10
+
+_current_priority = ContextVar('rate_limit_priority', default=PRIORITY_INTERACTIVE)
+
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+class RateLimitRetriesExhausted(Exception):
+    """재시도 한도까지 429/일시 오류가 계속된 경우 발생합니다."""
+
+
+@contextmanager
+def request_priority(priority):
+    """
+    이 블록 안에서(같은 스레드) 실행되는 OpenAI/Tavily 호출의 대기 우선순위를 지정합니다.
+    스레드 풀 작업에는 tracing.submit_in_context 로 제출해야 전달됩니다.
+    """
+    token = _current_priority.set(priority)
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+
+class RateLimiter:
+    """
+    분당 요청 수(rpm)와 분당 토큰 수(tpm)를 제한하는 토큰 버킷입니다.
+
+    - 버킷은 1분 용량만큼 채워진 상태에서 시작해 초당 rpm/60, tpm/60 씩 다시 채워집니다.
+    - 대기 중인 호출은 (우선순위, 도착 순서) 힙으로 관리해 대화형 요청이 배치 작업보다 먼저 통과합니다.
+    - 429 를 받으면 pause()로 버킷 전체를 잠시 멈춰 다른 스레드도 함께 물러나게 합니다.
+    - 토큰 수는 호출 전 추정치로 차감하고, 응답의 실제 사용량으로 reconcile() 합니다.
+    """
+
+    def __init__(self, name, requests_per_minute, tokens_per_minute=None):
+        self.name = name
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._requests = float(requests_per_minute)
+        self._tokens = float(tokens_per_minute or 0)
+        self._refilled_at = time.monotonic()
+        self._paused_until = 0.0
+        self._cond = threading.Condition()
+        self._waiters = []
+        self._sequence = itertools.count()
+        self._metrics = {
+            'acquired': 0,
+            'waiting': 0,
+            'queue_wait_seconds_total': 0.0,
+            'queue_wait_seconds_max': 0.0,
+            'acquired_by_priority': {},
+            'throttled': 0,
+            'retries': 0,
+            'failures': 0,
+        }
+
+    def _refill(self, now):
+        elapsed = now - self._refilled_at
+        self._refilled_at = now
+        self._requests = min(self.requests_per_minute, self._requests + elapsed * self.requests_per_minute / 60.0)
+        if self.tokens_per_minute:
+            self._tokens = min(self.tokens_per_minute, self._tokens + elapsed * self.tokens_per_minute / 60.0)
+
+    def _seconds_until_available(self, now, tokens):
+        wait = max(self._paused_until - now, 0.0)
+        if self._requests < 1:
+            wait = max(wait, (1 - self._requests) * 60.0 / self.requests_per_minute)
+        if self.tokens_per_minute:
+            # 1분 용량보다 큰 요청은 버킷이 가득 찼을 때 통과시킴
+            needed = min(tokens, self.tokens_per_minute)
+            if self._tokens < needed:
+                wait = max(wait, (needed - self._tokens) * 60.0 / self.tokens_per_minute)
+        return wait
+
+    def acquire(self, tokens=0, priority=None):
+        """
+        요청 1건과 tokens 만큼의 용량을 확보할 때까지 기다립니다.
+
+        Returns:
+            float: 대기 시간(초)
+        """
+        priority = _current_priority.get() if priority is None else priority
+        entry = (priority, next(self._sequence))
+        started = time.monotonic()
+
+        with self._cond:
+            heapq.heappush(self._waiters, entry)
+            self._metrics['waiting'] += 1
+            try:
+                while True:
+                    timeout = None
+                    if self._waiters[0] == entry:
+                        now = time.monotonic()
+                        self._refill(now)
+                        timeout = self._seconds_until_available(now, tokens)
+                        if timeout <= 0:
+                            self._requests -= 1
+                            self._tokens -= tokens
+                            break
+                    self._cond.wait(timeout=timeout)
+            finally:
+                self._waiters.remove(entry)
+                heapq.heapify(self._waiters)
+                self._metrics['waiting'] -= 1
+                self._cond.notify_all()
+
+            waited = time.monotonic() - started
+            self._metrics['acquired'] += 1
+            self._metrics['queue_wait_seconds_total'] += waited
+            self._metrics['queue_wait_seconds_max'] = max(self._metrics['queue_wait_seconds_max'], waited)
+            by_priority = self._metrics['acquired_by_priority']
+            by_priority[priority] = by_priority.get(priority, 0) + 1
+        RATE_LIMIT_WAIT_SECONDS.observe(waited, limiter=self.name, priority=priority)
+        return waited
+
+    def reconcile(self, estimated_tokens, actual_tokens):
+        """호출 전 추정한 토큰 수를 실제 사용량으로 보정합니다."""
+        if not self.tokens_per_minute or actual_tokens is None:
+            return
+        with self._cond:
+            self._tokens += estimated_tokens - actual_tokens
+            self._cond.notify_all()
+
+    def pause(self, seconds):
+        """429 등으로 서버가 속도를 늦추라고 할 때 seconds 동안 모든 호출을 멈춥니다."""
+        with self._cond:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self._metrics['throttled'] += 1
+            self._cond.notify_all()
+
+    def count(self, name):
+        with self._cond:
+            self._metrics[name] += 1
+
+    def metrics(self):
+        with self._cond:
+            acquired = self._metrics['acquired']
+            return {
+                'name': self.name,
+                'requests_per_minute': self.requests_per_minute,
+                'tokens_per_minute': self.tokens_per_minute,
+                **self._metrics,
+                'acquired_by_priority': dict(self._metrics['acquired_by_priority']),
+                'queue_wait_seconds_avg': self._metrics['queue_wait_seconds_total'] / acquired if acquired else 0.0,
+            }
+
+
+_limiters = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(provider, model=None):
+    """
+    provider/model 별 프로세스 공용 RateLimiter 를 반환합니다.
+    한도는 settings.RATE_LIMITS[provider][model] 이 없으면 settings.RATE_LIMITS[provider]['default'] 를 사용합니다.
+    """
+    name = f"{provider}:{model}" if model else provider
+    limiter = _limiters.get(name)
+    if limiter is not None:
+        return limiter
+
+    with _limiters_lock:
+        limiter = _limiters.get(name)
+        if limiter is None:
+            limits = settings.RATE_LIMITS.get(provider, {})
+            config = limits.get(model) or limits['default']
+            limiter = RateLimiter(name, config['rpm'], config.get('tpm'))
+            _limiters[name] = limiter
+    return limiter
+
+
+def get_rate_limiter_metrics():
+    """모든 RateLimiter 의 대기 시간/재시도 지표를 반환합니다."""
+    with _limiters_lock:
+        limiters = list(_limiters.values())
+    return [limiter.metrics() for limiter in limiters]
+
+
+def _collect_rate_limiter_metrics():
+    """/metrics 조회 시점의 대기 중인 호출 수와 429 로 멈춘 횟수"""
+    limiters = get_rate_limiter_metrics()
+    return [
+        (
+            'leadscout_rate_limit_waiting', 'gauge', "호출 한도 대기열에서 기다리는 호출 수",
+            [({'limiter': item['name']}, item['waiting']) for item in limiters],
+        ),
+        (
+            'leadscout_rate_limit_throttled_total', 'counter', "429 응답으로 호출 한도를 일시 정지한 횟수",
+            [({'limiter': item['name']}, item['throttled']) for item in limiters],
+        ),
+    ]
+
+
+REGISTRY.register_collector(_collect_rate_limiter_metrics)
+
+
+def _status_and_headers(error):
+    """재시도 대상 오류이면 (status_code, headers)(연결 오류는 status_code=None), 아니면 False 를 반환합니다."""
+    if isinstance(error, (openai.APIConnectionError, requests.ConnectionError, requests.Timeout)):
+        return None, {}
+    if isinstance(error, openai.APIStatusError):
+        response = error.response
+    elif isinstance(error, requests.HTTPError):
+        response = error.response
+    else:
+        return False
+    if response is None or response.status_code not in RETRYABLE_STATUS_CODES:
+        return False
+    return response.status_code, response.headers
+
+
+def _retry_after_seconds(headers):
+    """Retry-After(초 또는 HTTP 날짜) / retry-after-ms 헤더 값을 초 단위로 반환합니다."""
+    value = headers.get('retry-after-ms')
+    if value:
+        try:
+            return float(value) / 1000.0
+        except ValueError:
+            pass
+    value = headers.get('retry-after')
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        try:
+            return max((parsedate_to_datetime(value).timestamp() - time.time()), 0.0)
+        except (TypeError, ValueError):
+            return None
+
+
+def call_with_rate_limit(limiter, call, estimated_tokens=0, usage_tokens=None):
+    """
+    limiter 에서 용량을 확보한 뒤 call() 을 실행하고, 429/5xx/연결 오류는 지터를 준 지수 백오프로 재시도합니다.
+
+    - Retry-After 헤더가 있으면 그 시간만큼 기다리고, 429 이면 limiter 전체를 그 시간 동안 멈춥니다.
+    - usage_tokens(result) 가 주어지면 응답의 실제 토큰 사용량으로 limiter 를 보정합니다.
+    - RATE_LIMIT_MAX_RETRIES 번 재시도해도 실패하면 RateLimitRetriesExhausted 를 발생시킵니다.
+    """
+    max_retries = settings.RATE_LIMIT_MAX_RETRIES
+    for attempt in range(max_retries + 1):
+        limiter.acquire(estimated_tokens)
+        started = time.perf_counter()
+        try:
+            result = call()
+        except Exception as e:
+            EXTERNAL_CALL_SECONDS.observe(time.perf_counter() - started, provider=limiter.name)
+            retryable = _status_and_headers(e)
+            if retryable is False:
+                EXTERNAL_CALLS.inc(provider=limiter.name, outcome='error')
+                limiter.reconcile(estimated_tokens, 0)
+                raise
+            status_code, headers = retryable
+            limiter.reconcile(estimated_tokens, 0)
+            if attempt >= max_retries:
+                EXTERNAL_CALLS.inc(provider=limiter.name, outcome='exhausted')
+                limiter.count('failures')
+                raise RateLimitRetriesExhausted(
+                    f"{limiter.name} 호출 실패 ({max_retries}회 재시도): {e}"
+                ) from e
+
+            backoff = min(settings.RATE_LIMIT_BACKOFF_MAX, settings.RATE_LIMIT_BACKOFF_BASE * 2 ** attempt)
+            retry_after = _retry_after_seconds(headers)
+            if retry_after is not None:
+                delay = retry_after + random.uniform(0, settings.RATE_LIMIT_BACKOFF_BASE)
+            else:
+                # full jitter
+                delay = random.uniform(0, backoff)
+            if status_code == 429:
+                limiter.pause(delay)
+            EXTERNAL_CALLS.inc(provider=limiter.name, outcome='retry')
+            limiter.count('retries')
+            print(f"⚠️ {limiter.name} {status_code or '연결 오류'}, {delay:.1f}초 후 재시도 ({attempt + 1}/{max_retries})")
+            time.sleep(delay)
+            continue
+
+        EXTERNAL_CALL_SECONDS.observe(time.perf_counter() - started, provider=limiter.name)
+        EXTERNAL_CALLS.inc(provider=limiter.name, outcome='ok')
+        if usage_tokens is not None:
+            limiter.reconcile(estimated_tokens, usage_tokens(result))
+        return result
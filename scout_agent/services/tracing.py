@@ -0,0 +1,117 @@
+# services/tracing.py
+import contextvars
+import logging
+import time
+import uuid
+from contextlib import contextmanager
+
+from .metrics import STAGE_SECONDS
+
+logger = logging.getLogger('scout_agent')
+
+_request_id = contextvars.ContextVar('request_id', default=None)
+# 현재 요청에서 끝난 span 목록 [(stage, 소요 시간(초))] - Server-Timing 헤더 작성용
+_spans = contextvars.ContextVar('request_spans', default=None)
+
+
+def current_request_id():
+    return _request_id.get()
+
+
+def new_request_id():
+    return uuid.uuid4().hex
+
+
+@contextmanager
+def request_context(request_id=None):
+    """
+    이 블록에서 기록하는 span 과 로그에 request_id 를 붙입니다.
+    블록 안에서 끝난 span 목록을 yield 합니다.
+    """
+    spans = []
+    previous = (_request_id.get(), _spans.get())
+    _request_id.set(request_id or new_request_id())
+    _spans.set(spans)
+    try:
+        yield spans
+    finally:
+        # 제너레이터(SSE 스트리밍) 안에서도 쓸 수 있도록 reset(token) 대신 이전 값으로 되돌림
+        _request_id.set(previous[0])
+        _spans.set(previous[1])
+
+
+def submit_in_context(executor, fn, *args, **kwargs):
+    """
+    현재 컨텍스트(request_id, 호출 우선순위 등 contextvars)를 복사해 executor 에서 fn 을 실행합니다.
+    ThreadPoolExecutor 는 contextvars 를 전달하지 않으므로 span 이 요청과 연결되도록 이 함수로 제출합니다.
+    """
+    context = contextvars.copy_context()
+    return executor.submit(context.run, fn, *args, **kwargs)
+
+
+def _finish(stage, started, outcome, attrs):
+    elapsed = time.perf_counter() - started
+    STAGE_SECONDS.observe(elapsed, stage=stage, outcome=outcome)
+    spans = _spans.get()
+    if spans is not None:
+        spans.append((stage, elapsed))
+    details = ''.join(f" {key}={value}" for key, value in attrs.items())
+    logger.info(f"span {stage} {outcome} {elapsed * 1000:.1f}ms{details}")
+
+
+@contextmanager
+def span(stage, **attrs):
+    """
+    블록의 소요 시간을 stage 이름으로 기록합니다 (leadscout_stage_duration_seconds, 로그, Server-Timing).
+    예외가 나면 outcome=error 로 기록하고 예외를 그대로 전달합니다.
+    """
+    started = time.perf_counter()
+    try:
+        yield attrs
+    except BaseException:
+        _finish(stage, started, 'error', attrs)
+        raise
+    _finish(stage, started, 'ok', attrs)
+
+
+class StageTimer:
+    """
+    순서대로 진행되는 단계를 span 으로 기록합니다. start() 로 다음 단계를 시작하면 이전 단계가 끝납니다.
+    예: LeadScoutAgent 의 loading_company -> analyzing_pdfs -> generating_leads -> saving_leads
+    """
+
+    def __init__(self, prefix):
+        self.prefix = prefix
+        self._stage = None
+        self._started = None
+
+    def start(self, stage):
+        self.stop()
+        self._stage = f"{self.prefix}.{stage}"
+        self._started = time.perf_counter()
+
+    def stop(self, outcome='ok'):
+        if self._stage is None:
+            return
+        _finish(self._stage, self._started, outcome, {})
+        self._stage = None
+
+
+class RequestIdLogFilter(logging.Filter):
+    """로그 레코드에 request_id 속성을 추가합니다 (요청 밖에서는 '-')."""
+
+    def filter(self, record):
+        record.request_id = _request_id.get() or '-'
+        return True
+
+
+def server_timing(spans, db_seconds=None):
+    """span 목록을 단계별로 합산해 Server-Timing 헤더 값으로 만듭니다."""
+    totals = {}
+    for stage, elapsed in list(spans):
+        totals[stage] = totals.get(stage, 0.0) + elapsed
+    if db_seconds:
+        totals['db'] = db_seconds
+    return ', '.join(
+        f"{stage};dur={elapsed * 1000:.1f}" for stage, elapsed in totals.items()
+    )
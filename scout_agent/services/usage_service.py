@@ -0,0 +1,254 @@
+# services/usage_service.py
+import contextvars
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, time as datetime_time
+from decimal import Decimal
+
+from django.conf import settings
+from django.db import DatabaseError
+from django.utils import timezone
+
+from scout_agent.models import APIUsage
+from ..repository.api_usage_repository import bulk_create_api_usages, get_api_cost_since
+from .metrics import API_COST, BUDGET_REJECTIONS, LLM_TOKENS
+from .tracing import current_request_id
+
+_MILLION = Decimal(1000000)
+_COST_PLACES = Decimal('0.000001')
+
+# (UsageTracker, operation, company_id)
+_scope = contextvars.ContextVar('usage_scope', default=None)
+
+
+class BudgetExceeded(Exception):
+    """요청/일 비용 한도에 도달해 외부 API 를 더 호출하지 않을 때 발생합니다."""
+
+
+class UsageTracker:
+    """
+    최상위 usage_scope 하나(= API 요청 또는 작업 1건)에서 발생한 외부 API 호출 기록과 비용 합계입니다.
+    스레드 풀 작업도 submit_in_context 로 제출하면 같은 tracker 에 기록합니다.
+    """
+
+    def __init__(self, budget):
+        self.budget = budget
+        self.records = []
+        self.cost = Decimal(0)
+        self.budget_exceeded = False
+        self._lock = threading.Lock()
+
+    def add(self, record):
+        with self._lock:
+            self.records.append(record)
+            self.cost += record.cost
+
+    def summary(self):
+        with self._lock:
+            return {
+                "calls": len(self.records),
+                "cost_usd": float(self.cost),
+                "budget_usd": float(self.budget) if self.budget else None,
+                "budget_exceeded": self.budget_exceeded,
+            }
+
+
+class DailyCostLedger:
+    """
+    오늘(settings.TIME_ZONE 기준) 외부 API 예상 비용 합계입니다.
+    이 프로세스의 기록은 즉시 더하고, refresh_interval 마다 DB 합계를 다시 읽어 다른 프로세스의 사용량도 반영합니다.
+    """
+
+    def __init__(self, refresh_interval=None):
+        self.refresh_interval = refresh_interval or settings.COST_LEDGER_REFRESH_SECONDS
+        self._lock = threading.Lock()
+        self._day = None
+        self._spent = Decimal(0)
+        self._loaded_at = None
+
+    def _refresh(self):
+        today = timezone.localdate()
+        now = time.monotonic()
+        if self._day == today and now - self._loaded_at < self.refresh_interval:
+            return
+        start = timezone.make_aware(datetime.combine(today, datetime_time.min))
+        try:
+            db_total = Decimal(get_api_cost_since(start))
+        except DatabaseError as e:
+            print(f"⚠️ 일 비용 합계 조회 실패: {e}")
+            db_total = Decimal(0)
+        # 아직 저장되지 않은(요청 진행 중) 이 프로세스의 비용이 있으므로 같은 날이면 큰 값을 사용
+        self._spent = max(self._spent, db_total) if self._day == today else db_total
+        self._day = today
+        self._loaded_at = now
+
+    def spent(self):
+        with self._lock:
+            self._refresh()
+            return self._spent
+
+    def add(self, cost):
+        with self._lock:
+            self._refresh()
+            self._spent += cost
+
+
+_ledger = None
+_ledger_lock = threading.Lock()
+
+
+def get_daily_cost_ledger():
+    """프로세스 공용 DailyCostLedger 를 반환합니다."""
+    global _ledger
+    if _ledger is None:
+        with _ledger_lock:
+            if _ledger is None:
+                _ledger = DailyCostLedger()
+    return _ledger
+
+
+def _budget(value):
+    return Decimal(str(value)) if value else None
+
+
+@contextmanager
+def usage_scope(operation, company_id=None):
+    """
+    이 블록에서 발생한 OpenAI/Tavily 호출을 operation, company_id, request_id 와 함께 기록합니다.
+
+    - 가장 바깥 블록이 끝날 때 기록을 한 번의 INSERT 로 저장합니다.
+    - 안쪽 블록(예: find_leads 안의 analyze_pdf)은 같은 tracker 를 쓰고 operation 만 바꿉니다.
+    - 요청 비용 한도(REQUEST_COST_BUDGET)는 가장 바깥 블록 단위로 적용합니다.
+
+    Yields:
+        UsageTracker
+    """
+    parent = _scope.get()
+    if parent is not None:
+        tracker = parent[0]
+        company_id = company_id or parent[2]
+    else:
+        tracker = UsageTracker(_budget(settings.REQUEST_COST_BUDGET))
+
+    # 제너레이터(SSE 스트리밍) 안에서도 쓸 수 있도록 reset(token) 대신 이전 값으로 되돌림
+    _scope.set((tracker, operation, company_id))
+    try:
+        yield tracker
+    finally:
+        _scope.set(parent)
+        if parent is None:
+            _save(tracker.records)
+
+
+def _save(records):
+    if not records:
+        return
+    try:
+        bulk_create_api_usages(records)
+    except DatabaseError as e:
+        # 사용량 기록 실패로 응답이 실패하지 않도록 로그만 남김
+        print(f"⚠️ API 사용량 저장 실패 ({len(records)}건): {e}")
+
+
+def check_budget():
+    """요청 또는 오늘의 비용 한도에 도달했으면 BudgetExceeded 를 발생시킵니다. 외부 API 호출 직전에 호출합니다."""
+    scope = _scope.get()
+    tracker = scope[0] if scope else None
+
+    daily_budget = _budget(settings.DAILY_COST_BUDGET)
+    if daily_budget and get_daily_cost_ledger().spent() >= daily_budget:
+        budget, message = 'daily', f"오늘 외부 API 비용 한도(${daily_budget})에 도달했습니다."
+    elif tracker is not None and tracker.budget and tracker.cost >= tracker.budget:
+        budget, message = 'request', f"요청당 외부 API 비용 한도(${tracker.budget})에 도달했습니다."
+    else:
+        return
+
+    if tracker is not None:
+        tracker.budget_exceeded = True
+    BUDGET_REJECTIONS.inc(budget=budget)
+    raise BudgetExceeded(message)
+
+
+def _pricing(model):
+    pricing = settings.LLM_PRICING
+    if model in pricing:
+        return pricing[model]
+    # 날짜가 붙은 스냅샷 이름(gpt-4o-2024-08-06 등)은 가장 긴 접두어 모델 단가 사용
+    prefixes = [name for name in pricing if name != 'default' and model and model.startswith(name)]
+    return pricing[max(prefixes, key=len)] if prefixes else pricing['default']
+
+
+def llm_cost(model, prompt_tokens, cached_tokens, completion_tokens, tool_calls=0):
+    """OpenAI 호출 1건의 예상 비용 (USD, Decimal)"""
+    pricing = _pricing(model)
+    cost = (
+        Decimal(prompt_tokens - cached_tokens) * Decimal(str(pricing['input']))
+        + Decimal(cached_tokens) * Decimal(str(pricing['cached_input']))
+        + Decimal(completion_tokens) * Decimal(str(pricing['output']))
+    ) / _MILLION
+    cost += Decimal(tool_calls) * Decimal(str(settings.OPENAI_WEB_SEARCH_CALL_COST))
+    return cost.quantize(_COST_PLACES)
+
+
+def _record(provider, model, latency, cost, success, **counts):
+    scope = _scope.get()
+    tracker, operation, company_id = scope if scope else (None, 'unknown', None)
+    record = APIUsage(
+        request_id=current_request_id(),
+        company_id=company_id,
+        operation=operation,
+        provider=provider,
+        model=model or '',
+        latency_ms=int(latency * 1000),
+        cost=cost,
+        success=success,
+        **counts,
+    )
+    API_COST.inc(float(cost), provider=provider, model=model or '', operation=operation)
+    get_daily_cost_ledger().add(cost)
+    if tracker is not None:
+        tracker.add(record)
+    else:
+        _save([record])
+
+
+def _usage_tokens(usage):
+    """ChatCompletion / Responses 의 usage 에서 (prompt, cached, completion) 토큰 수를 꺼냅니다."""
+    if usage is None:
+        return 0, 0, 0
+    if getattr(usage, 'prompt_tokens', None) is not None:
+        details = getattr(usage, 'prompt_tokens_details', None)
+        return usage.prompt_tokens, getattr(details, 'cached_tokens', 0) or 0, usage.completion_tokens or 0
+    details = getattr(usage, 'input_tokens_details', None)
+    return usage.input_tokens or 0, getattr(details, 'cached_tokens', 0) or 0, usage.output_tokens or 0
+
+
+def record_llm_call(model, response, latency, success=True):
+    """OpenAI 호출 1건을 기록합니다. 실패한 호출(response=None)은 비용 0 으로 기록합니다."""
+    prompt_tokens, cached_tokens, completion_tokens = _usage_tokens(getattr(response, 'usage', None))
+    # Responses API 웹 검색 도구 호출 수
+    tool_calls = sum(
+        1 for item in (getattr(response, 'output', None) or []) if getattr(item, 'type', None) == 'web_search_call'
+    )
+    LLM_TOKENS.inc(prompt_tokens, model=model or 'unknown', kind='prompt')
+    LLM_TOKENS.inc(completion_tokens, model=model or 'unknown', kind='completion')
+    _record(
+        APIUsage.PROVIDER_OPENAI, model, latency,
+        llm_cost(model, prompt_tokens, cached_tokens, completion_tokens, tool_calls) if success else Decimal(0),
+        success,
+        prompt_tokens=prompt_tokens,
+        cached_tokens=cached_tokens,
+        completion_tokens=completion_tokens,
+        tool_calls=tool_calls,
+    )
+
+
+def record_tavily_call(search_depth, latency, success=True):
+    """Tavily 검색 1건을 기록합니다 (basic 1크레딧, advanced 2크레딧)."""
+    credits = 2 if search_depth == 'advanced' else 1
+    cost = (Decimal(credits) * Decimal(str(settings.TAVILY_CREDIT_COST))).quantize(_COST_PLACES)
+    _record(
+        APIUsage.PROVIDER_TAVILY, search_depth, latency, cost if success else Decimal(0), success,
+        tool_calls=credits,
+    )
@@ -0,0 +1,68 @@
+import contextlib
+import io
+import tempfile
+
+from django.test import TestCase, override_settings
+
+from scout_agent.benchmark.fake_api import FakeAPIServer
+from scout_agent.management.commands.benchmark_endpoints import UNLIMITED_RATE_LIMITS
+from scout_agent.services import client_registry, llm_cache, rate_limiter, usage_service
+
+
+class FakeAPITestCase(TestCase):
+    """
+    OpenAI/Tavily/PDF 다운로드를 로컬 FakeAPIServer 로 대신하는 테스트 기반 클래스입니다.
+
+    - 클래스마다 가짜 서버 하나를 띄우고(fake_api_options 로 응답/오류율 지정), settings 를 그 서버로 돌립니다.
+    - LLM/Tavily 캐시는 임시 디렉터리를 쓰며 기본으로 꺼 두고, 호출 한도와 비용 한도는 두지 않습니다.
+    - 서비스의 print 로그는 테스트 출력에서 숨깁니다.
+    """
+
+    fake_api_options = {}
+    settings_overrides = {}
+
+    @classmethod
+    def setUpClass(cls):
+        cls.fake_api = FakeAPIServer(**cls.fake_api_options).start()
+        cls.addClassCleanup(cls.fake_api.stop)
+        cache_dir = tempfile.TemporaryDirectory(prefix='leadscout-test-')
+        cls.addClassCleanup(cache_dir.cleanup)
+
+        settings = override_settings(**{
+            'OPENAI_API_KEY': 'test',
+            'OPENAI_BASE_URL': f"{cls.fake_api.url}/v1",
+            'TAVILY_API_KEY': 'test',
+            'TAVILY_API_URL': f"{cls.fake_api.url}/search",
+            'LLM_CACHE_ENABLED': False,
+            'LLM_CACHE_PATH': f"{cache_dir.name}/llm_responses.sqlite3",
+            'TAVILY_CACHE_ENABLED': False,
+            'TAVILY_CACHE_PATH': f"{cache_dir.name}/tavily_search.sqlite3",
+            'RATE_LIMITS': UNLIMITED_RATE_LIMITS,
+            'REQUEST_COST_BUDGET': 0,
+            'DAILY_COST_BUDGET': 0,
+            **cls.settings_overrides,
+        })
+        settings.enable()
+        cls.addClassCleanup(settings.disable)
+        # 공용 OpenAI 클라이언트와 호출 한도는 만들 때의 settings(base_url, RATE_LIMITS)를 쓰므로 새로 만들게 함
+        client_registry._openai_clients.clear()
+        rate_limiter._limiters.clear()
+        # 응답 캐시도 클래스마다 새 임시 파일을 사용
+        llm_cache._llm_cache = None
+        super().setUpClass()
+
+    def setUp(self):
+        super().setUp()
+        # 일 비용 합계는 프로세스 공용이므로 테스트마다 새로 계산
+        usage_service._ledger = None
+        self._stats_before = self.fake_api.stats()
+        stdout = contextlib.redirect_stdout(io.StringIO())
+        stdout.__enter__()
+        self.addCleanup(stdout.__exit__, None, None, None)
+
+    def upstream_calls(self, path):
+        """이 테스트에서 보낸 가짜 서버 path 경로의 호출 수 (성공 + 오류)"""
+        def total(stats):
+            counts = stats.get(path, {})
+            return counts.get("ok", 0) + counts.get("error", 0)
+        return total(self.fake_api.stats()) - total(self._stats_before)
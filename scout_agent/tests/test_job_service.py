@@ -0,0 +1,67 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from scout_agent.models import CompanyData, LeadScoutJob
+from scout_agent.services.job_service import fail_stale_jobs
+
+
+@override_settings(LEAD_SCOUT_JOB_TIMEOUT=600)
+class StaleJobTests(TestCase):
+
+    def setUp(self):
+        self.company = CompanyData.objects.create(company="소스 회사")
+        patcher = mock.patch('builtins.print')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def create_job(self, status, age_seconds):
+        job = LeadScoutJob.objects.create(company=self.company, status=status)
+        at = timezone.now() - timedelta(seconds=age_seconds)
+        LeadScoutJob.objects.filter(id=job.id).update(
+            created_at=at, started_at=at if status == LeadScoutJob.STATUS_RUNNING else None
+        )
+        return job
+
+    def status_of(self, job):
+        job.refresh_from_db()
+        return job.status
+
+    def test_old_pending_and_running_jobs_are_failed(self):
+        old_pending = self.create_job(LeadScoutJob.STATUS_PENDING, 700)
+        old_running = self.create_job(LeadScoutJob.STATUS_RUNNING, 700)
+        fresh_running = self.create_job(LeadScoutJob.STATUS_RUNNING, 60)
+        finished = self.create_job(LeadScoutJob.STATUS_SUCCESS, 700)
+
+        self.assertEqual(fail_stale_jobs(), 2)
+
+        self.assertEqual(self.status_of(old_pending), LeadScoutJob.STATUS_ERROR)
+        self.assertEqual(self.status_of(old_running), LeadScoutJob.STATUS_ERROR)
+        self.assertIsNotNone(old_running.finished_at)
+        self.assertEqual(self.status_of(fresh_running), LeadScoutJob.STATUS_RUNNING)
+        self.assertEqual(self.status_of(finished), LeadScoutJob.STATUS_SUCCESS)
+
+    def test_status_view_reports_stale_job_as_error(self):
+        stale = self.create_job(LeadScoutJob.STATUS_RUNNING, 700)
+        other = self.create_job(LeadScoutJob.STATUS_RUNNING, 700)
+
+        body = self.client.get(f'/api/scout/find-leads/jobs/{stale.id}/').json()
+
+        self.assertEqual(body["status"], LeadScoutJob.STATUS_ERROR)
+        self.assertIn("600초", body["error"])
+        self.assertIsNotNone(body["finished_at"])
+        # 조회한 작업만 확인
+        self.assertEqual(self.status_of(other), LeadScoutJob.STATUS_RUNNING)
+
+    def test_startup_command_can_fail_every_unfinished_job(self):
+        self.create_job(LeadScoutJob.STATUS_PENDING, 1)
+        self.create_job(LeadScoutJob.STATUS_RUNNING, 1)
+
+        call_command('fail_stale_jobs', stdout=mock.Mock())
+        self.assertFalse(LeadScoutJob.objects.filter(status=LeadScoutJob.STATUS_ERROR).exists())
+
+        call_command('fail_stale_jobs', '--all', stdout=mock.Mock())
+        self.assertEqual(LeadScoutJob.objects.filter(status=LeadScoutJob.STATUS_ERROR).count(), 2)
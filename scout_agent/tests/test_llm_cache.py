@@ -0,0 +1,34 @@
+from scout_agent.models import CompanyData
+from scout_agent.services.client_registry import get_openai_client
+from scout_agent.services.llm_cache import cached_chat_completion, get_llm_cache
+from scout_agent.services.openai_service import OpenAIService
+
+from .base import FakeAPITestCase
+
+
+class LLMResponseCacheTests(FakeAPITestCase):
+    settings_overrides = {'LLM_CACHE_ENABLED': True}
+
+    def chat(self):
+        return cached_chat_completion(
+            get_openai_client(), model="gpt-4o", messages=[{"role": "user", "content": "안녕하세요"}]
+        )
+
+    def test_same_chat_completion_is_served_from_cache(self):
+        first = self.chat()
+        second = self.chat()
+
+        self.assertEqual(first.choices[0].message.content, second.choices[0].message.content)
+        self.assertEqual(self.upstream_calls("/v1/chat/completions"), 1)
+        self.assertEqual(get_llm_cache().stats()["hits"], 1)
+
+    def test_web_search_lead_generation_is_not_cached(self):
+        company = CompanyData.objects.create(company="소스 회사", industry="IT 서비스")
+        entries = get_llm_cache().stats()["entries"]
+
+        for _ in range(2):
+            leads = OpenAIService().generate_potential_leads(company)
+            self.assertEqual(len(leads["leads"]), 5)
+
+        self.assertEqual(self.upstream_calls("/v1/responses"), 2)
+        self.assertEqual(get_llm_cache().stats()["entries"], entries)
@@ -0,0 +1,40 @@
+from django.test import SimpleTestCase, override_settings
+
+
+@override_settings(METRICS_ALLOWED_IPS=['127.0.0.1', '10.0.0.0/8'], METRICS_TOKEN='secret')
+class MetricsViewAccessTests(SimpleTestCase):
+
+    def test_allowed_ip_and_cidr_can_scrape(self):
+        for address in ('127.0.0.1', '10.1.2.3'):
+            with self.subTest(address=address):
+                response = self.client.get('/metrics', REMOTE_ADDR=address)
+                self.assertEqual(response.status_code, 200)
+                self.assertIn(b'leadscout_http_request_duration_seconds', response.content)
+
+    def test_other_ip_is_forbidden_even_with_forwarded_header(self):
+        response = self.client.get('/metrics', REMOTE_ADDR='203.0.113.5', HTTP_X_FORWARDED_FOR='127.0.0.1')
+
+        self.assertEqual(response.status_code, 403)
+
+    def test_bearer_token_allows_other_ip(self):
+        ok = self.client.get('/metrics', REMOTE_ADDR='203.0.113.5', HTTP_AUTHORIZATION='Bearer secret')
+        wrong = self.client.get('/metrics', REMOTE_ADDR='203.0.113.5', HTTP_AUTHORIZATION='Bearer wrong')
+
+        self.assertEqual(ok.status_code, 200)
+        self.assertEqual(wrong.status_code, 403)
+
+    @override_settings(METRICS_TOKEN='')
+    def test_empty_token_setting_does_not_accept_empty_bearer(self):
+        response = self.client.get('/metrics', REMOTE_ADDR='203.0.113.5', HTTP_AUTHORIZATION='Bearer ')
+
+        self.assertEqual(response.status_code, 403)
+
+    def test_rate_limit_metrics_use_the_same_access_check(self):
+        allowed = self.client.get('/api/scout/rate-limits/', REMOTE_ADDR='10.1.2.3')
+        token = self.client.get('/api/scout/rate-limits/', REMOTE_ADDR='203.0.113.5', HTTP_AUTHORIZATION='Bearer secret')
+        forbidden = self.client.get('/api/scout/rate-limits/', REMOTE_ADDR='203.0.113.5')
+
+        self.assertEqual(allowed.status_code, 200)
+        self.assertIn('limiters', allowed.json())
+        self.assertEqual(token.status_code, 200)
+        self.assertEqual(forbidden.status_code, 403)
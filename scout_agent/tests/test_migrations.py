@@ -0,0 +1,63 @@
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django.test import TransactionTestCase
+
+
+class MigrationTestCase(TransactionTestCase):
+    """migrate_from 상태에서 데이터를 만들고 migrate_to 까지 적용한 뒤 결과를 확인하는 기반 클래스입니다."""
+
+    migrate_from = None
+    migrate_to = None
+
+    def setUp(self):
+        super().setUp()
+        self.old_apps = self.migrate([('scout_agent', self.migrate_from)])
+        self.addCleanup(self.migrate, MigrationExecutor(connection).loader.graph.leaf_nodes())
+
+    def migrate(self, targets):
+        executor = MigrationExecutor(connection)
+        executor.loader.build_graph()
+        executor.migrate(targets)
+        return executor.loader.project_state(targets).apps
+
+
+class MergeDuplicateCompaniesMigrationTests(MigrationTestCase):
+    migrate_from = '0010_leadprospect_ranking_created_at'
+    migrate_to = '0011_companydata_normalized_name'
+
+    def test_companies_with_same_normalized_name_are_merged(self):
+        apps = self.old_apps
+        CompanyData = apps.get_model('scout_agent', 'CompanyData')
+        CompanyProfile = apps.get_model('scout_agent', 'CompanyProfile')
+        LeadProspect = apps.get_model('scout_agent', 'LeadProspect')
+
+        keep = CompanyData.objects.create(company="(주)가나다")
+        duplicate = CompanyData.objects.create(company="가나다 Inc.", homepage="https://ganada.example.com")
+        source = CompanyData.objects.create(company="소스 회사")
+        other = CompanyData.objects.create(company="다른 회사")
+        CompanyProfile.objects.create(company=duplicate, file_name="a.pdf", url="https://example.com/a.pdf")
+        old_lead = LeadProspect.objects.create(source_company=source, prospect_company=keep, relevance_score=0.5)
+        new_lead = LeadProspect.objects.create(source_company=source, prospect_company=duplicate, relevance_score=0.9)
+        LeadProspect.objects.create(source_company=duplicate, prospect_company=other, relevance_score=0.7)
+        LeadProspect.objects.create(source_company=keep, prospect_company=duplicate, relevance_score=0.8)
+
+        apps = self.migrate([('scout_agent', self.migrate_to)])
+        CompanyData = apps.get_model('scout_agent', 'CompanyData')
+        CompanyProfile = apps.get_model('scout_agent', 'CompanyProfile')
+        LeadProspect = apps.get_model('scout_agent', 'LeadProspect')
+
+        self.assertFalse(CompanyData.objects.filter(id=duplicate.id).exists())
+        merged = CompanyData.objects.get(id=keep.id)
+        self.assertEqual(merged.normalized_name, "가나다")
+        self.assertEqual(merged.homepage, "https://ganada.example.com")
+        self.assertEqual(CompanyProfile.objects.get().company_id, keep.id)
+
+        lead = LeadProspect.objects.get(source_company_id=source.id)
+        self.assertEqual(lead.id, new_lead.id)
+        self.assertEqual(lead.prospect_company_id, keep.id)
+        self.assertEqual(lead.relevance_score, 0.9)
+        self.assertEqual(lead.created_at, old_lead.created_at)
+        self.assertTrue(LeadProspect.objects.filter(source_company_id=keep.id, prospect_company_id=other.id).exists())
+        # 자기 자신을 가리키게 된 리드는 삭제
+        self.assertFalse(LeadProspect.objects.filter(source_company_id=keep.id, prospect_company_id=keep.id).exists())
+        self.assertEqual(LeadProspect.objects.count(), 2)
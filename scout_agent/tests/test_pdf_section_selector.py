@@ -0,0 +1,48 @@
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from scout_agent.services.pdf_section_selector import PDFSectionSelector, estimate_tokens, split_sections
+
+FILLER = "이 문단은 회사 연혁과 무관한 일반적인 설명으로 채워져 있습니다. " * 8
+
+
+class PDFSectionSelectorTests(SimpleTestCase):
+
+    def setUp(self):
+        patcher = mock.patch('builtins.print')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_text_within_budget_is_returned_unchanged(self):
+        text = "회사 소개\n\n매출액 120억원"
+        self.assertEqual(PDFSectionSelector(token_budget=1000).select(text), text)
+
+    def test_split_sections_respects_section_chars(self):
+        text = "\n\n".join(["가" * 300] * 5 + ["나" * 700])
+        sections = split_sections(text, section_chars=500)
+
+        self.assertTrue(all(len(section) <= 500 for section in sections))
+        self.assertEqual("".join(sections).replace("\n", ""), text.replace("\n", ""))
+
+    def test_relevant_sections_are_selected_in_document_order(self):
+        cover = "주식회사 테스트 회사소개 브로슈어"
+        sales = "2023년 매출액 120억원, 영업이익 15억원을 기록했습니다."
+        contact = "본사 주소: 서울특별시 강남구 테헤란로 1, 전화 02-1234-5678, 이메일 contact@test.co.kr"
+        text = "\n\n".join([cover] + [FILLER] * 6 + [sales] + [FILLER] * 6 + [contact] + [FILLER] * 6)
+
+        budget = estimate_tokens(cover + sales + contact) + estimate_tokens(FILLER) // 2
+        selected = PDFSectionSelector(token_budget=budget, section_chars=len(FILLER)).select(text)
+
+        self.assertLessEqual(estimate_tokens(selected), budget)
+        self.assertEqual(selected, "\n\n".join([cover, sales, contact]))
+
+    def test_fields_limit_scoring(self):
+        sales = "2023년 매출액 120억원"
+        contact = "대표 전화 02-1234-5678"
+        text = "\n\n".join(["표지"] + [FILLER] * 3 + [contact] + [FILLER] * 3 + [sales])
+
+        budget = estimate_tokens("표지" + sales) + 5
+        selected = PDFSectionSelector(token_budget=budget, section_chars=len(FILLER), fields=['sales']).select(text)
+
+        self.assertEqual(selected, "\n\n".join(["표지", sales]))
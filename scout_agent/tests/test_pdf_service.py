@@ -0,0 +1,114 @@
+from unittest import mock
+
+import fitz
+from django.conf import settings
+from django.test import override_settings
+
+from scout_agent.benchmark.fake_api import build_sample_pdf
+from scout_agent.models import CompanyData, CompanyProfile, PDFAnalysis
+from scout_agent.services.pdf_downloader import DownloadedPDF
+from scout_agent.services.pdf_section_selector import estimate_tokens
+from scout_agent.services.pdf_service import PDFAnalysisService
+
+from .base import FakeAPITestCase
+
+
+def create_profile(fake_api, company_name, file_name='brochure.pdf'):
+    company = CompanyData.objects.create(company=company_name)
+    return CompanyProfile.objects.create(
+        company=company, file_name=file_name, url=f"{fake_api.url}/files/{file_name}"
+    )
+
+
+class PDFAnalysisReuseTests(FakeAPITestCase):
+
+    def test_same_pdf_is_analyzed_once(self):
+        first = create_profile(self.fake_api, "소스 회사 A")
+        second = create_profile(self.fake_api, "소스 회사 B")
+
+        info = PDFAnalysisService().analyze_company_pdf(first)
+        reused = PDFAnalysisService().analyze_company_pdf(second)
+
+        self.assertEqual(info["industry"], "IT 서비스")
+        self.assertEqual(reused["industry"], "IT 서비스")
+        self.assertEqual(self.upstream_calls("/v1/chat/completions"), 1)
+        self.assertEqual(PDFAnalysis.objects.count(), 2)
+
+
+class PDFAnalysisEmptyExtractionTests(FakeAPITestCase):
+    fake_api_options = {
+        "payloads": {
+            "openai": [{"endpoint": "chat.completions", "match": "company analysis expert", "content": {}}],
+        },
+    }
+
+    def test_empty_extraction_is_not_saved_or_reused(self):
+        profile = create_profile(self.fake_api, "소스 회사")
+
+        self.assertEqual(PDFAnalysisService().analyze_company_pdf(profile), {})
+        self.assertEqual(PDFAnalysisService().analyze_company_pdf(profile), {})
+
+        # 빈 분석본이 없으므로 두 번째 호출도 304/해시 재사용 없이 다시 LLM 을 호출
+        self.assertEqual(self.upstream_calls("/v1/chat/completions"), 2)
+        self.assertFalse(PDFAnalysis.objects.exists())
+        profile.refresh_from_db()
+        self.assertIsNone(profile.pdf_etag)
+        self.assertIsNone(profile.pdf_last_modified)
+
+
+def build_brochure_pdf(pages, contact_page):
+    """contact_page 쪽에만 연락처/매출 정보가 있고 나머지는 관련 없는 문장인 PDF 바이트를 만듭니다."""
+    document = fitz.open()
+    for page_number in range(1, pages + 1):
+        if page_number == contact_page:
+            lines = [
+                "Contact us: email contact@acme.example, phone 02-1234-5678",
+                "Headquarters address: 1 Teheran-ro, Seoul",
+                "Annual revenue and sales grew 40 percent; CEO Jane Kim",
+            ]
+        else:
+            lines = [f"Page {page_number}, line {line}: the river ran quietly past the old mill." for line in range(40)]
+        document.new_page().insert_text((72, 72), "\n".join(lines), fontsize=9)
+    try:
+        return document.tobytes()
+    finally:
+        document.close()
+
+
+class PDFTextSelectionTests(FakeAPITestCase):
+
+    def extract_text(self, pdf_bytes=None, **overrides):
+        """PDF(기본 40쪽 샘플)에서 LLM 에 보낼 텍스트를 추출하고 (텍스트, 추출기 extract mock) 을 반환합니다."""
+        pdf_bytes = pdf_bytes or build_sample_pdf(40)
+        with override_settings(**overrides), DownloadedPDF(data=pdf_bytes, size=len(pdf_bytes)) as downloaded:
+            service = PDFAnalysisService()
+            with mock.patch.object(service.text_extractor, 'extract', wraps=service.text_extractor.extract) as extract:
+                return service._extract_text_from_pdf(downloaded), extract
+
+    def test_disabled_selection_reads_prefix_only(self):
+        text, extract = self.extract_text(PDF_SECTION_SELECTION_ENABLED=False, PDF_TEXT_MAX_CHARS=2000)
+
+        self.assertEqual(len(text), 2000)
+        self.assertEqual(extract.call_args.kwargs, {'max_chars': 2000})
+
+    def test_section_selection_reads_bounded_prefix(self):
+        text, extract = self.extract_text(
+            PDF_SECTION_SELECTION_ENABLED=True, PDF_SECTION_SOURCE_MAX_CHARS=20000, PDF_PROMPT_TOKEN_BUDGET=1000
+        )
+
+        self.assertEqual(extract.call_args.kwargs, {'max_chars': 20000})
+        self.assertLessEqual(estimate_tokens(text), 1000)
+        self.assertIn("page 1,", text)
+
+    def test_selection_finds_fields_past_the_head_limit(self):
+        pdf_bytes = build_brochure_pdf(pages=40, contact_page=30)
+
+        head, _ = self.extract_text(pdf_bytes, PDF_SECTION_SELECTION_ENABLED=False, PDF_TEXT_MAX_CHARS=15000)
+        selected, _ = self.extract_text(pdf_bytes)
+
+        self.assertTrue(settings.PDF_SECTION_SELECTION_ENABLED)
+        self.assertNotIn("contact@acme.example", head)
+        self.assertIn("contact@acme.example", selected)
+        self.assertIn("CEO Jane Kim", selected)
+        self.assertIn("Page 1, line 0", selected)
+        self.assertLessEqual(estimate_tokens(selected), settings.PDF_PROMPT_TOKEN_BUDGET)
@@ -0,0 +1,93 @@
+import os
+from unittest import mock
+
+from django.test import SimpleTestCase, override_settings
+
+from scout_agent.benchmark.fake_api import build_sample_pdf
+from scout_agent.services import pdf_text_extractor
+from scout_agent.services.pdf_downloader import DownloadedPDF
+from scout_agent.services.pdf_text_extractor import PDFTextExtractor
+
+
+@override_settings(PDF_EXTRACTION_WORKERS=2)
+class PDFTextExtractorTests(SimpleTestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.pdf_bytes = build_sample_pdf(12)
+
+    def downloaded(self):
+        downloaded = DownloadedPDF(data=self.pdf_bytes, size=len(self.pdf_bytes))
+        self.addCleanup(downloaded.close)
+        return downloaded
+
+    def extract(self, downloaded, **kwargs):
+        with mock.patch('builtins.print'):
+            return PDFTextExtractor(parallel_min_pages=100, pages_per_task=5).extract(downloaded, **kwargs)
+
+    def test_max_chars_stops_before_last_page(self):
+        full = self.extract(self.downloaded())
+        result = self.extract(self.downloaded(), max_chars=100)
+
+        self.assertEqual(result.text, full.text[:100])
+        self.assertTrue(result.truncated)
+        self.assertEqual(result.pages_parsed, 1)
+        self.assertEqual(result.page_count, 12)
+
+    def test_parallel_extraction_passes_file_path_to_workers(self):
+        sequential = self.extract(self.downloaded())
+        downloaded = self.downloaded()
+
+        pool = pdf_text_extractor._get_process_pool()
+        with mock.patch.object(pool, 'submit', wraps=pool.submit) as submit, mock.patch('builtins.print'):
+            result = PDFTextExtractor(parallel_min_pages=5, pages_per_task=5).extract(downloaded)
+
+        self.assertEqual(result.text, sequential.text)
+        self.assertEqual(result.pages_parsed, 12)
+        self.assertTrue(result.parallel)
+        # 첫 5페이지는 직접 읽고 나머지 [5, 10), [10, 12) 만 워커에 제출
+        self.assertEqual(submit.call_count, 2)
+        sources = {call.args[1] for call in submit.call_args_list}
+        self.assertEqual(sources, {downloaded.path})
+        self.assertTrue(os.path.exists(downloaded.path))
+
+        path = downloaded.path
+        downloaded.close()
+        self.assertFalse(os.path.exists(path))
+
+    def test_parallel_extraction_stops_at_max_chars(self):
+        full = self.extract(self.downloaded())
+        page_chars = len(full.text) // 12
+        downloaded = self.downloaded()
+
+        pool = pdf_text_extractor._get_process_pool()
+        with mock.patch.object(pool, 'submit', wraps=pool.submit) as submit, mock.patch('builtins.print'):
+            result = PDFTextExtractor(parallel_min_pages=5, pages_per_task=2).extract(
+                downloaded, max_chars=page_chars * 5
+            )
+
+        self.assertEqual(result.text, full.text[:page_chars * 5])
+        self.assertTrue(result.parallel)
+        self.assertTrue(result.truncated)
+        self.assertEqual(result.pages_parsed, 6)
+        # 워커 수(2)만큼만 미리 제출하므로 [2, 4), [4, 6), [6, 8) 까지만 제출
+        self.assertEqual(submit.call_count, 3)
+
+    def test_small_budget_never_uses_the_process_pool(self):
+        with mock.patch.object(pdf_text_extractor, '_get_process_pool') as get_pool, mock.patch('builtins.print'):
+            result = PDFTextExtractor(parallel_min_pages=5, pages_per_task=5).extract(
+                self.downloaded(), max_chars=100
+            )
+
+        get_pool.assert_not_called()
+        self.assertFalse(result.parallel)
+        self.assertEqual(result.pages_parsed, 1)
+
+    def test_extraction_is_recorded_as_metrics(self):
+        with mock.patch.object(pdf_text_extractor.PDF_PAGES_PARSED, 'inc') as pages_parsed, \
+                mock.patch.object(pdf_text_extractor.PDF_BYTES_EXTRACTED, 'inc') as bytes_extracted:
+            self.extract(self.downloaded(), max_chars=100)
+
+        pages_parsed.assert_called_once_with(1, mode='sequential')
+        bytes_extracted.assert_called_once_with(len(self.pdf_bytes), mode='sequential')
@@ -0,0 +1,158 @@
+import threading
+import time
+from unittest import mock
+
+import requests
+from django.test import SimpleTestCase, override_settings
+
+from scout_agent.models import APIUsage, CompanyData, CompanyProfile, PDFAnalysis
+from scout_agent.services.pdf_batch_service import PDFBatchAnalyzer
+from scout_agent.services.rate_limiter import (
+    PRIORITY_BATCH,
+    PRIORITY_INTERACTIVE,
+    RateLimiter,
+    RateLimitRetriesExhausted,
+    _retry_after_seconds,
+    call_with_rate_limit,
+)
+
+from .base import FakeAPITestCase
+
+
+def http_error(status_code, headers=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    return requests.HTTPError(f"{status_code} error", response=response)
+
+
+class RateLimiterTests(SimpleTestCase):
+
+    def drained(self, requests_per_minute=600):
+        """1분 용량을 모두 쓴 limiter (다음 요청은 60 / requests_per_minute 초 뒤 통과)"""
+        limiter = RateLimiter('test', requests_per_minute)
+        for _ in range(requests_per_minute):
+            limiter.acquire(priority=PRIORITY_INTERACTIVE)
+        return limiter
+
+    def test_waits_for_refill_when_bucket_is_empty(self):
+        limiter = self.drained()
+
+        waited = limiter.acquire(priority=PRIORITY_INTERACTIVE)
+
+        self.assertGreaterEqual(waited, 0.05)
+        self.assertLess(waited, 1)
+
+    def test_interactive_calls_pass_before_waiting_batch_calls(self):
+        limiter = self.drained()
+        order = []
+
+        def acquire(priority):
+            limiter.acquire(priority=priority)
+            order.append(priority)
+
+        def wait_for_waiters(count):
+            while limiter.metrics()['waiting'] < count:
+                time.sleep(0.001)
+
+        batch = threading.Thread(target=acquire, args=(PRIORITY_BATCH,))
+        batch.start()
+        wait_for_waiters(1)
+        interactive = threading.Thread(target=acquire, args=(PRIORITY_INTERACTIVE,))
+        interactive.start()
+        for thread in (batch, interactive):
+            thread.join(timeout=5)
+
+        self.assertEqual(order, [PRIORITY_INTERACTIVE, PRIORITY_BATCH])
+
+    def test_token_budget_is_reconciled_with_actual_usage(self):
+        limiter = RateLimiter('test', 600, tokens_per_minute=1000)
+        limiter.acquire(tokens=900, priority=PRIORITY_INTERACTIVE)
+        limiter.reconcile(estimated_tokens=900, actual_tokens=100)
+
+        # 실제 사용량이 100 이었으므로 남은 900 토큰으로 바로 통과
+        self.assertLess(limiter.acquire(tokens=800, priority=PRIORITY_INTERACTIVE), 0.05)
+
+    def test_retry_after_headers(self):
+        self.assertEqual(_retry_after_seconds({'retry-after-ms': '1500'}), 1.5)
+        self.assertEqual(_retry_after_seconds({'retry-after': '2'}), 2.0)
+        self.assertIsNone(_retry_after_seconds({}))
+
+
+@override_settings(RATE_LIMIT_MAX_RETRIES=2, RATE_LIMIT_BACKOFF_BASE=0.01, RATE_LIMIT_BACKOFF_MAX=0.05)
+class CallWithRateLimitTests(SimpleTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.limiter = RateLimiter('test', 6000)
+        stdout = mock.patch('builtins.print')
+        stdout.start()
+        self.addCleanup(stdout.stop)
+
+    def test_retries_transient_errors_with_backoff(self):
+        call = mock.Mock(side_effect=[http_error(503), http_error(429, {'Retry-After': '0'}), "ok"])
+
+        self.assertEqual(call_with_rate_limit(self.limiter, call), "ok")
+        self.assertEqual(call.call_count, 3)
+        metrics = self.limiter.metrics()
+        self.assertEqual(metrics['retries'], 2)
+        # 429 는 limiter 전체를 멈춤
+        self.assertEqual(metrics['throttled'], 1)
+
+    def test_raises_after_max_retries(self):
+        call = mock.Mock(side_effect=http_error(503))
+
+        with self.assertRaises(RateLimitRetriesExhausted):
+            call_with_rate_limit(self.limiter, call)
+        self.assertEqual(call.call_count, 3)
+        self.assertEqual(self.limiter.metrics()['failures'], 1)
+
+    def test_non_retryable_errors_are_raised_immediately(self):
+        call = mock.Mock(side_effect=http_error(400))
+
+        with self.assertRaises(requests.HTTPError):
+            call_with_rate_limit(self.limiter, call)
+        self.assertEqual(call.call_count, 1)
+
+
+@override_settings(
+    LEAD_DETAILS_MAX_WORKERS=1,
+    RATE_LIMIT_MAX_RETRIES=2,
+    RATE_LIMIT_BACKOFF_BASE=0.01,
+)
+class RateLimitedUpstreamTests(FakeAPITestCase):
+    fake_api_options = {"error_rate": 1.0, "error_status": 429, "retry_after": 0}
+
+    def test_lead_details_returns_503_when_retries_are_exhausted(self):
+        response = self.client.post('/api/lead/details/', {"search_company_name": "테스트 리드"}, format='json')
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(self.upstream_calls("/search"), 3)
+        # 재시도를 포함한 호출 1건이 실패로 기록됨
+        self.assertEqual(APIUsage.objects.filter(provider=APIUsage.PROVIDER_TAVILY, success=False).count(), 1)
+
+    def test_pdf_analysis_returns_503_when_retries_are_exhausted(self):
+        source = CompanyData.objects.create(company="소스 회사")
+        profile = CompanyProfile.objects.create(
+            company=source, file_name="brochure.pdf", url=f"{self.fake_api.url}/files/brochure.pdf"
+        )
+
+        response = self.client.post('/api/scout/analyze-pdf/', {"profile_id": profile.id}, format='json')
+        self.assertEqual(response.status_code, 503)
+        self.assertTrue(response.json()["rate_limited"])
+        self.assertFalse(PDFAnalysis.objects.exists())
+
+        response = self.client.post('/api/scout/find-leads/', {"company_id": source.id}, format='json')
+        self.assertEqual(response.status_code, 503)
+        # PDF 분석 단계에서 멈추고 리드 생성(Responses)은 호출하지 않음
+        self.assertEqual(self.upstream_calls("/v1/responses"), 0)
+
+    def test_batch_marks_rate_limited_items(self):
+        with mock.patch(
+            'scout_agent.services.pdf_batch_service.PDFAnalysisService.analyze_company_pdf',
+            side_effect=RateLimitRetriesExhausted("openai:gpt-4o 호출 실패"),
+        ):
+            item = PDFBatchAnalyzer().analyze([mock.Mock(id=1)])["items"][0]
+
+        self.assertEqual(item["status"], "rate_limited")
+        self.assertEqual(item["error"], "openai:gpt-4o 호출 실패")
@@ -0,0 +1,123 @@
+from datetime import timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+
+from scout_agent.models import CompanyData, CompanyProfile, LeadProspect, PDFAnalysis
+
+from .base import FakeAPITestCase
+
+
+class LeadProspectListViewTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.source = CompanyData.objects.create(company="소스 회사")
+        created_at = timezone.now()
+        # 같은 점수/발견 시각이 섞여 있어도 (점수, 발견 시각, id) 순으로 빠짐없이 이어져야 함
+        for i, score in enumerate([0.9, 0.5, 0.5, 0.5, 0.7, 0.1, 0.5]):
+            lead = LeadProspect.objects.create(
+                source_company=cls.source,
+                prospect_company=CompanyData.objects.create(company=f"리드 {i}"),
+                relevance_score=score,
+            )
+            LeadProspect.objects.filter(id=lead.id).update(created_at=created_at - timedelta(minutes=i % 2))
+        cls.expected_ids = list(
+            LeadProspect.objects.order_by('-relevance_score', '-created_at', '-id').values_list('id', flat=True)
+        )
+
+    def url(self, company_id=None):
+        return f'/api/scout/companies/{company_id or self.source.id}/leads/'
+
+    def test_cursor_walks_every_lead_once_in_ranking_order(self):
+        ids = []
+        params = {"limit": 3}
+        pages = 0
+        while True:
+            response = self.client.get(self.url(), params)
+            self.assertEqual(response.status_code, 200)
+            body = response.json()
+            ids.extend(lead["id"] for lead in body["leads"])
+            pages += 1
+            if body["next_cursor"] is None:
+                break
+            params["cursor"] = body["next_cursor"]
+
+        self.assertEqual(ids, self.expected_ids)
+        self.assertEqual(pages, 3)
+
+    def test_fields_selects_response_keys(self):
+        response = self.client.get(self.url(), {"fields": "company,relevance_score", "limit": 1})
+
+        self.assertEqual(response.json()["leads"], [{"company": "리드 0", "relevance_score": 0.9}])
+
+    def test_invalid_requests(self):
+        self.assertEqual(self.client.get(self.url(), {"cursor": "not-a-cursor"}).status_code, 400)
+        self.assertEqual(self.client.get(self.url(), {"fields": "password"}).status_code, 400)
+        self.assertEqual(self.client.get(self.url(), {"limit": "many"}).status_code, 400)
+        self.assertEqual(self.client.get(self.url(company_id=999999)).status_code, 404)
+
+
+class LeadScoutViewTests(FakeAPITestCase):
+    url = '/api/scout/find-leads/'
+
+    def setUp(self):
+        super().setUp()
+        self.source = CompanyData.objects.create(company="소스 회사", industry="IT 서비스")
+        CompanyProfile.objects.create(
+            company=self.source, file_name="brochure.pdf", url=f"{self.fake_api.url}/files/brochure.pdf"
+        )
+
+    def find_leads(self, **data):
+        response = self.client.post(self.url, {"company_id": self.source.id, **data}, format='json')
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_first_call_analyzes_pdf_and_saves_leads(self):
+        result = self.find_leads()
+
+        self.assertEqual(len(result["leads"]), 5)
+        self.assertFalse(result["cache"]["hit"])
+        self.assertEqual(LeadProspect.objects.filter(source_company=self.source).count(), 5)
+        self.assertTrue(PDFAnalysis.objects.filter(company=self.source).exists())
+        self.assertEqual(self.upstream_calls("/v1/chat/completions"), 1)
+        self.assertEqual(self.upstream_calls("/v1/responses"), 1)
+
+    def test_unchanged_input_reuses_saved_result(self):
+        self.find_leads()
+        result = self.find_leads()
+
+        self.assertTrue(result["cache"]["hit"])
+        self.assertEqual(len(result["leads"]), 5)
+        self.assertEqual(self.upstream_calls("/v1/responses"), 1)
+
+    def test_changed_company_or_refresh_searches_again(self):
+        self.find_leads()
+        self.source.industry = "제조업"
+        self.source.save()
+
+        self.assertFalse(self.find_leads()["cache"]["hit"])
+        self.assertFalse(self.find_leads(refresh=True)["cache"]["hit"])
+        self.assertEqual(self.upstream_calls("/v1/responses"), 3)
+        # 같은 리드는 다시 저장해도 중복 행이 생기지 않음
+        self.assertEqual(LeadProspect.objects.filter(source_company=self.source).count(), 5)
+
+
+class PDFBatchAnalysisViewTests(FakeAPITestCase):
+    url = '/api/scout/analyze-pdf/batch/'
+
+    def post(self, data):
+        return self.client.post(self.url, data, content_type='application/json')
+
+    def test_invalid_profile_ids_are_rejected(self):
+        for profile_ids in ["abc", [1, "x"], 5, [], [True], [1.5], {"id": 1}, None]:
+            with self.subTest(profile_ids=profile_ids):
+                response = self.post({"profile_ids": profile_ids})
+                self.assertEqual(response.status_code, 400)
+                self.assertIn("error", response.json())
+
+    def test_integer_profile_ids_are_accepted(self):
+        response = self.post({"profile_ids": [999998, "999999"]})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["total"], 0)
@@ -1,8 +1,19 @@
 from django.urls import path
-from .views import LeadScoutView, PDFAnalysisView
+from .views import (
+    LeadProspectListView,
+    LeadScoutJobView,
+    LeadScoutView,
+    PDFAnalysisView,
+    PDFBatchAnalysisView,
+    RateLimitMetricsView,
+)
 
 urlpatterns = [
     path('find-leads/', LeadScoutView.as_view(), name='find_potential_leads'),
+    path('find-leads/jobs/<uuid:job_id>/', LeadScoutJobView.as_view(), name='find_potential_leads_job'),
+    path('companies/<int:company_id>/leads/', LeadProspectListView.as_view(), name='lead_prospect_list'),
     path('analyze-pdf/', PDFAnalysisView.as_view(), name='analyze_pdf'),
+    path('analyze-pdf/batch/', PDFBatchAnalysisView.as_view(), name='analyze_pdf_batch'),
     path('analyze-pdf/<int:profile_id>/', PDFAnalysisView.as_view(), name='pdf_analysis_detail'),
+    path('rate-limits/', RateLimitMetricsView.as_view(), name='rate_limit_metrics'),
 ]
\ No newline at end of file
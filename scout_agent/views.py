@@ -1,16 +1,40 @@
+import base64
+import hmac
+import ipaddress
+import json
 import logging
+from datetime import datetime
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.views import APIView
-from .models import CompanyProfile, PDFAnalysis
+from .models import CompanyData, CompanyProfile, LeadScoutJob, PDFAnalysis
+from .repository.company_data_repository import get_company_data_by_id
+from .repository.lead_prospect_repository import get_ranked_lead_prospects
+from .repository.company_profile_repository import (
+    get_company_profiles_by_ids,
+    get_company_profiles_without_analysis,
+)
 from .services.agent_service import LeadScoutAgent
+from .services.job_service import enqueue_find_leads_job, fail_stale_jobs
+from .services.pdf_batch_service import PDFBatchAnalyzer
 from .services.pdf_service import PDFAnalysisService
+from .services.metrics import REGISTRY
+from .services.rate_limiter import RateLimitRetriesExhausted, get_rate_limiter_metrics
+from .services.usage_service import BudgetExceeded
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseForbidden
 from django.shortcuts import get_object_or_404
+from django.urls import reverse
 
 # 로깅 설정
 logger = logging.getLogger('scout_agent')
 
 
+def _is_true(value):
+    """요청 값(bool, "true", "1" 등)을 bool 로 변환합니다."""
+    return str(value).lower() in ('true', '1', 'yes')
+
+
 class LeadScoutView(APIView):
     def post(self, request):
         logger.info("find_potential_leads 호출됨")
@@ -25,22 +49,186 @@ class LeadScoutView(APIView):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
+        refresh = _is_true(request.data.get('refresh'))
+        if _is_true(request.data.get('async')):
+            return self._enqueue(request, company_id, refresh)
+
         logger.info(f"리드 스카우트 에이전트 초기화: company_id={company_id}")
         agent = LeadScoutAgent()
 
         logger.info(f"리드 검색 시작: company_id={company_id}")
-        result = agent.find_potential_leads(company_id)
+        result = agent.find_potential_leads(company_id, refresh=refresh)
 
         if result["status"] == "error":
             logger.error(f"에이전트 오류 발생: {result['message']}")
             return Response(
                 {"error": result["message"]},
-                status=status.HTTP_400_BAD_REQUEST
+                status=self._error_status(result)
             )
 
         logger.info(f"리드 검색 성공: {len(result.get('leads', []))}개 리드 발견")
         return Response(result, status=status.HTTP_200_OK)
 
+    def _error_status(self, result):
+        # 비용 한도 초과는 한도가 풀릴 때까지 거절, 호출 한도 초과는 잠시 후 다시 시도하면 되는 일시적 오류
+        if result.get("budget_exceeded"):
+            return status.HTTP_429_TOO_MANY_REQUESTS
+        if result.get("rate_limited"):
+            return status.HTTP_503_SERVICE_UNAVAILABLE
+        return status.HTTP_400_BAD_REQUEST
+
+    def _enqueue(self, request, company_id, refresh=False):
+        """
+        리드 검색을 백그라운드 작업으로 등록하고 작업 ID를 즉시 반환합니다.
+        """
+        try:
+            company = get_company_data_by_id(company_id)
+        except CompanyData.DoesNotExist:
+            logger.error(f"회사 ID {company_id}를 찾을 수 없습니다")
+            return Response(
+                {"error": "Source company not found"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        job = enqueue_find_leads_job(company, refresh=refresh)
+        logger.info(f"리드 검색 작업 등록: job_id={job.id}, company_id={company_id}")
+        return Response({
+            "status": job.status,
+            "job_id": str(job.id),
+            "status_url": request.build_absolute_uri(
+                reverse('find_potential_leads_job', kwargs={'job_id': job.id})
+            ),
+        }, status=status.HTTP_202_ACCEPTED)
+
+
+class LeadScoutJobView(APIView):
+    def get(self, request, job_id):
+        """
+        리드 검색 작업의 상태, 진행 단계, 완료 시 결과(leads)를 조회합니다.
+        LEAD_SCOUT_JOB_TIMEOUT 이 지나도록 끝나지 않은 작업은 error 로 바꿔 반환합니다.
+        """
+        fail_stale_jobs(job_id)
+        job = get_object_or_404(LeadScoutJob, id=job_id)
+        result = job.result or {}
+
+        return Response({
+            "job_id": str(job.id),
+            "company_id": job.company_id,
+            "status": job.status,
+            "stage": job.stage,
+            "error": job.error,
+            "message": result.get("message"),
+            "source_used": result.get("source_used"),
+            "leads": result.get("leads"),
+            "cache": result.get("cache"),
+            "usage": result.get("usage"),
+            "created_at": job.created_at,
+            "started_at": job.started_at,
+            "finished_at": job.finished_at,
+        })
+
+
+# 리드 목록 응답 필드 -> LeadProspect 기준 ORM 경로
+LEAD_LIST_FIELDS = {
+    'id': 'id',
+    'prospect_company_id': 'prospect_company_id',
+    'company': 'prospect_company__company',
+    'industry': 'prospect_company__industry',
+    'sales': 'prospect_company__sales',
+    'total_funding': 'prospect_company__total_funding',
+    'homepage': 'prospect_company__homepage',
+    'key_executive': 'prospect_company__key_executive',
+    'address': 'prospect_company__address',
+    'email': 'prospect_company__email',
+    'phone_number': 'prospect_company__phone_number',
+    'relevance_score': 'relevance_score',
+    'reasoning': 'reasoning',
+    'created_at': 'created_at',
+}
+DEFAULT_LEAD_LIST_FIELDS = [
+    'id', 'company', 'industry', 'homepage', 'key_executive', 'relevance_score', 'created_at',
+]
+LEAD_LIST_DEFAULT_LIMIT = 50
+LEAD_LIST_MAX_LIMIT = 200
+
+
+def _encode_lead_cursor(lead):
+    raw = json.dumps([lead.relevance_score, lead.created_at.isoformat(), lead.id])
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_lead_cursor(cursor):
+    """커서 문자열을 (relevance_score, created_at, id)로 변환합니다. 형식이 잘못되면 ValueError."""
+    try:
+        score, created_at, last_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return float(score), datetime.fromisoformat(created_at), int(last_id)
+    except (TypeError, ValueError, UnicodeError) as e:
+        raise ValueError(f"invalid cursor: {e}")
+
+
+class LeadProspectListView(APIView):
+    def get(self, request, company_id):
+        """
+        소스 회사의 저장된 리드를 관련도 순으로 조회합니다 (LLM 호출 없음).
+
+        쿼리 파라미터:
+            limit: 페이지 크기 (기본 50, 최대 200)
+            cursor: 이전 응답의 next_cursor (keyset 페이지네이션)
+            fields: 응답에 포함할 필드 목록 (쉼표 구분)
+        """
+        if not CompanyData.objects.filter(id=company_id).exists():
+            return Response(
+                {"error": "Source company not found"},
+                status=status.HTTP_404_NOT_FOUND
+            )
+
+        try:
+            limit = int(request.query_params.get('limit', LEAD_LIST_DEFAULT_LIMIT))
+        except ValueError:
+            return Response({"error": "limit must be an integer"}, status=status.HTTP_400_BAD_REQUEST)
+        limit = max(1, min(limit, LEAD_LIST_MAX_LIMIT))
+
+        fields = [f.strip() for f in request.query_params.get('fields', '').split(',') if f.strip()]
+        fields = fields or DEFAULT_LEAD_LIST_FIELDS
+        unknown = [f for f in fields if f not in LEAD_LIST_FIELDS]
+        if unknown:
+            return Response(
+                {"error": f"Unknown fields: {', '.join(unknown)}", "allowed_fields": list(LEAD_LIST_FIELDS)},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        after = None
+        cursor = request.query_params.get('cursor')
+        if cursor:
+            try:
+                after = _decode_lead_cursor(cursor)
+            except ValueError:
+                return Response({"error": "Invalid cursor"}, status=status.HTTP_400_BAD_REQUEST)
+
+        # 커서 계산에 필요한 정렬 컬럼은 항상 읽음
+        only_fields = {'relevance_score', 'created_at', 'prospect_company__id'}
+        only_fields.update(LEAD_LIST_FIELDS[f] for f in fields)
+        leads = list(get_ranked_lead_prospects(company_id, after=after, only_fields=only_fields)[:limit + 1])
+
+        has_more = len(leads) > limit
+        leads = leads[:limit]
+
+        return Response({
+            "status": "success",
+            "company_id": company_id,
+            "count": len(leads),
+            "next_cursor": _encode_lead_cursor(leads[-1]) if has_more else None,
+            "leads": [
+                {field: self._field_value(lead, LEAD_LIST_FIELDS[field]) for field in fields}
+                for lead in leads
+            ],
+        })
+
+    def _field_value(self, lead, path):
+        if path.startswith('prospect_company__'):
+            return getattr(lead.prospect_company, path[len('prospect_company__'):])
+        return getattr(lead, path)
+
 
 class PDFAnalysisView(APIView):
     def post(self, request, profile_id=None):
@@ -60,9 +248,10 @@ class PDFAnalysisView(APIView):
             # 프로필 확인
             profile = get_object_or_404(CompanyProfile, id=profile_id)
 
-            # PDF 분석 서비스 실행
+            # PDF 분석 서비스 실행 (force=true 이면 동일 문서 분석본 재사용 없이 재분석)
+            force = _is_true(request.data.get('force', request.query_params.get('force')))
             pdf_service = PDFAnalysisService()
-            analysis = pdf_service.analyze_company_pdf(profile)
+            analysis = pdf_service.analyze_company_pdf(profile, force=force)
 
             if not analysis:
                 return Response(
@@ -76,6 +265,16 @@ class PDFAnalysisView(APIView):
                 "analysis": analysis
             })
 
+        except RateLimitRetriesExhausted as e:
+            return Response(
+                {"error": str(e), "rate_limited": True},
+                status=status.HTTP_503_SERVICE_UNAVAILABLE
+            )
+        except BudgetExceeded as e:
+            return Response(
+                {"error": str(e), "budget_exceeded": True},
+                status=status.HTTP_429_TOO_MANY_REQUESTS
+            )
         except Exception as e:
             return Response(
                 {"error": str(e)},
@@ -117,4 +316,106 @@ class PDFAnalysisView(APIView):
                 {"error": str(e)},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
-        
\ No newline at end of file
+
+
+def _parse_profile_ids(value):
+    """
+    profile_ids 요청 값을 정수 목록으로 변환합니다.
+    비어 있지 않은 목록이 아니거나 정수로 볼 수 없는 항목이 있으면 ValueError 를 발생시킵니다.
+    """
+    if not isinstance(value, list) or not value:
+        raise ValueError("profile_ids must be a non-empty list of integers")
+    profile_ids = []
+    for item in value:
+        # bool 은 int 의 하위 클래스이므로 따로 거름
+        if isinstance(item, bool) or not isinstance(item, (int, str)) or not str(item).strip().isdigit():
+            raise ValueError(f"profile_ids must be a non-empty list of integers (invalid: {item!r})")
+        profile_ids.append(int(item))
+    return profile_ids
+
+
+class PDFBatchAnalysisView(APIView):
+    def post(self, request):
+        """
+        여러 프로필의 PDF 를 동시에 분석하는 API 엔드포인트
+
+        profile_ids 목록 또는 all_pending=true(분석본이 없는 모든 프로필)를 받습니다.
+        한 요청에서 처리하는 프로필 수는 PDF_BATCH_MAX_ITEMS 로 제한되며,
+        더 많은 프로필은 manage.py analyze_pdfs 명령을 사용합니다.
+        """
+        profile_ids = request.data.get('profile_ids')
+        all_pending = _is_true(request.data.get('all_pending'))
+
+        if all_pending:
+            profiles = get_company_profiles_without_analysis()
+        elif profile_ids is not None:
+            try:
+                profiles = get_company_profiles_by_ids(_parse_profile_ids(profile_ids))
+            except ValueError as e:
+                return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        else:
+            return Response(
+                {"error": "profile_ids or all_pending is required"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        profiles = list(profiles[:settings.PDF_BATCH_MAX_ITEMS + 1])
+        if len(profiles) > settings.PDF_BATCH_MAX_ITEMS:
+            return Response(
+                {"error": f"Too many profiles (max {settings.PDF_BATCH_MAX_ITEMS}), use manage.py analyze_pdfs"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        logger.info(f"PDF 일괄 분석 시작: {len(profiles)}개 프로필")
+        summary = PDFBatchAnalyzer().analyze(profiles, force=_is_true(request.data.get('force')))
+        logger.info(
+            f"PDF 일괄 분석 완료: 성공 {summary['succeeded']}/{summary['total']}, "
+            f"{summary['elapsed_seconds']}초"
+        )
+
+        return Response({"status": "success", **summary})
+
+
+class RateLimitMetricsView(APIView):
+    """
+    이 프로세스의 OpenAI/Tavily 호출 한도별 대기 시간, 재시도, 429 횟수를 반환합니다.
+    /metrics 와 같이 METRICS_ALLOWED_IPS 의 IP 또는 METRICS_TOKEN Bearer 토큰으로만 조회할 수 있습니다.
+    """
+
+    def get(self, request):
+        if not _metrics_access_allowed(request):
+            return Response({"error": "Forbidden"}, status=status.HTTP_403_FORBIDDEN)
+        return Response({"limiters": get_rate_limiter_metrics()}, status=status.HTTP_200_OK)
+
+
+def _metrics_access_allowed(request):
+    """요청 IP 가 METRICS_ALLOWED_IPS 에 있거나 METRICS_TOKEN 과 같은 Bearer 토큰을 보냈는지 확인합니다."""
+    token = settings.METRICS_TOKEN
+    if token:
+        authorization = request.META.get('HTTP_AUTHORIZATION', '')
+        if authorization.startswith('Bearer ') and hmac.compare_digest(authorization[7:], token):
+            return True
+
+    # 프록시가 붙이는 X-Forwarded-For 는 조작할 수 있으므로 REMOTE_ADDR 만 사용
+    try:
+        address = ipaddress.ip_address(request.META.get('REMOTE_ADDR', ''))
+    except ValueError:
+        return False
+    for allowed in settings.METRICS_ALLOWED_IPS:
+        try:
+            if address in ipaddress.ip_network(allowed, strict=False):
+                return True
+        except ValueError:
+            logger.warning(f"METRICS_ALLOWED_IPS 의 잘못된 값 무시: {allowed}")
+    return False
+
+
+def metrics_view(request):
+    """
+    Prometheus 형식(text exposition 0.0.4)의 지표를 반환합니다.
+    지표는 프로세스 단위이므로 워커가 여러 개면 워커마다 따로 수집해야 합니다.
+    METRICS_ALLOWED_IPS 의 IP 또는 METRICS_TOKEN Bearer 토큰으로만 조회할 수 있습니다.
+    """
+    if not _metrics_access_allowed(request):
+        return HttpResponseForbidden()
+    return HttpResponse(REGISTRY.render(), content_type='text/plain; version=0.0.4; charset=utf-8')
@@ -7,11 +7,12 @@ setup(
     description='LeadScout AI SDK for Sales Scouting',
     author='Your Name',
     author_email='your@email.com',
-    packages=find_packages(where="leadscout_sdk"),
+    packages=find_packages(where="leadscout_sdk", exclude=["tests", "tests.*"]),
     package_dir={"": "leadscout_sdk"},
     install_requires=[
         'pymysql',
         'boto3',
+        'PyMuPDF',
         'pdfminer.six',
         'openai',
         'python-dotenv',